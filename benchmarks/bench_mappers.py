@@ -0,0 +1,94 @@
+"""Benchmark mapping search results through jira resources versus raw JSON.
+
+Run from the repository root with ``python -m benchmarks.bench_mappers``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Any
+
+from jira import JIRA
+from jira.resources import Issue as JiraIssue
+
+from src.adapters.secondary.jira.mappers import map_issue, map_issue_json
+
+SERVER = "https://example.atlassian.net"
+TAXONOMY_FIELD = "customfield_11173"
+OPTIONS = {**JIRA.DEFAULT_OPTIONS, "server": SERVER}
+STATUSES = ("To Do", "In Progress", "In Review", "Done")
+
+
+def make_raw_issue(number: int, histories: int) -> dict[str, Any]:
+    """Build a search result issue with a changelog of the given length."""
+    return {
+        "id": str(number),
+        "key": f"ATP-{number}",
+        "self": f"{SERVER}/rest/api/2/issue/{number}",
+        "fields": {
+            "summary": f"Summary {number}",
+            "description": "Description " * 20,
+            "project": {
+                "self": f"{SERVER}/rest/api/2/project/1",
+                "key": "ATP",
+                "name": "Address-Tracking",
+                "projectCategory": {
+                    "self": f"{SERVER}/rest/api/2/projectCategory/10002",
+                    "id": "10002",
+                },
+            },
+            "issuetype": {"self": f"{SERVER}/rest/api/2/issuetype/1", "name": "Task"},
+            "status": {"self": f"{SERVER}/rest/api/2/status/1", "name": "Done"},
+            "resolutiondate": "2025-01-08T09:06:29.078-0800",
+            "updated": "2025-01-08T09:06:29.078-0800",
+            TAXONOMY_FIELD: {"self": f"{SERVER}/rest/api/2/customFieldOption/1", "value": "Tech"},
+        },
+        "changelog": {
+            "startAt": 0,
+            "maxResults": histories,
+            "total": histories,
+            "histories": [
+                {
+                    "id": str(index),
+                    "created": f"2025-01-0{1 + index % 7}T08:00:00.000-0800",
+                    "author": {"self": f"{SERVER}/rest/api/2/user?accountId=1", "accountId": "1"},
+                    "items": [
+                        {"field": "status", "toString": STATUSES[index % len(STATUSES)]},
+                        {"field": "assignee", "toString": "Someone"},
+                    ],
+                }
+                for index in range(histories)
+            ],
+        },
+    }
+
+
+def main() -> None:
+    """Time both mappers over 1,000 synthetic issues and print the speedup."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--histories", type=int, default=50, help="Changelog entries per issue")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    raw_issues = [make_raw_issue(number, args.histories) for number in range(1_000)]
+
+    def via_resources() -> None:
+        for raw in raw_issues:
+            map_issue(JiraIssue(OPTIONS, None, raw=raw), TAXONOMY_FIELD)
+
+    def via_json() -> None:
+        for raw in raw_issues:
+            map_issue_json(raw, TAXONOMY_FIELD)
+
+    resource_seconds = min(timeit.repeat(via_resources, number=1, repeat=args.repeat))
+    json_seconds = min(timeit.repeat(via_json, number=1, repeat=args.repeat))
+
+    print(f"1,000 issues x {args.histories} changelog entries")
+    print(f"jira resources + map_issue: {resource_seconds * 1000:8.1f} ms")
+    print(f"raw JSON + map_issue_json:  {json_seconds * 1000:8.1f} ms")
+    print(f"speedup:                    {resource_seconds / json_seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
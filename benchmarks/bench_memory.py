@@ -0,0 +1,130 @@
+"""Benchmark the memory taken by mapped issues with plain versus compact domain models.
+
+The plain layout is the one the domain models had before they were slotted: a
+``__dict__`` per instance, a ``Project`` per issue and a fresh copy of every status,
+type and category string. Each issue is decoded from its own JSON text, as it would be
+from a search response, so no string is shared by accident.
+
+Run from the repository root with ``python -m benchmarks.bench_memory``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from benchmarks.bench_mappers import TAXONOMY_FIELD, make_raw_issue
+from src.adapters.secondary.jira.mappers import (
+    _field_to_str,
+    _parse_timestamp_json,
+    calculate_lead_time,
+    map_issue_json,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+
+@dataclass
+class PlainProject:
+    """``Project`` as a plain dataclass."""
+
+    key: str
+    name: str
+    category_id: str | None = None
+
+
+@dataclass
+class PlainStatusTransition:
+    """``StatusTransition`` as a plain dataclass."""
+
+    status: str
+    timestamp: datetime
+
+
+@dataclass
+class PlainIssue:
+    """``Issue`` as a plain dataclass."""
+
+    description: str
+    summary: str
+    key: str
+    project: PlainProject
+    issue_type: str
+    resolution_date: datetime | None
+    status: str
+    engineering_category: str
+    url: str
+    status_history: list[PlainStatusTransition]
+    lead_time_hours: float | None = None
+    updated: datetime | None = None
+    parent_key: str | None = None
+    linked_issue_keys: tuple[str, ...] = ()
+
+
+def map_plain_issue(raw_issue: dict[str, Any]) -> PlainIssue:
+    """Map a raw issue the way ``map_issue_json`` did before models were compacted."""
+    fields = raw_issue["fields"]
+    project = fields["project"]
+    status_history = [
+        PlainStatusTransition(item["toString"], _parse_timestamp_json(history["created"]))
+        for history in raw_issue["changelog"]["histories"]
+        for item in history["items"]
+        if item["field"] == "status"
+    ]
+    return PlainIssue(
+        description=fields.get("description"),
+        summary=fields.get("summary"),
+        key=raw_issue["key"],
+        project=PlainProject(
+            project["key"], project["name"], project.get("projectCategory", {}).get("id")
+        ),
+        issue_type=fields["issuetype"]["name"],
+        resolution_date=_parse_timestamp_json(fields.get("resolutiondate")),
+        status=fields["status"]["name"],
+        engineering_category=_field_to_str(fields.get(TAXONOMY_FIELD, "Uncategorized")),
+        url=raw_issue["self"],
+        status_history=status_history,
+        lead_time_hours=calculate_lead_time(status_history),
+        updated=_parse_timestamp_json(fields.get("updated")),
+    )
+
+
+def retained_bytes(documents: list[str], mapper: Callable[[dict[str, Any]], Any]) -> int:
+    """Map every document and return the memory still held by the mapped issues."""
+    gc.collect()
+    tracemalloc.start()
+    issues = [mapper(json.loads(document)) for document in documents]
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del issues
+    return retained
+
+
+def main() -> None:
+    """Map synthetic issues with both layouts and print the per-issue footprint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--issues", type=int, default=10_000, help="Issues to map")
+    parser.add_argument("--histories", type=int, default=20, help="Changelog entries per issue")
+    args = parser.parse_args()
+
+    documents = [
+        json.dumps(make_raw_issue(number, args.histories)) for number in range(args.issues)
+    ]
+    plain = retained_bytes(documents, map_plain_issue)
+    compact = retained_bytes(documents, lambda raw: map_issue_json(raw, TAXONOMY_FIELD))
+
+    print(f"{args.issues:,} issues x {args.histories} changelog entries")
+    print(f"plain dataclasses: {plain / args.issues:8.0f} bytes per issue")
+    print(f"compact models:    {compact / args.issues:8.0f} bytes per issue")
+    print(f"saving:            {1 - compact / plain:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
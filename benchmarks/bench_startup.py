@@ -0,0 +1,63 @@
+"""Benchmark the wall time of CLI invocations that should not touch JIRA.
+
+Each command runs in a fresh interpreter, as it would from the shell, and the heavy
+modules it ended up importing are listed next to its timing.
+
+Run from the repository root with ``python -m benchmarks.bench_startup``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("jira", "polars", "plotly", "httpx", "pydantic_settings")
+COMMANDS = (
+    ("--help",),
+    ("jira", "--help"),
+    ("projects", "--help"),
+    ("projects", "analyze", "--help"),
+)
+
+# Runs the CLI in-process, then reports which heavy modules were imported
+_PROBE = """
+import sys
+from src.adapters.primary.cli.entry import app
+try:
+    app(sys.argv[1:], prog_name="metrics")
+except SystemExit:
+    pass
+print(",".join(m for m in {modules!r} if m in sys.modules), file=sys.stderr)
+"""
+
+
+def run_once(args: tuple[str, ...]) -> tuple[float, str]:
+    """Run the CLI once and return its wall time and the heavy modules it imported."""
+    started = time.perf_counter()
+    result = subprocess.run(  # noqa: S603 - this interpreter running a fixed probe
+        [sys.executable, "-c", _PROBE.format(modules=HEAVY_MODULES), *args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - started
+    return elapsed, result.stderr.strip().splitlines()[-1] if result.stderr.strip() else ""
+
+
+def main() -> None:
+    """Time each command and print the best wall time out of the repetitions."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    for command in COMMANDS:
+        timings = [run_once(command) for _ in range(args.repeat)]
+        best = min(elapsed for elapsed, _ in timings)
+        modules = timings[-1][1] or "none"
+        print(f"{' '.join(command):28} {best * 1000:8.1f} ms   heavy imports: {modules}")
+
+
+if __name__ == "__main__":
+    main()
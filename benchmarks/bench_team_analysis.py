@@ -0,0 +1,102 @@
+"""Benchmark the chart aggregations of an analysis run, eager versus one lazy plan.
+
+The eager side aggregates the way the charts used to: each chart regroups the frame,
+joins grouped frames back together for its totals and sorts, one query at a time. The
+lazy side collects every chart input of an ``AnalyticsSession`` in one ``collect_all``.
+
+Run from the repository root with ``python -m benchmarks.bench_team_analysis``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from datetime import date, timedelta
+
+import polars as pl
+
+from src.domain.analytics_session import AnalyticsSession
+from src.domain.flow_metrics import FlowMetric
+
+PROJECTS = 40
+CATEGORIES = ("Product Dev", "Tech Inv", "Maintenance", "Unplanned", "Support")
+WEEKS = 52
+
+
+def make_frame(rows: int) -> pl.DataFrame:
+    """Build a synthetic analytics frame with the given number of issues."""
+    index = pl.int_range(0, rows, eager=True)
+    first_week = date(2024, 1, 7)
+    weeks = [(first_week + timedelta(weeks=week)).strftime("%Y-%m-%d") for week in range(WEEKS)]
+    return pl.DataFrame(
+        {
+            "project": (index % PROJECTS).cast(pl.Utf8).str.replace(r"^", "Project "),
+            "issue_key": index.cast(pl.Utf8).str.replace(r"^", "ATP-"),
+            "category": pl.Series(CATEGORIES).gather(index % len(CATEGORIES)),
+            "week": pl.Series(weeks).gather((index // 7) % WEEKS),
+            "lead_time_hours": (index % 500).cast(pl.Float64),
+            FlowMetric.CYCLE_TIME: (index % 300).cast(pl.Float64),
+            FlowMetric.REOPENS: (index % 3).cast(pl.UInt32),
+        }
+    )
+
+
+def eager_chart_inputs(frame: pl.DataFrame) -> list[pl.DataFrame]:
+    """Aggregate every chart input eagerly, with self-joins and repeated sorts."""
+    composition = (
+        frame.group_by(["project", "category", "week"])
+        .agg(pl.len().alias("count"))
+        .join(
+            frame.group_by(["project", "week"]).agg(pl.len().alias("count_total")),
+            on=["project", "week"],
+        )
+        .with_columns((pl.col("count") / pl.col("count_total") * 100).round().alias("percentage"))
+        .sort("project")
+        .sort("week")
+    )
+    lead_time = (
+        frame.group_by(["project", "category", "week"])
+        .agg(pl.col("lead_time_hours").sum().round(1).alias("total_lead_time"))
+        .sort("project")
+        .sort("week")
+    )
+    weekly_trends = (
+        frame.group_by(["week", "category"])
+        .agg(pl.len().alias("count"))
+        .join(frame.group_by("week").agg(pl.len().alias("count_total")), on="week")
+        .with_columns((pl.col("count") / pl.col("count_total") * 100).round().alias("percentage"))
+        .sort("week")
+    )
+    flow = [
+        frame.group_by(["project", "week"]).agg(pl.col(metric).mean().round(1)).sort("week")
+        for metric in FlowMetric
+    ]
+    return [composition, lead_time, weekly_trends, *flow]
+
+
+def main() -> None:
+    """Time both approaches on a synthetic frame and print the speedup."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Issues in the frame")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    frame = make_frame(args.rows)
+
+    def eager() -> None:
+        eager_chart_inputs(frame)
+
+    def lazy() -> None:
+        _ = AnalyticsSession(frame.lazy()).frames
+
+    eager_seconds = min(timeit.repeat(eager, number=1, repeat=args.repeat))
+    lazy_seconds = min(timeit.repeat(lazy, number=1, repeat=args.repeat))
+
+    print(f"{args.rows:,} issues, {PROJECTS} projects, {len(CATEGORIES)} categories, {WEEKS} weeks")
+    print(f"eager aggregations:     {eager_seconds * 1000:8.1f} ms")
+    print(f"lazy plan, collect_all: {lazy_seconds * 1000:8.1f} ms")
+    print(f"speedup:                {eager_seconds / lazy_seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
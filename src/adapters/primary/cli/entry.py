@@ -8,8 +8,25 @@ import typer
 
 from src.adapters.primary.cli.jira_commands.jira_commands import jira_app
 from src.adapters.primary.cli.projects.analytics_commands import team_app
+from src.adapters.secondary.jira import jira_factory
 
 app = typer.Typer()
+
+
+@app.callback()
+def main(
+    *,
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the on-disk cache of issue, project and user lookups.",
+    ),
+) -> None:
+    """Metrics tooling for JIRA projects."""
+    if no_cache:
+        jira_factory.disable_response_cache()
+
+
 app.add_typer(jira_app, name="jira", help="JIRA-related commands")
 app.add_typer(team_app, name="projects", help="Team and Project analysis commands")
 
@@ -2,20 +2,70 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timedelta
+from functools import cache
+from pathlib import Path  # noqa: TC003 - typer reads the annotations at runtime
 
 import pytz
 import typer
 
 from src.domain.models import CreateIssueRequest
 from src.adapters.secondary.jira import jira_factory
+from src.adapters.secondary.jira.key_filters import DEFAULT_MAX_FILTER_JQL_LENGTH
+from src.adapters.secondary.storage import issue_graph_factory
+from src.adapters.secondary.storage.issue_import import (
+    ImportJournal,
+    default_journal_path,
+    read_issue_rows,
+)
+from src.adapters.secondary.storage.record_writers import RecordFormat, write_records
 from src.domain.task_service import TaskService
-from src.domain.jira_plan_service import JiraPlanService
+from src.domain.jira_plan_service import DEFAULT_MAX_DEPTH, JiraPlanService
 
 jira_app = typer.Typer()
-_jira = jira_factory.create()
-_task_service = TaskService(_jira)
-_jira_plan_service = JiraPlanService(_jira)
+
+# Fields of ``jira query`` records unless --fields names others
+DEFAULT_QUERY_FIELDS = ("summary", "status", "issuetype", "assignee", "updated")
+
+# Command options
+ISSUE_IDS_ARGUMENT = typer.Argument(
+    None, help="Keys of the issues to delete. '-' reads whitespace-separated keys from stdin"
+)
+JQL_OPTION = typer.Option(None, "--jql", help="Also delete every issue matching the query")
+DRY_RUN_OPTION = typer.Option(
+    False, "--dry-run", help="List the issues that would be deleted without deleting them"
+)
+YES_OPTION = typer.Option(
+    False,
+    "--yes",
+    "-y",
+    help="Delete the issues found by --jql or read from stdin without asking first",
+)
+FIELDS_OPTION = typer.Option(
+    ",".join(DEFAULT_QUERY_FIELDS), "--fields", help="Comma-separated fields to fetch"
+)
+RECORD_FORMAT_OPTION = typer.Option(
+    RecordFormat.NDJSON,
+    "--format",
+    help="Format of the records written. Parquet columns are typed: timestamps in UTC, "
+    "numbers, booleans, text and lists of them, with objects and mixed values as text.",
+)
+OUTPUT_OPTION = typer.Option(
+    None, "--output", "-o", help="File to write. Defaults to stdout, except for Parquet"
+)
+IMPORT_FILE_ARGUMENT = typer.Argument(..., help="CSV or NDJSON file with one issue per row")
+JOURNAL_OPTION = typer.Option(
+    None,
+    "--journal",
+    help="Record of the rows created so far. Defaults to <file>.journal.ndjson",
+)
+
+
+# Built on first use, so commands that do not talk to JIRA never create a client
+@cache
+def _task_service() -> TaskService:
+    return TaskService(jira_factory.create())
 
 
 @jira_app.command()
@@ -31,14 +81,14 @@ def create(
 
     request = CreateIssueRequest(project_key=project, summary=summary, description=description, date=date)
 
-    issue = _task_service.create_issue(request)
+    issue = _task_service().create_issue(request)
     print(f"Created issue: {issue.key}")
 
 
 @jira_app.command("list-projects")
 def get_all_projects() -> None:
     """Get list of all projects from Jira."""
-    projects = _task_service.get_all_projects()
+    projects = _task_service().get_all_projects()
     for _project in projects:
         print(_project.key)
 
@@ -46,37 +96,147 @@ def get_all_projects() -> None:
 @jira_app.command()
 def get_issue(issue_id: str) -> None:
     """Get details of a specific JIRA issue."""
-    issue = _task_service.get_issue(issue_id)
+    issue = _task_service().get_issue(issue_id)
     print(issue.key, issue.summary)
 
 
 @jira_app.command()
-def rm(issue_ids: list[str]) -> None:
-    """Delete one or more JIRA issues."""
-    for issue_id in issue_ids:
-        print(f"Deleting issue: {issue_id}")
-        _task_service.delete_issue(issue_id)
+def rm(
+    issue_ids: list[str] | None = ISSUE_IDS_ARGUMENT,
+    jql: str | None = JQL_OPTION,
+    *,
+    dry_run: bool = DRY_RUN_OPTION,
+    yes: bool = YES_OPTION,
+) -> None:
+    """Delete one or more JIRA issues, several at a time.
+
+    Keys from --jql or stdin are not typed out one by one, so deleting them needs a
+    confirmation, or --yes. Keys read from stdin leave no input to answer a prompt
+    with, so they always need --yes.
+    """
+    from_stdin = "-" in (issue_ids or [])
+    if from_stdin and not yes and not dry_run:
+        print("Deleting issues read from stdin needs --yes.", file=sys.stderr)
+        raise typer.Exit(code=2)
+    issue_keys = _issue_keys_to_delete(issue_ids or [], jql)
+    if not issue_keys:
+        print("No issues to delete.")
+        return
+
+    if dry_run:
+        for issue_key in issue_keys:
+            print(f"Would delete issue: {issue_key}")
+        print(f"\n{len(issue_keys)} issues would be deleted.")
+        return
+
+    if jql is not None and not yes:
+        typer.confirm(f"Delete {len(issue_keys)} issues?", abort=True)
+
+    results = _task_service().delete_issues(issue_keys)
+    for result in results:
+        if result.deleted:
+            print(f"Deleted issue: {result.key}")
+        else:
+            print(f"Failed to delete issue: {result.key}: {result.error}")
+    failed = [result for result in results if not result.deleted]
+    print(f"\nDeleted {len(results) - len(failed)} issues, failed {len(failed)}.")
+    if failed:
+        raise typer.Exit(code=1)
+
+
+def _issue_keys_to_delete(issue_ids: list[str], jql: str | None) -> list[str]:
+    """Get the keys given to ``rm``, read from stdin or matching its query, once each."""
+    issue_keys = [key for key in issue_ids if key != "-"]
+    if "-" in issue_ids:
+        issue_keys += sys.stdin.read().split()
+    if jql is not None:
+        issue_keys += _task_service().search_issue_keys(jql)
+    return list(dict.fromkeys(issue_keys))
+
 
+@jira_app.command("bulk-create")
+def bulk_create(
+    path: Path = IMPORT_FILE_ARGUMENT,
+    journal_path: Path | None = JOURNAL_OPTION,
+) -> None:
+    """Create the issues listed in a CSV or NDJSON file with bulk requests.
+
+    Each row holds the fields of an issue (project_key, summary, description,
+    issue_type, date). Created rows are journaled, so running the command again after
+    an interruption or failures only creates the rows still missing.
+    """
+    journal = ImportJournal(journal_path or default_journal_path(path))
+    counts = {"created": 0, "resumed": 0, "failed": 0}
+    for result in _task_service().create_issues(read_issue_rows(path), journal):
+        if result.resumed:
+            counts["resumed"] += 1
+            print(f"Row {result.row}: already created as {result.key}")
+        elif result.created:
+            counts["created"] += 1
+            print(f"Row {result.row}: created {result.key}")
+        else:
+            counts["failed"] += 1
+            print(f"Row {result.row}: failed: {result.error}")
+
+    print(
+        f"\nCreated {counts['created']}, already created {counts['resumed']}, "
+        f"failed {counts['failed']}. Journal: {journal.path}"
+    )
+    if counts["failed"]:
+        raise typer.Exit(code=1)
 
 
 @jira_app.command()
-def query(jql: str) -> None:
-    """Query JIRA issues using JQL."""
-    issues = _jira.search_issues(jql)
-    for _issue in issues:
-        print(_issue.key, _issue.fields.summary)
+def query(
+    jql: str,
+    fields: str = FIELDS_OPTION,
+    output_format: RecordFormat = RECORD_FORMAT_OPTION,
+    output: Path | None = OUTPUT_OPTION,
+) -> None:
+    """Stream every issue matching a JQL query as NDJSON, CSV or Parquet records.
+
+    Records hold the issue key and the requested fields, and are written page by page
+    as they arrive, so large result sets can be piped without being held in memory.
+    """
+    field_names = [name.strip() for name in fields.split(",") if name.strip()]
+    if output_format == RecordFormat.PARQUET and output is None:
+        msg = "Parquet output needs --output"
+        raise typer.BadParameter(msg, param_hint="--format")
+
+    pages = _task_service().iter_issue_records(jql, field_names)
+    count = write_records(pages, ["key", *field_names], output_format, output)
+    if output is not None:
+        print(f"Wrote {count} issues to {output}", file=sys.stderr)
 
 
 @jira_app.command()
 def my_items() -> None:
     """Get items from your JIRA filter."""
-    _jira.filter("15232")
+    jira_factory.create().filter("15232")
 
 
 @jira_app.command()
 def health_check() -> None:
     """Check if JIRA API is accessible."""
-    print(f"JIRA API is accessible. {_jira.jira.server_url}")
+    jira = jira_factory.create()
+    jira.get_server_info()
+    print(f"JIRA API is accessible. {jira.server_url}")
+
+
+@jira_app.command()
+def cache_stats(
+    *,
+    clear: bool = typer.Option(False, "--clear", help="Empty the cache and its stats."),
+) -> None:
+    """Show hit and miss counts and the size of the response cache."""
+    cache = jira_factory.response_cache()
+    if clear:
+        cache.clear()
+        print("Response cache cleared.")
+        return
+    entries, size = cache.size()
+    print(f"Entries: {entries} ({size / 1024 / 1024:.1f} MiB)")
+    print(f"Lifetime: {cache.lifetime_stats().summary()}")
 
 
 @jira_app.command()
@@ -84,17 +244,31 @@ def create_plan(
     issue_ids: list[str],
     name: str = typer.Option(..., help="Name of the Jira Plan"),
     lead_email: str | None = typer.Option(None, help="Email address of the plan lead"),
+    max_depth: int = typer.Option(
+        DEFAULT_MAX_DEPTH, help="Levels of parents and of linked issues to include"
+    ),
+    filter_max_length: int = typer.Option(
+        DEFAULT_MAX_FILTER_JQL_LENGTH,
+        help="JQL length above which the issues are split over several filters",
+    ),
 ) -> None:
     """Create a Jira Plan from a list of issue IDs.
 
     This command will:
     1. Get the root issues from the provided IDs
-    2. Recursively get all parent issues (epics, initiatives)
-    3. Recursively get all child issues (stories, tasks, bugs)
+    2. Get the parent issues (epics, initiatives), up to --max-depth levels up
+    3. Get the linked child issues (stories, tasks, bugs), up to --max-depth levels
     4. Generate a JQL query that includes all related issues
-    5. Create a Jira Plan with all discovered issues
+    5. Create one or more filters selecting those issues
+    6. Create a Jira Plan with all discovered issues
     """
-    plan, response = _jira_plan_service.create_plan(issue_ids, name, lead_email)
+    jira_plan_service = JiraPlanService(
+        jira_factory.create(),
+        max_depth,
+        issue_graph_factory.create(),
+        max_filter_length=filter_max_length,
+    )
+    plan, response = jira_plan_service.create_plan(issue_ids, name, lead_email)
 
     print(f"\nRoot Issues ({len(plan.root_issues)}):")
     for issue in plan.root_issues:
@@ -113,6 +287,14 @@ def create_plan(
     print("\nJQL to fetch all related issues:")
     print(plan.jql)
 
+    print(f"\nFilters ({len(response.filters)}):")
+    for jira_filter in response.filters:
+        print(
+            f"- {jira_filter.id}: {jira_filter.name}, {jira_filter.issue_count} issues, "
+            f"{len(jira_filter.jql)} JQL characters, "
+            f"evaluated in {jira_filter.evaluation_seconds:.2f}s"
+        )
+
     print("\nJira Plan created successfully:")
     print(f"Name: {response.name}")
     print(f"ID: {response.id}")
@@ -1,19 +1,30 @@
 """CLI commands for analyzing team and project metrics."""
 
+import shutil
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
+from functools import cache
 from pathlib import Path
 
 import pytz
 import typer
 
 from src.adapters.secondary.jira import jira_factory
+from src.adapters.secondary.storage import issue_graph_factory, issue_store_factory
+from src.adapters.secondary.storage.analytics_dataset import (
+    DatasetFormat,
+    scan_analytics,
+    write_analytics,
+    write_dataset,
+)
+from src.domain.models import Bucket, IssueAnalytics, SearchMode
 from src.domain.task_service import TaskService
-from src.domain.team_analysis import TeamAnalysis
 
 # Default values for command options
 DEFAULT_WEEKS = 4
 DEFAULT_OUTPUT_DIR = "analysis_output"
 DEFAULT_START_DATE = datetime.now(pytz.UTC)
+OUT_OF_CORE_CHUNK_ISSUES = 5000  # Issues held in memory at once with --out-of-core
 
 # Command options
 WEEKS_OPTION = typer.Option(
@@ -33,21 +44,90 @@ PROJECT_KEYS_OPTION = typer.Option(
     None,
     help="Projects to analyze. Defaults to just API BU Projects",
 )
+SEARCH_MODE_OPTION = typer.Option(
+    SearchMode.PARALLEL,
+    help="How to page through Jira search results: 'parallel' fetches offset pages "
+    "concurrently, 'serial' one at a time, 'token' uses nextPageToken paging, 'sharded' "
+    "splits the search by project and resolved date and fetches the shards concurrently.",
+)
+FULL_REFRESH_OPTION = typer.Option(
+    False,
+    "--full-refresh",
+    help="Reload every issue in the window instead of syncing only the ones updated "
+    "since the last run.",
+)
+STATS_OPTION = typer.Option(
+    False,
+    "--stats",
+    help="Print request scheduling stats (throttle events, time spent waiting), "
+    "response cache hit and miss counts and how many truncated changelogs were completed.",
+)
+EXPORT_OPTION = typer.Option(
+    [],
+    "--export",
+    help="Also upsert the analyzed issues into a dataset partitioned by week and project, "
+    "in <output-dir>/engineering_taxonomy_<format>. Can be given once per format.",
+)
+
+BUCKET_OPTION = typer.Option(
+    Bucket.WEEK,
+    help="Periods to group resolved issues into in the charts.",
+)
+OUT_OF_CORE_OPTION = typer.Option(
+    False,
+    "--out-of-core",
+    help="Write the issues to <output-dir>/analytics_dataset a chunk at a time, replacing "
+    "what an earlier run left there, and run the charts as streaming scans over it, so "
+    "memory stays flat for windows of any length. The CSV is streamed from it as well.",
+)
+
+SEPARATE_CHARTS_OPTION = typer.Option(
+    False,
+    "--separate-charts",
+    help="Write one HTML file per chart, each embedding plotly.js and a facet per period, "
+    "instead of the single dashboard.html page.",
+)
+PLOTLYJS_CDN_OPTION = typer.Option(
+    False,
+    "--plotlyjs-cdn",
+    help="Load plotly.js in dashboard.html from the plotly CDN instead of inlining it, "
+    "which keeps the page small but needs network access to view it.",
+)
 
 team_app = typer.Typer()
-_jira = jira_factory.create()
-_task_service = TaskService(_jira)
-_team_analysis = TeamAnalysis()
+
+
+# Built on first use, so commands that do not talk to JIRA never create a client
+@cache
+def _task_service() -> TaskService:
+    return TaskService(
+        jira_factory.create(), issue_store_factory.create(), issue_graph_factory.create()
+    )
 
 
 @team_app.command("analyze")
-def analyze_teams(
+def analyze_teams(  # noqa: PLR0913 - one parameter per command option
+    *,
     weeks: int = WEEKS_OPTION,
     output_dir: str = OUTPUT_DIR_OPTION,
     start_date: datetime | None = START_DATE_OPTION,
     project_keys: list[str] = PROJECT_KEYS_OPTION,
+    search_mode: SearchMode = SEARCH_MODE_OPTION,
+    full_refresh: bool = FULL_REFRESH_OPTION,
+    stats: bool = STATS_OPTION,
+    export: list[DatasetFormat] = EXPORT_OPTION,
+    bucket: Bucket = BUCKET_OPTION,
+    out_of_core: bool = OUT_OF_CORE_OPTION,
+    separate_charts: bool = SEPARATE_CHARTS_OPTION,
+    plotlyjs_cdn: bool = PLOTLYJS_CDN_OPTION,
 ) -> None:
     """Analyze engineering work taxonomy across teams and generate visualizations."""
+    # polars and plotly are only needed here, so they are not imported at startup
+    from src.domain.flow_metrics import FlowMetric
+    from src.domain.team_analysis import TeamAnalysis
+
+    team_analysis = TeamAnalysis()
+
     # Create output directory if it doesn't exist
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
@@ -61,38 +141,118 @@ def analyze_teams(
     start = prev_weekday(start_date or DEFAULT_START_DATE, 0)
     end_date = start + timedelta(weeks=weeks)
 
-    # Get and process data
-    analytics = _task_service.get_engineering_taxonomy(
+    # Get and process data, one page of issues at a time
+    analytics_pages = _task_service().iter_engineering_taxonomy(
         start,
         end_date,
         project_keys,
+        search_mode,
+        full_refresh=full_refresh,
     )
+    datasets = {
+        dataset_format: output_path / f"engineering_taxonomy_{dataset_format}"
+        for dataset_format in dict.fromkeys(export)
+    }
+    if out_of_core:
+        dataset_path = output_path / "analytics_dataset"
+        # Only holds this run's issues: the issue store is what persists between runs,
+        # so issues of other projects, or no longer resolved, do not linger in it
+        shutil.rmtree(dataset_path, ignore_errors=True)
+        issue_count = 0
+        for chunk in _chunks(analytics_pages, OUT_OF_CORE_CHUNK_ISSUES):
+            chunk_analytics = team_analysis.build_session(chunk)
+            write_analytics(chunk_analytics, dataset_path)
+            for dataset_format, export_path in datasets.items():
+                write_dataset(chunk_analytics.issues, export_path, dataset_format)
+            issue_count += chunk_analytics.issues.height
+        analytics = scan_analytics(dataset_path, bucket, start, end_date) if issue_count else None
+    else:
+        analytics = team_analysis.build_session(analytics_pages, bucket)
 
-    if not analytics:
+    if stats:
+        print(f"Jira requests: {jira_factory.create().scheduler.stats.summary()}")
+        print(f"Response cache: {jira_factory.response_cache().stats.summary()}")
+        print(f"Truncated changelogs completed: {jira_factory.create().completed_changelogs}")
+
+    if analytics is None or analytics.is_empty():
         return
 
     # Generate visualizations
-    team_composition = str(output_path / "team_composition.html")
-    weekly_trends = str(output_path / "weekly_trends.html")
-    lead_time = str(output_path / "lead_time.html")
+    if separate_charts:
+        charts = {
+            "weekly_trends.html": f"{bucket.label}ly trends by team",
+            "team_composition.html": "Overall team composition",
+            "lead_time.html": "Lead time by project and category",
+            "cycle_time.html": f"{bucket.label}ly mean cycle time by project",
+            "reopens.html": f"{bucket.label}ly mean reopens by project",
+            "time_in_status.html": "Mean time in each status by project",
+        }
+        team_analysis.analyze_weekly_trends(analytics, str(output_path / "weekly_trends.html"))
+        team_analysis.visualize_project_composition(
+            analytics, str(output_path / "team_composition.html")
+        )
+        team_analysis.visualize_project_lead_time(analytics, str(output_path / "lead_time.html"))
+        team_analysis.visualize_flow_metric(
+            analytics, FlowMetric.CYCLE_TIME, str(output_path / "cycle_time.html")
+        )
+        team_analysis.visualize_flow_metric(
+            analytics, FlowMetric.REOPENS, str(output_path / "reopens.html")
+        )
+        team_analysis.visualize_time_in_status(analytics, str(output_path / "time_in_status.html"))
+    else:
+        charts = {"dashboard.html": "Every chart on one page, bar charts paged by period"}
+        team_analysis.write_dashboard(
+            analytics,
+            str(output_path / "dashboard.html"),
+            include_plotlyjs="cdn" if plotlyjs_cdn else True,
+        )
+    team_analysis.write_to_csv(analytics, str(output_path / "engineering_taxonomy.csv"))
+    if not out_of_core:
+        for dataset_format, export_path in datasets.items():
+            write_dataset(analytics.issues, export_path, dataset_format)
+
+    _print_generated_files(output_path, charts, datasets, out_of_core=out_of_core)
 
-    _team_analysis.analyze_weekly_trends(analytics, weekly_trends)
-    _team_analysis.visualize_project_composition(analytics, team_composition)
-    _team_analysis.visualize_project_lead_time(analytics, lead_time)
-    _team_analysis.write_to_csv(analytics)
 
+def _print_generated_files(
+    output_path: Path,
+    charts: dict[str, str],
+    datasets: dict[DatasetFormat, Path],
+    *,
+    out_of_core: bool,
+) -> None:
+    """List the files an analysis wrote, with what each of them holds."""
     print(f"\nAnalysis complete! Visualization files have been saved to: {output_path}")
     print("\nGenerated files:")
-    print(f"- {output_path}/team_composition.html (Overall team composition)")
-    print(f"- {output_path}/weekly_trends.html (Weekly trends by team)")
-    print(f"- {output_path}/lead_time.html (Lead time by project and category)")
+    for file_name, description in charts.items():
+        print(f"- {output_path}/{file_name} ({description})")
     print(f"- {output_path}/engineering_taxonomy.csv (Raw data)")
+    for dataset_format, export_path in datasets.items():
+        print(f"- {export_path}/ (Raw data, {dataset_format} partitioned by week and project)")
+    if out_of_core:
+        print(f"- {output_path}/analytics_dataset/ (Issues and status transitions, parquet)")
+
+
+def _chunks(
+    analytics_pages: Iterable[list[IssueAnalytics]], size: int
+) -> Iterator[list[list[IssueAnalytics]]]:
+    """Group pages of issues into chunks of at least ``size`` issues, the last one aside."""
+    chunk: list[list[IssueAnalytics]] = []
+    chunk_size = 0
+    for page in analytics_pages:
+        chunk.append(page)
+        chunk_size += len(page)
+        if chunk_size >= size:
+            yield chunk
+            chunk, chunk_size = [], 0
+    if chunk:
+        yield chunk
 
 
 @team_app.command("list")
 def list_projects() -> None:
     """List all available projects."""
-    projects = _task_service.get_core_connectivity_projects_keys()
+    projects = _task_service().get_core_connectivity_projects_keys()
     if projects:
         for _project in projects:
             print(f"Project: {_project.key}")
@@ -0,0 +1,856 @@
+"""Asynchronous JIRA adapter built on a pooled ``httpx.AsyncClient``.
+
+Implements the same public methods as ``JiraAdapter`` as coroutines talking to the
+JIRA REST API directly, so many requests can be in flight from a single thread.
+``AsyncAdapterRunner`` exposes it through the synchronous interface the CLI uses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from http import HTTPStatus
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from jira import JIRA
+from jira.resources import Issue as JiraIssue
+
+from src.adapters.secondary.jira.changelogs import (
+    BULK_CHANGELOG_PATH,
+    ISSUE_CHANGELOG_PAGE_SIZE,
+    ISSUE_CHANGELOG_PATH,
+    add_histories,
+    attach_changelogs,
+    changelog_requests,
+    merge_histories,
+    missing_changelog_offsets,
+    needs_changelog,
+)
+from src.adapters.secondary.jira.jira_adapter import (
+    BULK_CREATE_BATCH_SIZE,
+    DEFAULT_MAX_WORKERS,
+    ENGINEERING_WORK_TAXONOMY_FIELD,
+    FIELD_PROFILES,
+    KEY_BATCH_SIZE,
+    PAGE_SIZE,
+    build_issue_fields,
+    build_keys_jql,
+    build_project_jql,
+    build_taxonomy_jql,
+    parse_bulk_create_response,
+)
+from src.adapters.secondary.jira.mappers import (
+    map_issue_json,
+    map_project_json,
+    map_record_json,
+)
+from src.adapters.secondary.jira.models import (
+    FieldProfile,
+    JiraFilter,
+    JiraPlanRequest,
+    JiraPlanResponse,
+    ProjectCategory,
+)
+from src.adapters.secondary.jira.request_scheduler import RequestScheduler
+from src.domain.models import (
+    CreateIssueRequest,
+    Issue,
+    IssueCreationResult,
+    IssueDeletionResult,
+    Project,
+    SearchMode,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the "async" extra
+    httpx = None
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Coroutine, Iterator
+    from datetime import datetime
+
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+T = TypeVar("T")
+
+
+class AsyncJiraAdapter:
+    """Asyncio implementation of the JIRA adapter.
+
+    Every call goes through one pooled HTTP client whose connection limit bounds how
+    many requests are in flight at once.
+    """
+
+    def __init__(  # noqa: PLR0913 - credentials plus the JiraAdapter connection settings
+        self,
+        server_url: str,
+        user_email: str,
+        api_key: str,
+        max_connections: int = DEFAULT_MAX_WORKERS,
+        scheduler: RequestScheduler | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the async JIRA adapter.
+
+        Args:
+            server_url: Base URL of the JIRA instance
+            user_email: Email address used for basic authentication
+            api_key: API token used for basic authentication
+            max_connections: Maximum number of concurrent connections in the pool
+            scheduler: Rate-limit-aware scheduler every request is sent through. Defaults
+                to one allowing up to ``max_connections`` requests in flight
+            transport: Optional transport replacing the network, e.g. for tests
+
+        """
+        if httpx is None:
+            msg = "The async JIRA adapter requires httpx: install the 'async' extra"
+            raise ImportError(msg)
+
+        self.server_url = server_url
+        self.max_connections = max_connections
+        self.scheduler = scheduler or RequestScheduler(max_concurrency=max_connections)
+        self.engineering_work_taxonomy = ENGINEERING_WORK_TAXONOMY_FIELD
+        # Issues whose truncated changelog needed further pages, for run statistics
+        self.completed_changelogs = 0
+        self._resource_options = {**JIRA.DEFAULT_OPTIONS, "server": server_url}
+        self._client = httpx.AsyncClient(
+            base_url=server_url,
+            auth=(user_email, api_key),
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            timeout=REQUEST_TIMEOUT_SECONDS,
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
+    async def create_issue(self, request: CreateIssueRequest) -> Issue:
+        """Create a new JIRA issue from a domain model request."""
+        created = await self._request(
+            "POST", "/rest/api/2/issue", json={"fields": build_issue_fields(request)}
+        )
+        return await self.get_issue(created["key"])
+
+    async def create_issues(self, requests: list[CreateIssueRequest]) -> list[IssueCreationResult]:
+        """Create several issues through the bulk creation endpoint.
+
+        Args:
+            requests: Issues to create
+
+        Returns:
+            One result per request, in order, with ``row`` counting from 1
+
+        """
+        batches = [
+            requests[pos : pos + BULK_CREATE_BATCH_SIZE]
+            for pos in range(0, len(requests), BULK_CREATE_BATCH_SIZE)
+        ]
+        batch_results = await asyncio.gather(*(self._create_batch(batch) for batch in batches))
+        results = [result for batch in batch_results for result in batch]
+        for row, result in enumerate(results, start=1):
+            result.row = row
+        return results
+
+    async def delete_issue(self, issue_id: str) -> None:
+        """Delete a JIRA issue."""
+        await self._request("DELETE", f"/rest/api/2/issue/{issue_id}")
+
+    async def delete_issues(self, issue_keys: list[str]) -> list[IssueDeletionResult]:
+        """Delete several issues concurrently, reporting each failure in its result.
+
+        Args:
+            issue_keys: Keys of the issues to delete
+
+        Returns:
+            One result per key, in order
+
+        """
+        return list(await asyncio.gather(*map(self._try_delete_issue, issue_keys)))
+
+    async def iter_issue_records(
+        self, jql: str, fields: list[str]
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield flat records of the issues matching a JQL query, one page at a time.
+
+        Args:
+            jql: Query selecting the issues
+            fields: Fields to fetch and put in each record, after the issue key
+
+        """
+        async for raw_issues in self._iter_raw_pages_token(jql, fields=["key", *fields]):
+            yield [map_record_json(raw_issue, fields) for raw_issue in raw_issues]
+
+    async def search_issue_keys(self, jql: str) -> list[str]:
+        """Get the keys of the issues matching a JQL query, without any of their fields."""
+        return [
+            raw_issue["key"]
+            async for raw_issues in self._iter_raw_pages_token(jql, fields=["key"])
+            for raw_issue in raw_issues
+        ]
+
+    async def get_issue(self, issue_id: str) -> Issue:
+        """Get details of a specific issue."""
+        raw_issue = await self._request(
+            "GET", f"/rest/api/2/issue/{issue_id}", params={"expand": "changelog"}
+        )
+        await self._complete_changelogs([raw_issue])
+        return self._map_issue(raw_issue)
+
+    async def get_issues(
+        self, issue_keys: list[str], profile: FieldProfile = FieldProfile.PLAN
+    ) -> list[Issue]:
+        """Get the details of several issues with batched searches.
+
+        Args:
+            issue_keys: Keys of the issues to get
+            profile: Fields to fetch. Defaults to those plans need
+
+        Returns:
+            The issues in the order of ``issue_keys``, skipping keys Jira did not return
+
+        """
+        unique_keys = list(dict.fromkeys(issue_keys))
+        pages = await asyncio.gather(
+            *(
+                self._search_page(
+                    build_keys_jql(unique_keys[pos : pos + KEY_BATCH_SIZE]), 0, profile
+                )
+                for pos in range(0, len(unique_keys), KEY_BATCH_SIZE)
+            )
+        )
+        issues_by_key = {
+            raw_issue["key"]: self._map_issue(raw_issue)
+            for page in pages
+            for raw_issue in page.get("issues", [])
+        }
+        return [issues_by_key[key] for key in unique_keys if key in issues_by_key]
+
+    async def get_core_connectivity_projects_keys(self) -> list[Project]:
+        """Get list of all Core Connectivity projects."""
+        results = []
+        raw_projects = await self._request("GET", "/rest/api/2/project")
+
+        for raw_project in raw_projects:
+            project = map_project_json(raw_project)
+            if (
+                project.name not in results
+                and project.category_id == ProjectCategory.CORE_CONNECTIVITY
+            ):
+                results.append(Project(project.key, project.name, project.category_id))
+
+        return results
+
+    async def search_issues(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        projects: list[str] | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.ANALYTICS,
+    ) -> list[Issue]:
+        """Search for issues matching the given criteria.
+
+        Args:
+            start_date: Start date for analysis
+            end_date: End date for analysis
+            projects: Optional list of specific projects to analyze
+            search_mode: How to page through the results. Defaults to parallel fetching
+            profile: Fields to fetch. Defaults to those analytics need
+
+        """
+        pages = self.iter_search_issue_pages(start_date, end_date, projects, search_mode, profile)
+        return [issue async for page in pages for issue in page]
+
+    async def iter_search_issue_pages(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        projects: list[str] | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.ANALYTICS,
+    ) -> AsyncIterator[list[Issue]]:
+        """Yield the issues ``search_issues`` returns, one page at a time.
+
+        Args:
+            start_date: Start date for analysis
+            end_date: End date for analysis
+            projects: Optional list of specific projects to analyze
+            search_mode: How to page through the results. Defaults to parallel fetching
+            profile: Fields to fetch. Defaults to those analytics need
+
+        """
+        if projects is None:
+            projects = await self.get_core_connectivity_projects_keys()
+        jql = build_taxonomy_jql(start_date, end_date, [project.key for project in projects])
+
+        async for page in self.iter_issue_pages(jql, search_mode, profile):
+            yield page
+
+    async def search_project_issues(
+        self,
+        project_key: str,
+        resolved_since: datetime | None = None,
+        updated_since: datetime | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.ANALYTICS,
+    ) -> list[Issue]:
+        """Search every issue of a project, optionally bounded by resolution or update date.
+
+        Args:
+            project_key: Key of the project to search
+            resolved_since: Only include issues resolved on or after this date
+            updated_since: Only include issues updated on or after this date
+            search_mode: How to page through the results. Defaults to parallel fetching
+            profile: Fields to fetch. Defaults to those analytics need
+
+        """
+        pages = self.iter_project_issue_pages(
+            project_key, resolved_since, updated_since, search_mode, profile
+        )
+        return [issue async for page in pages for issue in page]
+
+    async def iter_project_issue_pages(
+        self,
+        project_key: str,
+        resolved_since: datetime | None = None,
+        updated_since: datetime | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.ANALYTICS,
+    ) -> AsyncIterator[list[Issue]]:
+        """Yield the issues ``search_project_issues`` returns, one page at a time.
+
+        Args:
+            project_key: Key of the project to search
+            resolved_since: Only include issues resolved on or after this date
+            updated_since: Only include issues updated on or after this date
+            search_mode: How to page through the results. Defaults to parallel fetching
+            profile: Fields to fetch. Defaults to those analytics need
+
+        """
+        jql = build_project_jql(project_key, resolved_since, updated_since)
+        async for page in self.iter_issue_pages(jql, search_mode, profile):
+            yield page
+
+    async def iter_issue_pages(
+        self,
+        jql: str,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.FULL,
+    ) -> AsyncIterator[list[Issue]]:
+        """Yield the mapped issues matching a JQL query one page at a time.
+
+        Sharded searches are only implemented by the synchronous adapter, so
+        ``SearchMode.SHARDED`` pages through the query like ``SearchMode.PARALLEL``.
+
+        Args:
+            jql: JQL query to run
+            search_mode: How to page through the results. Defaults to parallel fetching
+            profile: Fields to fetch. Defaults to every mapped field and the changelog
+
+        """
+        if search_mode == SearchMode.TOKEN:
+            raw_pages = self._iter_raw_pages_token(jql, profile)
+        else:
+            raw_pages = self._iter_raw_pages_offset(jql, search_mode, profile)
+
+        seen_keys: set[str] = set()
+        async for raw_issues in raw_pages:
+            page = []
+            for raw_issue in raw_issues:
+                if raw_issue["key"] not in seen_keys:
+                    seen_keys.add(raw_issue["key"])
+                    page.append(self._map_issue(raw_issue))
+            yield page
+
+    async def get_parent_issue(self, issue_id: str) -> JiraIssue | None:
+        """Get the parent issue (epic or initiative) of a given issue."""
+        raw_issue = await self._request(
+            "GET", f"/rest/api/2/issue/{issue_id}", params={"fields": "parent"}
+        )
+        raw_parent = raw_issue.get("fields", {}).get("parent")
+        if raw_parent is None:
+            return None
+        return JiraIssue(self._resource_options, None, raw=raw_parent)
+
+    async def get_child_issues_keys(self, issue_id: str) -> set[str]:
+        """Get all child issues (stories, tasks, bugs) of a given issue."""
+        raw_issue = await self._request(
+            "GET", f"/rest/api/2/issue/{issue_id}", params={"fields": "issuelinks"}
+        )
+        child_keys = set()
+        for issue_link in raw_issue.get("fields", {}).get("issuelinks", []):
+            if "outwardIssue" in issue_link:
+                child_keys.add(issue_link["outwardIssue"]["key"])
+            elif "inwardIssue" in issue_link:
+                child_keys.add(issue_link["inwardIssue"]["key"])
+
+        return child_keys
+
+    async def get_account_id(self, email: str | None = None) -> str:
+        """Get the account ID for a user from their email address."""
+        if email is None:
+            myself = await self._request("GET", "/rest/api/3/myself")
+            return myself["accountId"]
+        users = await self._request("GET", "/rest/api/3/user/search", params={"query": email})
+        if not users:
+            msg = f"No user found with email: {email}"
+            raise ValueError(msg)
+        return users[0]["accountId"]
+
+    async def get_server_info(self) -> dict[str, Any]:
+        """Get the server information, confirming the API is reachable."""
+        return await self._request("GET", "/rest/api/2/serverInfo")
+
+    async def get_project_id(self, project_key: str) -> int:
+        """Get the numeric ID of a project from its key."""
+        data = await self._request("GET", f"/rest/api/3/project/{project_key}")
+        return int(data["id"])
+
+    async def create_filter(
+        self,
+        name: str,
+        jql: str,
+        owner_account_id: str,  # noqa: ARG002 - same signature as JiraAdapter.create_filter
+    ) -> JiraFilter:
+        """Create a Jira Filter using the Jira API."""
+        data = await self._request(
+            "POST",
+            "/rest/api/3/filter",
+            json={"name": name, "jql": jql, "sharePermissions": [{"type": "authenticated"}]},
+        )
+        return JiraFilter(
+            id=str(data["id"]),
+            name=data["name"],
+            jql=data["jql"],
+            owner_account_id=data["owner"]["accountId"],
+        )
+
+    async def time_jql(self, jql: str) -> tuple[int, float]:
+        """Measure how long Jira takes to evaluate a JQL query.
+
+        Returns:
+            Jira's approximate count of the matching issues and the seconds it took
+
+        """
+        started = time.perf_counter()
+        data = await self._request(
+            "POST", "/rest/api/3/search/approximate-count", json={"jql": jql}
+        )
+        return data["count"], time.perf_counter() - started
+
+    async def create_jira_plan(self, request: JiraPlanRequest) -> JiraPlanResponse:
+        """Create a Jira Plan using the Jira API."""
+        plan_id = await self._request(
+            "POST",
+            "/rest/api/3/plans/plan",
+            json={
+                "name": request.name,
+                "issueSources": request.issue_sources,
+                "scheduling": request.scheduling,
+                "leadAccountId": request.lead_account_id,
+                "permissions": request.permissions,
+                "exclusionRules": request.exclusion_rules,
+                "customFields": request.custom_fields,
+            },
+        )
+        return JiraPlanResponse(
+            id=plan_id, name=request.name, url=f"{self.server_url}/jira/plans/{plan_id}"
+        )
+
+    async def _fetch_issues(
+        self, jql: str, search_mode: SearchMode = SearchMode.PARALLEL
+    ) -> list[Issue]:
+        """Fetch issues from Jira using the provided JQL query."""
+        return [issue async for page in self.iter_issue_pages(jql, search_mode) for issue in page]
+
+    async def _iter_raw_pages_offset(
+        self, jql: str, search_mode: SearchMode, profile: FieldProfile
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield raw pages in offset order, using the total reported by the first page.
+
+        In parallel mode up to ``max_connections`` pages are requested ahead of the one
+        being consumed; in serial mode each page is requested after the previous one.
+        """
+        first_page = await self._search_page(jql, 0, profile)
+        page_size = len(first_page.get("issues", []))
+        if page_size == 0:
+            return
+
+        window = 1 if search_mode == SearchMode.SERIAL else self.max_connections
+        offsets = iter(range(page_size, first_page.get("total", 0), page_size))
+        pending = deque(
+            asyncio.ensure_future(self._search_page(jql, pos, profile))
+            for pos in islice(offsets, window)
+        )
+        yield first_page["issues"]
+        while pending:
+            page = await pending.popleft()
+            next_pos = next(offsets, None)
+            if next_pos is not None:
+                pending.append(asyncio.ensure_future(self._search_page(jql, next_pos, profile)))
+            yield page.get("issues", [])
+
+    async def _iter_raw_pages_token(
+        self,
+        jql: str,
+        profile: FieldProfile = FieldProfile.FULL,
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield raw pages by ``nextPageToken``, requesting the next page before yielding."""
+        pending = asyncio.ensure_future(self._search_token_page(jql, None, profile, fields))
+        while pending is not None:
+            page = await pending
+            token = page.get("nextPageToken")
+            pending = None
+            if token and not page.get("isLast", False):
+                pending = asyncio.ensure_future(
+                    self._search_token_page(jql, token, profile, fields)
+                )
+            yield page.get("issues", [])
+
+    async def _search_page(
+        self, jql: str, start_at: int, profile: FieldProfile = FieldProfile.FULL
+    ) -> dict[str, Any]:
+        """Fetch a single page of search results starting at the given offset."""
+        projection = FIELD_PROFILES[profile]
+        payload: dict[str, Any] = {
+            "jql": jql,
+            "startAt": start_at,
+            "maxResults": PAGE_SIZE,
+            "fields": list(projection.fields),
+        }
+        if projection.expand:
+            payload["expand"] = [projection.expand]
+        page = await self._request("POST", "/rest/api/2/search", json=payload)
+        if projection.lazy_changelog:
+            await self._attach_changelogs(page.get("issues", []))
+        await self._complete_changelogs(page.get("issues", []))
+        return page
+
+    async def _search_token_page(
+        self,
+        jql: str,
+        next_page_token: str | None,
+        profile: FieldProfile = FieldProfile.FULL,
+        fields: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Fetch a single page from the enhanced JQL search endpoint.
+
+        Pages carry the profile's fields and expansions unless ``fields`` names others.
+        """
+        projection = FIELD_PROFILES[profile]
+        payload: dict[str, Any] = {"jql": jql, "maxResults": PAGE_SIZE}
+        if fields is not None:
+            payload["fields"] = fields
+        else:
+            payload["fields"] = list(projection.fields)
+            if projection.expand:
+                payload["expand"] = projection.expand
+        if next_page_token:
+            payload["nextPageToken"] = next_page_token
+        page = await self._request("POST", "/rest/api/2/search/jql", json=payload)
+        if fields is None and projection.lazy_changelog:
+            await self._attach_changelogs(page.get("issues", []))
+        await self._complete_changelogs(page.get("issues", []))
+        return page
+
+    async def _attach_changelogs(self, raw_issues: list[dict[str, Any]]) -> None:
+        """Fetch the status changelogs of the resolved issues in bulk and attach them."""
+        issue_ids = [str(raw_issue["id"]) for raw_issue in raw_issues if needs_changelog(raw_issue)]
+        histories: dict[str, list[dict[str, Any]]] = {}
+        for request in changelog_requests(issue_ids):
+            payload = request
+            while True:
+                page = await self._request("POST", BULK_CHANGELOG_PATH, json=payload)
+                add_histories(histories, page)
+                if not page.get("nextPageToken"):
+                    break
+                payload = {**payload, "nextPageToken": page["nextPageToken"]}
+        attach_changelogs(raw_issues, histories)
+
+    async def _complete_changelogs(self, raw_issues: list[dict[str, Any]]) -> None:
+        """Fetch the histories left out of truncated changelogs and merge them in.
+
+        Every missing page of every truncated changelog is requested at once.
+        """
+        missing = [
+            (raw_issue["key"], start_at)
+            for raw_issue in raw_issues
+            for start_at in missing_changelog_offsets(raw_issue)
+        ]
+        if not missing:
+            return
+        pages = await asyncio.gather(
+            *(
+                self._request(
+                    "GET",
+                    ISSUE_CHANGELOG_PATH.format(key=key),
+                    params={"startAt": start_at, "maxResults": ISSUE_CHANGELOG_PAGE_SIZE},
+                )
+                for key, start_at in missing
+            )
+        )
+        histories: dict[str, list[dict[str, Any]]] = {}
+        for (key, _), page in zip(missing, pages, strict=True):
+            histories.setdefault(key, []).extend(page["values"])
+        for raw_issue in raw_issues:
+            if raw_issue["key"] in histories:
+                merge_histories(raw_issue, histories[raw_issue["key"]])
+        self.completed_changelogs += len(histories)
+
+    async def _create_batch(self, requests: list[CreateIssueRequest]) -> list[IssueCreationResult]:
+        """Submit one bulk creation request and map its outcome per issue."""
+        payload = {
+            "issueUpdates": [{"fields": build_issue_fields(request)} for request in requests]
+        }
+        try:
+            data = await self._request("POST", "/rest/api/2/issue/bulk", json=payload)
+        except httpx.HTTPError as error:
+            # Jira answers 400 when none of the issues could be created, still listing why
+            is_rejection = (
+                isinstance(error, httpx.HTTPStatusError)
+                and error.response.status_code == HTTPStatus.BAD_REQUEST
+            )
+            if not is_rejection:
+                return [
+                    IssueCreationResult(row=row, error=str(error))
+                    for row in range(1, len(requests) + 1)
+                ]
+            data = error.response.json()
+        return parse_bulk_create_response(data, len(requests))
+
+    async def _try_delete_issue(self, issue_key: str) -> IssueDeletionResult:
+        """Delete an issue, reporting a failure instead of raising it."""
+        try:
+            await self.delete_issue(issue_key)
+        except httpx.HTTPError as error:
+            return IssueDeletionResult(issue_key, error=str(error))
+        return IssueDeletionResult(issue_key)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        **kwargs: Any,  # noqa: ANN401 - passed on to httpx
+    ) -> Any:  # noqa: ANN401 - the decoded body is raw JSON
+        """Send a request through the scheduler and pooled client and decode its JSON body."""
+        response = await self.scheduler.asend(lambda: self._client.request(method, path, **kwargs))
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    def _map_issue(self, raw_issue: dict[str, Any]) -> Issue:
+        """Map a raw issue payload to a domain Issue."""
+        return map_issue_json(raw_issue, self.engineering_work_taxonomy)
+
+
+class AsyncAdapterRunner:
+    """Expose an ``AsyncJiraAdapter`` through the synchronous ``JiraAdapter`` interface.
+
+    The adapter's coroutines run on one long-lived event loop, which keeps its
+    connection pool alive between calls. The loop runs on a thread of its own rather
+    than only while a call waits for it, so the pages a search requested ahead keep
+    downloading while the caller processes the page it was handed.
+    """
+
+    def __init__(self, adapter: AsyncJiraAdapter) -> None:
+        """Initialize the runner around an async adapter and start its event loop."""
+        self.adapter = adapter
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="jira-event-loop", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def server_url(self) -> str:
+        """Base URL of the JIRA instance."""
+        return self.adapter.server_url
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """Scheduler every request of the adapter is sent through."""
+        return self.adapter.scheduler
+
+    @property
+    def completed_changelogs(self) -> int:
+        """Issues whose truncated changelog needed further pages."""
+        return self.adapter.completed_changelogs
+
+    def create_issue(self, request: CreateIssueRequest) -> Issue:
+        """Create a new JIRA issue from a domain model request."""
+        return self.run(self.adapter.create_issue(request))
+
+    def create_issues(self, requests: list[CreateIssueRequest]) -> list[IssueCreationResult]:
+        """Create several issues through the bulk creation endpoint."""
+        return self.run(self.adapter.create_issues(requests))
+
+    def delete_issue(self, issue_id: str) -> None:
+        """Delete a JIRA issue."""
+        self.run(self.adapter.delete_issue(issue_id))
+
+    def delete_issues(self, issue_keys: list[str]) -> list[IssueDeletionResult]:
+        """Delete several issues concurrently, reporting each failure in its result."""
+        return self.run(self.adapter.delete_issues(issue_keys))
+
+    def iter_issue_records(self, jql: str, fields: list[str]) -> Iterator[list[dict[str, Any]]]:
+        """Yield flat records of the issues matching a JQL query, one page at a time."""
+        return self.iterate(self.adapter.iter_issue_records(jql, fields))
+
+    def search_issue_keys(self, jql: str) -> list[str]:
+        """Get the keys of the issues matching a JQL query, without any of their fields."""
+        return self.run(self.adapter.search_issue_keys(jql))
+
+    def get_issue(self, issue_id: str) -> Issue:
+        """Get details of a specific issue."""
+        return self.run(self.adapter.get_issue(issue_id))
+
+    def get_issues(
+        self, issue_keys: list[str], profile: FieldProfile = FieldProfile.PLAN
+    ) -> list[Issue]:
+        """Get the details of several issues with batched searches."""
+        return self.run(self.adapter.get_issues(issue_keys, profile))
+
+    def get_core_connectivity_projects_keys(self) -> list[Project]:
+        """Get list of all Core Connectivity projects."""
+        return self.run(self.adapter.get_core_connectivity_projects_keys())
+
+    def search_issues(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        projects: list[str] | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.ANALYTICS,
+    ) -> list[Issue]:
+        """Search for issues matching the given criteria."""
+        return self.run(
+            self.adapter.search_issues(start_date, end_date, projects, search_mode, profile)
+        )
+
+    def iter_search_issue_pages(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        projects: list[str] | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.ANALYTICS,
+    ) -> Iterator[list[Issue]]:
+        """Yield the issues ``search_issues`` returns, one page at a time."""
+        return self.iterate(
+            self.adapter.iter_search_issue_pages(
+                start_date, end_date, projects, search_mode, profile
+            )
+        )
+
+    def search_project_issues(
+        self,
+        project_key: str,
+        resolved_since: datetime | None = None,
+        updated_since: datetime | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.ANALYTICS,
+    ) -> list[Issue]:
+        """Search every issue of a project, optionally bounded by resolution or update date."""
+        return self.run(
+            self.adapter.search_project_issues(
+                project_key, resolved_since, updated_since, search_mode, profile
+            )
+        )
+
+    def iter_project_issue_pages(
+        self,
+        project_key: str,
+        resolved_since: datetime | None = None,
+        updated_since: datetime | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.ANALYTICS,
+    ) -> Iterator[list[Issue]]:
+        """Yield the issues ``search_project_issues`` returns, one page at a time."""
+        return self.iterate(
+            self.adapter.iter_project_issue_pages(
+                project_key, resolved_since, updated_since, search_mode, profile
+            )
+        )
+
+    def iter_issue_pages(
+        self,
+        jql: str,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.FULL,
+    ) -> Iterator[list[Issue]]:
+        """Yield the mapped issues matching a JQL query one page at a time."""
+        return self.iterate(self.adapter.iter_issue_pages(jql, search_mode, profile))
+
+    def get_parent_issue(self, issue_id: str) -> JiraIssue | None:
+        """Get the parent issue (epic or initiative) of a given issue."""
+        return self.run(self.adapter.get_parent_issue(issue_id))
+
+    def get_child_issues_keys(self, issue_id: str) -> set[str]:
+        """Get all child issues (stories, tasks, bugs) of a given issue."""
+        return self.run(self.adapter.get_child_issues_keys(issue_id))
+
+    def get_account_id(self, email: str | None = None) -> str:
+        """Get the account ID for a user from their email address."""
+        return self.run(self.adapter.get_account_id(email))
+
+    def get_server_info(self) -> dict[str, Any]:
+        """Get the server information, confirming the API is reachable."""
+        return self.run(self.adapter.get_server_info())
+
+    def get_project_id(self, project_key: str) -> int:
+        """Get the numeric ID of a project from its key."""
+        return self.run(self.adapter.get_project_id(project_key))
+
+    def create_filter(self, name: str, jql: str, owner_account_id: str) -> JiraFilter:
+        """Create a Jira Filter using the Jira API."""
+        return self.run(self.adapter.create_filter(name, jql, owner_account_id))
+
+    def time_jql(self, jql: str) -> tuple[int, float]:
+        """Measure how long Jira takes to evaluate a JQL query."""
+        return self.run(self.adapter.time_jql(jql))
+
+    def create_jira_plan(self, request: JiraPlanRequest) -> JiraPlanResponse:
+        """Create a Jira Plan using the Jira API."""
+        return self.run(self.adapter.create_jira_plan(request))
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the runner's event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def iterate(self, async_iterator: AsyncIterator[T]) -> Iterator[T]:
+        """Iterate an async iterator synchronously on the runner's event loop."""
+        try:
+            while True:
+                try:
+                    yield self.run(anext(async_iterator))
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.run(async_iterator.aclose())
+
+    def gather(self, *coroutines: Coroutine[Any, Any, T]) -> list[T]:
+        """Run several adapter coroutines concurrently and return their results in order."""
+
+        async def run_all() -> list[T]:
+            return list(await asyncio.gather(*coroutines))
+
+        return self.run(run_all())
+
+    def close(self) -> None:
+        """Close the adapter's HTTP client, then stop and close the event loop.
+
+        Closing a runner a second time does nothing.
+        """
+        if self._loop.is_closed():
+            return
+        self.run(self.adapter.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,105 @@
+"""Lazy, bulk fetching of issue changelogs.
+
+Expanding the changelog of every searched issue makes search pages many times larger,
+although only the status transitions of resolved issues feed a lead time. Searches of
+lazy profiles leave the changelog out, and the status changes of the resolved issues
+of each page are then read with the bulk changelog endpoint, up to
+``CHANGELOG_BATCH_SIZE`` issues per request.
+
+Searches that do expand the changelog get at most ``ISSUE_CHANGELOG_PAGE_SIZE``
+entries per issue. The entries left out of such truncated changelogs are read page by
+page from the issue changelog endpoint and merged in before the issue is mapped.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BULK_CHANGELOG_PATH = "/rest/api/3/changelog/bulkfetch"
+CHANGELOG_BATCH_SIZE = 1000  # Most issues the bulk changelog endpoint accepts per request
+CHANGELOG_PAGE_SIZE = 1000
+LEAD_TIME_FIELDS = ("status",)  # Changes calculate_lead_time looks at
+ISSUE_CHANGELOG_PATH = "/rest/api/2/issue/{key}/changelog"
+ISSUE_CHANGELOG_PAGE_SIZE = 100  # Most entries an expanded or paged changelog holds
+
+
+def needs_changelog(raw_issue: dict[str, Any]) -> bool:
+    """Tell whether an issue's lead time can be calculated, i.e. it has been resolved."""
+    return bool(raw_issue.get("fields", {}).get("resolutiondate"))
+
+
+def changelog_requests(issue_ids: list[str]) -> list[dict[str, Any]]:
+    """Build the first request body of each batch of a bulk changelog fetch."""
+    return [
+        {
+            "issueIdsOrKeys": issue_ids[pos : pos + CHANGELOG_BATCH_SIZE],
+            "fieldIds": list(LEAD_TIME_FIELDS),
+            "maxResults": CHANGELOG_PAGE_SIZE,
+        }
+        for pos in range(0, len(issue_ids), CHANGELOG_BATCH_SIZE)
+    ]
+
+
+def collect_histories(
+    fetch_page: Callable[[dict[str, Any]], dict[str, Any]], payload: dict[str, Any]
+) -> dict[str, list[dict[str, Any]]]:
+    """Page through one bulk changelog request, grouping the histories by issue ID.
+
+    Args:
+        fetch_page: Callable posting a request body and returning the decoded response
+        payload: First request body, as built by ``changelog_requests``
+
+    Returns:
+        The change histories of each issue, keyed by issue ID
+
+    """
+    histories: dict[str, list[dict[str, Any]]] = {}
+    while True:
+        page = fetch_page(payload)
+        add_histories(histories, page)
+        token = page.get("nextPageToken")
+        if not token:
+            return histories
+        payload = {**payload, "nextPageToken": token}
+
+
+def add_histories(histories: dict[str, list[dict[str, Any]]], page: dict[str, Any]) -> None:
+    """Add the change histories of a bulk changelog response page to ``histories``."""
+    for changelog in page.get("issueChangeLogs", []):
+        histories.setdefault(str(changelog["issueId"]), []).extend(
+            changelog.get("changeHistories", [])
+        )
+
+
+def attach_changelogs(
+    raw_issues: list[dict[str, Any]], histories: dict[str, list[dict[str, Any]]]
+) -> None:
+    """Set the changelog of each issue in ``histories`` the way the search expands it."""
+    for raw_issue in raw_issues:
+        if str(raw_issue["id"]) in histories or needs_changelog(raw_issue):
+            raw_issue["changelog"] = {"histories": histories.get(str(raw_issue["id"]), [])}
+
+
+def missing_changelog_offsets(raw_issue: dict[str, Any]) -> list[int]:
+    """Get the offsets of the changelog pages a search left out of an issue.
+
+    Searches expanding the changelog return at most ``ISSUE_CHANGELOG_PAGE_SIZE``
+    history entries per issue, and report how many there are in ``total``.
+    """
+    changelog = raw_issue.get("changelog") or {}
+    received = len(changelog.get("histories", []))
+    start = changelog.get("startAt", 0) + received
+    return list(range(start, changelog.get("total", received), ISSUE_CHANGELOG_PAGE_SIZE))
+
+
+def merge_histories(raw_issue: dict[str, Any], histories: list[dict[str, Any]]) -> None:
+    """Add fetched history entries to an issue's changelog, skipping ones it already has."""
+    changelog = raw_issue["changelog"]
+    known_ids = {history.get("id") for history in changelog["histories"]}
+    changelog["histories"] = changelog["histories"] + [
+        history for history in histories if history.get("id") not in known_ids
+    ]
+    changelog["maxResults"] = changelog["total"] = len(changelog["histories"])
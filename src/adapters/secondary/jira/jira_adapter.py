@@ -6,23 +6,208 @@ handling the mapping between JIRA's data structures and our domain models.
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from itertools import chain, islice
 from typing import TYPE_CHECKING
 
-from src.adapters.secondary.jira.mappers import map_issue, map_project
+from src.adapters.secondary.jira.mappers import (
+    map_issue,
+    map_issue_json,
+    map_project,
+    map_record_json,
+)
+from src.adapters.secondary.jira.changelogs import (
+    BULK_CHANGELOG_PATH,
+    ISSUE_CHANGELOG_PAGE_SIZE,
+    ISSUE_CHANGELOG_PATH,
+    attach_changelogs,
+    changelog_requests,
+    collect_histories,
+    merge_histories,
+    missing_changelog_offsets,
+    needs_changelog,
+)
 from src.adapters.secondary.jira.models import (
+    FieldProfile,
+    FieldProjection,
     JiraPlanRequest,
     JiraPlanResponse,
     ProjectCategory,
     JiraFilter,
 )
+from src.adapters.secondary.jira.pagination import iter_token_pages
+from src.adapters.secondary.jira.request_scheduler import RequestScheduler, ScheduledHTTPAdapter
+from src.adapters.secondary.jira.sharding import (
+    DEFAULT_MAX_SHARD_SIZE,
+    SearchShard,
+    iter_sharded_results,
+    plan_shards,
+)
 import json
-from src.domain.models import CreateIssueRequest, Issue, IssueStatus, IssueType, Project
+from jira.exceptions import JIRAError
+from requests import RequestException
+from src.domain.models import (
+    CreateIssueRequest,
+    Issue,
+    IssueCreationResult,
+    IssueDeletionResult,
+    IssueStatus,
+    IssueType,
+    Project,
+    SearchMode,
+)
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from collections.abc import Iterable, Iterator
+    from datetime import date, datetime
+    from typing import Any
 
     from jira import JIRA
 
+    from src.adapters.secondary.jira.response_cache import ResponseCache
+
+PAGE_SIZE = 100  # 100 is the max batch size Jira will return results for
+KEY_BATCH_SIZE = PAGE_SIZE  # Keys per ``key in (...)`` search, so each is a single page
+BULK_CREATE_BATCH_SIZE = 50  # Most issues Jira creates in a single bulk request
+DEFAULT_MAX_WORKERS = 8
+ENGINEERING_WORK_TAXONOMY_FIELD = "customfield_11173"
+JIRA_FIELDS = [
+    "key",
+    "project",
+    "issuetype",
+    "resolutiondate",
+    "updated",
+    "status",
+    ENGINEERING_WORK_TAXONOMY_FIELD,
+    "summary",
+    "description",
+    "parent",
+    "issuelinks",
+]
+# Summaries and descriptions are the bulk of an issue's fields but unused by analytics
+FIELD_PROFILES = {
+    FieldProfile.ANALYTICS: FieldProjection(
+        fields=(
+            "key",
+            "project",
+            "issuetype",
+            "resolutiondate",
+            "updated",
+            "status",
+            ENGINEERING_WORK_TAXONOMY_FIELD,
+            "parent",
+            "issuelinks",
+        ),
+        lazy_changelog=True,
+    ),
+    FieldProfile.PLAN: FieldProjection(
+        fields=(
+            "key",
+            "project",
+            "issuetype",
+            "resolutiondate",
+            "updated",
+            "status",
+            "summary",
+            "parent",
+            "issuelinks",
+        ),
+    ),
+    FieldProfile.FULL: FieldProjection(fields=tuple(JIRA_FIELDS), expand="changelog"),
+}
+
+
+def build_taxonomy_jql(start_date: date, end_date: date, projects_keys: list[str]) -> str:
+    """Build the JQL selecting resolved work items of the given projects in a date window."""
+    return (
+        f"project in ({','.join(projects_keys)}) "
+        f'AND resolved >= "{start_date.strftime("%Y-%m-%d")}" '
+        f'AND resolved <= "{end_date.strftime("%Y-%m-%d")}" '
+        f"AND type not in ({IssueType.EPIC}, {IssueType.INITIATIVE}) "
+        f'AND status != "{IssueStatus.WONT_DO}" '
+        'AND project != "Core Connectivity Intake"'
+    )
+
+
+def build_keys_jql(issue_keys: Iterable[str]) -> str:
+    """Build the JQL selecting the issues with the given keys."""
+    return f"key in ({','.join(issue_keys)})"
+
+
+def build_project_jql(
+    project_key: str,
+    resolved_since: datetime | None = None,
+    updated_since: datetime | None = None,
+) -> str:
+    """Build the JQL selecting every issue of a project, optionally bounded by date."""
+    clauses = [f'project = "{project_key}"']
+    if resolved_since is not None:
+        clauses.append(f'resolved >= "{resolved_since.strftime("%Y-%m-%d")}"')
+    if updated_since is not None:
+        clauses.append(f'updated >= "{updated_since.strftime("%Y-%m-%d")}"')
+    return " AND ".join(clauses)
+
+
+def build_issue_fields(request: CreateIssueRequest) -> dict[str, Any]:
+    """Build the fields of an issue creation payload from a domain model request."""
+    return {
+        "project": {"key": request.project_key},
+        "summary": request.summary,
+        "description": request.description,
+        "issuetype": {"name": request.issue_type.value},
+        "duedate": request.date.strftime("%Y-%m-%d"),
+    }
+
+
+def parse_bulk_create_response(data: dict[str, Any], size: int) -> list[IssueCreationResult]:
+    """Map the body of a bulk issue creation to one result per submitted issue.
+
+    Jira lists the created issues in submission order and reports every failed issue
+    by its position in the request.
+
+    Args:
+        data: Decoded body of the bulk creation response
+        size: Number of issues submitted
+
+    Returns:
+        One result per submitted issue, with ``row`` counting from 1
+
+    """
+    errors = {
+        error["failedElementNumber"]: _format_element_errors(error.get("elementErrors", {}))
+        for error in data.get("errors", [])
+    }
+    created = iter(data.get("issues", []))
+    return [
+        IssueCreationResult(row=position + 1, error=errors[position])
+        if position in errors
+        else IssueCreationResult(row=position + 1, key=next(created)["key"])
+        for position in range(size)
+    ]
+
+
+def _format_element_errors(element_errors: dict[str, Any]) -> str:
+    """Join Jira's field errors and general error messages into a single line."""
+    messages = [f"{name}: {message}" for name, message in element_errors.get("errors", {}).items()]
+    messages += element_errors.get("errorMessages", [])
+    return "; ".join(messages) or "Issue was not created"
+
+
+def describe_request_error(error: Exception) -> str:
+    """Summarize a failed request on a single line."""
+    if isinstance(error, JIRAError):
+        return f"HTTP {error.status_code}: {error.text}"
+    return str(error)
+
+
+def _failed_batch(requests: list[CreateIssueRequest], error: str) -> list[IssueCreationResult]:
+    """Fail every issue of a bulk creation request with the same error."""
+    return [IssueCreationResult(row=row, error=error) for row in range(1, len(requests) + 1)]
+
 
 class JiraAdapter:
     """Adapter for interacting with JIRA API.
@@ -31,48 +216,165 @@ class JiraAdapter:
     and project management. Maps JIRA data structures to domain models.
     """
 
-    def __init__(self, jira: JIRA) -> None:
+    def __init__(
+        self,
+        jira: JIRA,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        scheduler: RequestScheduler | None = None,
+        max_shard_size: int = DEFAULT_MAX_SHARD_SIZE,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
         """Initialize the JIRA adapter.
 
+        Every request of the client's session, including the raw REST calls, is sent
+        through the request scheduler.
+
         Args:
             jira: Initialized JIRA client instance
+            max_workers: Maximum number of concurrent requests used by parallel searches
+            scheduler: Rate-limit-aware scheduler. Defaults to one allowing up to
+                ``max_workers`` requests in flight
+            max_shard_size: Approximate number of issues above which sharded searches
+                split a shard further
+            response_cache: Optional on-disk cache serving rarely changing requests
 
         """
         self.jira = jira
-        self.engineering_work_taxonomy = "customfield_11173"
-        self.jira_fields = [
-            "key",
-            "project",
-            "issuetype",
-            "resolutiondate",
-            "status",
-            self.engineering_work_taxonomy,
-            "changelog",
-            "summary",
-            "description",
-            "",
-        ]
+        self.server_url = jira.server_url
+        self.max_workers = max_workers
+        self.max_shard_size = max_shard_size
+        self.scheduler = scheduler or RequestScheduler(max_concurrency=max_workers)
+        self.response_cache = response_cache
+        # The client's own session, which it does not expose, so raw REST calls share
+        # its authentication and transport adapters
+        self.session = jira._session  # noqa: SLF001
+        self.session.mount(
+            self.server_url, ScheduledHTTPAdapter(self.scheduler, cache=response_cache)
+        )
+        self.engineering_work_taxonomy = ENGINEERING_WORK_TAXONOMY_FIELD
+        # Issues whose truncated changelog needed further pages, for run statistics
+        self.completed_changelogs = 0
+        self._completed_changelogs_lock = threading.Lock()
 
     def create_issue(self, request: CreateIssueRequest) -> Issue:
         """Create a new JIRA issue from a domain model request."""
-        fields = {
-            "project": request.project_key,
-            "summary": request.summary,
-            "description": request.description,
-            "issuetype": {"name": request.issue_type.value},
-            "duedate": request.date.strftime("%Y-%m-%d"),
-        }
-        jira_issue = self.jira.create_issue(fields=fields)
+        jira_issue = self.jira.create_issue(fields=build_issue_fields(request))
         return map_issue(jira_issue, self.engineering_work_taxonomy)
 
+    def create_issues(self, requests: list[CreateIssueRequest]) -> list[IssueCreationResult]:
+        """Create several issues through the bulk creation endpoint.
+
+        Issues are submitted ``BULK_CREATE_BATCH_SIZE`` per request, up to
+        ``max_workers`` requests at a time. A request that fails as a whole fails each
+        of its issues without affecting the other batches.
+
+        Args:
+            requests: Issues to create
+
+        Returns:
+            One result per request, in order, with ``row`` counting from 1
+
+        """
+        batches = [
+            requests[pos : pos + BULK_CREATE_BATCH_SIZE]
+            for pos in range(0, len(requests), BULK_CREATE_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            batch_results = list(pool.map(self._create_batch, batches))
+        return [
+            IssueCreationResult(row=row, key=result.key, error=result.error)
+            for row, result in enumerate(chain.from_iterable(batch_results), start=1)
+        ]
+
     def delete_issue(self, issue_id: str) -> None:
-        """Delete a JIRA issue."""
-        self.jira.issue(issue_id).delete()
+        """Delete a JIRA issue with a single request, without fetching it first."""
+        self.session.delete(f"{self.server_url}/rest/api/2/issue/{issue_id}")
+
+    def delete_issues(self, issue_keys: list[str]) -> list[IssueDeletionResult]:
+        """Delete several issues, up to ``max_workers`` at a time.
+
+        A failed deletion is reported in its result and does not stop the others.
+
+        Args:
+            issue_keys: Keys of the issues to delete
+
+        Returns:
+            One result per key, in order
+
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(self._try_delete_issue, issue_keys))
+
+    def iter_issue_records(self, jql: str, fields: list[str]) -> Iterator[list[dict[str, Any]]]:
+        """Yield flat records of the issues matching a JQL query, one page at a time.
+
+        Only the requested fields are fetched, and the next page is requested while the
+        caller handles the current one.
+
+        Args:
+            jql: Query selecting the issues
+            fields: Fields to fetch and put in each record, after the issue key
+
+        """
+        pages = iter_token_pages(
+            lambda token: self._search_token_page(jql, token, fields=["key", *fields])
+        )
+        for raw_issues in pages:
+            yield [map_record_json(raw_issue, fields) for raw_issue in raw_issues]
+
+    def search_issue_keys(self, jql: str) -> list[str]:
+        """Get the keys of the issues matching a JQL query, without any of their fields."""
+        pages = iter_token_pages(lambda token: self._search_token_page(jql, token, fields=["key"]))
+        return [raw_issue["key"] for page in pages for raw_issue in page]
 
     def get_issue(self, issue_id: str) -> Issue:
         """Get details of a specific issue."""
-        jira_issue = self.jira.issue(issue_id, expand="changelog")
-        return map_issue(jira_issue, self.engineering_work_taxonomy)
+        raw_issue = self.jira.issue(issue_id, expand="changelog").raw
+        self._complete_changelogs([raw_issue])
+        return map_issue_json(raw_issue, self.engineering_work_taxonomy)
+
+    def get_issues(
+        self, issue_keys: list[str], profile: FieldProfile = FieldProfile.PLAN
+    ) -> list[Issue]:
+        """Get the details of several issues with batched searches.
+
+        Keys are searched in batches of ``KEY_BATCH_SIZE``, up to ``max_workers``
+        batches at a time, instead of one request per issue.
+
+        Args:
+            issue_keys: Keys of the issues to get
+            profile: Fields to fetch. Defaults to those plans need
+
+        Returns:
+            The issues in the order of ``issue_keys``, skipping keys Jira did not return
+
+        """
+        unique_keys = list(dict.fromkeys(issue_keys))
+        batches = [
+            build_keys_jql(unique_keys[pos : pos + KEY_BATCH_SIZE])
+            for pos in range(0, len(unique_keys), KEY_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            raw_pages = pool.map(lambda jql: self._search_page(jql, 0, profile)["issues"], batches)
+            issues_by_key = {
+                issue.key: issue for issue in chain.from_iterable(self._map_pages(raw_pages))
+            }
+        return [issues_by_key[key] for key in unique_keys if key in issues_by_key]
+
+    def time_jql(self, jql: str) -> tuple[int, float]:
+        """Measure how long Jira takes to evaluate a JQL query.
+
+        Returns:
+            Jira's approximate count of the matching issues and the seconds it took
+
+        """
+        started = time.perf_counter()
+        count = self._count_issues(jql)
+        return count, time.perf_counter() - started
+
+    def get_server_info(self) -> dict[str, Any]:
+        """Get the server information, confirming the API is reachable."""
+        return self.jira.server_info()
 
     def get_core_connectivity_projects_keys(self) -> list[Project]:
         """Get list of all Core Connectivity projects."""
@@ -94,6 +396,8 @@ class JiraAdapter:
         start_date: datetime,
         end_date: datetime,
         projects: list[str] | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.ANALYTICS,
     ) -> list[Issue]:
         """Search for issues matching the given criteria.
 
@@ -101,22 +405,118 @@ class JiraAdapter:
             start_date: Start date for analysis
             end_date: End date for analysis
             projects: Optional list of specific projects to analyze
+            search_mode: How to page through the results. Defaults to parallel fetching
+            profile: Fields to fetch. Defaults to those analytics need
+
+        """
+        pages = self.iter_search_issue_pages(start_date, end_date, projects, search_mode, profile)
+        return list(chain.from_iterable(pages))
+
+    def iter_search_issue_pages(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        projects: list[str] | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.ANALYTICS,
+    ) -> Iterator[list[Issue]]:
+        """Yield the issues ``search_issues`` returns, one page at a time.
+
+        Args:
+            start_date: Start date for analysis
+            end_date: End date for analysis
+            projects: Optional list of specific projects to analyze
+            search_mode: How to page through the results. Defaults to parallel fetching
+            profile: Fields to fetch. Defaults to those analytics need
 
         """
         if projects is None:
             projects = self.get_core_connectivity_projects_keys()
-        projects_keys = ",".join([project.key for project in projects])
-
-        jql = (
-            f"project in ({projects_keys}) "
-            f'AND resolved >= "{start_date.strftime("%Y-%m-%d")}" '
-            f'AND resolved <= "{end_date.strftime("%Y-%m-%d")}" '
-            f"AND type not in ({IssueType.EPIC}, {IssueType.INITIATIVE}) "
-            f'AND status != "{IssueStatus.WONT_DO}" '
-            'AND project != "Core Connectivity Intake"'
+        projects_keys = [project.key for project in projects]
+        if search_mode == SearchMode.SHARDED:
+            return self._iter_sharded_pages(start_date, end_date, projects_keys, profile)
+        jql = build_taxonomy_jql(start_date, end_date, projects_keys)
+
+        return self.iter_issue_pages(jql, search_mode, profile)
+
+    def search_project_issues(
+        self,
+        project_key: str,
+        resolved_since: datetime | None = None,
+        updated_since: datetime | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.ANALYTICS,
+    ) -> list[Issue]:
+        """Search every issue of a project, optionally bounded by resolution or update date.
+
+        Unlike ``search_issues`` no type, status or resolution filters are applied, so
+        callers keeping a local copy also see issues that were reopened or re-categorised.
+
+        Args:
+            project_key: Key of the project to search
+            resolved_since: Only include issues resolved on or after this date
+            updated_since: Only include issues updated on or after this date
+            search_mode: How to page through the results. Defaults to parallel fetching
+            profile: Fields to fetch. Defaults to those analytics need
+
+        """
+        pages = self.iter_project_issue_pages(
+            project_key, resolved_since, updated_since, search_mode, profile
         )
+        return list(chain.from_iterable(pages))
+
+    def iter_project_issue_pages(
+        self,
+        project_key: str,
+        resolved_since: datetime | None = None,
+        updated_since: datetime | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.ANALYTICS,
+    ) -> Iterator[list[Issue]]:
+        """Yield the issues ``search_project_issues`` returns, one page at a time.
+
+        Args:
+            project_key: Key of the project to search
+            resolved_since: Only include issues resolved on or after this date
+            updated_since: Only include issues updated on or after this date
+            search_mode: How to page through the results. Defaults to parallel fetching
+            profile: Fields to fetch. Defaults to those analytics need
+
+        """
+        jql = build_project_jql(project_key, resolved_since, updated_since)
+        return self.iter_issue_pages(jql, search_mode, profile)
+
+    def iter_issue_pages(
+        self,
+        jql: str,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        profile: FieldProfile = FieldProfile.FULL,
+    ) -> Iterator[list[Issue]]:
+        """Yield the mapped issues matching a JQL query one page at a time.
+
+        Only a bounded number of pages is held at once, so memory use depends on the
+        page size rather than on the size of the result. Issues are de-duplicated by
+        key across pages, since results can shift while a search is running. With a
+        lazy-changelog profile, the status changelogs of each page's resolved issues
+        are fetched in bulk by the thread that fetched the page.
 
-        return self._fetch_issues(jql)
+        An arbitrary JQL query cannot be sharded, so ``SearchMode.SHARDED`` pages through
+        it like ``SearchMode.PARALLEL``.
+
+        Args:
+            jql: JQL query to run
+            search_mode: How to page through the results. Defaults to parallel fetching
+            profile: Fields to fetch. Defaults to every mapped field and the changelog
+
+        """
+        if search_mode == SearchMode.SERIAL:
+            raw_pages = self._iter_raw_pages_serial(jql, profile)
+        elif search_mode == SearchMode.TOKEN:
+            raw_pages = iter_token_pages(lambda token: self._search_token_page(jql, token, profile))
+        else:
+            raw_pages = self._iter_raw_pages_parallel(jql, profile)
+
+        return self._map_pages(raw_pages)
 
     def get_parent_issue(self, issue_id: str) -> str | None:
         """Get the parent issue (epic or initiative) of a given issue."""
@@ -143,8 +543,12 @@ class JiraAdapter:
     def get_account_id(self, email: str | None = None) -> str:
         """Get the account ID for a user from their email address."""
         if email is None:
-            return self.jira.current_user()
-        response = self.jira._session.get(
+            # The client is built without server info, so it cannot tell it talks to
+            # Jira Cloud and ``current_user`` would not return the account ID
+            response = self.session.get(f"{self.jira.server_url}/rest/api/3/myself")
+            response.raise_for_status()
+            return response.json()["accountId"]
+        response = self.session.get(
             f"{self.jira.server_url}/rest/api/3/user/search", params={"query": email}
         )
         response.raise_for_status()
@@ -155,16 +559,14 @@ class JiraAdapter:
 
     def get_project_id(self, project_key: str) -> int:
         """Get the numeric ID of a project from its key."""
-        response = self.jira._session.get(
-            f"{self.jira.server_url}/rest/api/3/project/{project_key}"
-        )
+        response = self.session.get(f"{self.jira.server_url}/rest/api/3/project/{project_key}")
         response.raise_for_status()
         data = response.json()
         return int(data["id"])
 
     def create_filter(self, name: str, jql: str, owner_account_id: str) -> JiraFilter:
         """Create a Jira Filter using the Jira API."""
-        response = self.jira._session.post(
+        response = self.session.post(
             f"{self.jira.server_url}/rest/api/3/filter",
             json={"name": name, "jql": jql, "sharePermissions": [{"type": "authenticated"}]},
         )
@@ -179,7 +581,7 @@ class JiraAdapter:
 
     def create_jira_plan(self, request: JiraPlanRequest) -> JiraPlanResponse:
         """Create a Jira Plan using the Jira API."""
-        response = self.jira._session.post(
+        response = self.session.post(
             f"{self.jira.server_url}/rest/api/3/plans/plan",
             json={
                 "name": request.name,
@@ -197,25 +599,224 @@ class JiraAdapter:
             id=plan_id, name=request.name, url=f"{self.jira.server_url}/jira/plans/{plan_id}"
         )
 
-    def _fetch_issues(self, jql: str) -> list[Issue]:
+    def _fetch_issues(self, jql: str, search_mode: SearchMode = SearchMode.PARALLEL) -> list[Issue]:
         """Fetch issues from Jira using the provided JQL query."""
+        return list(chain.from_iterable(self.iter_issue_pages(jql, search_mode)))
+
+    def _map_pages(self, raw_pages: Iterable[list[dict[str, Any]]]) -> Iterator[list[Issue]]:
+        """Map raw pages to issues, dropping issues already seen on an earlier page."""
+        seen_keys: set[str] = set()
+        for raw_issues in raw_pages:
+            page = []
+            for raw_issue in raw_issues:
+                if raw_issue["key"] not in seen_keys:
+                    seen_keys.add(raw_issue["key"])
+                    page.append(map_issue_json(raw_issue, self.engineering_work_taxonomy))
+            yield page
+
+    def _iter_sharded_pages(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        projects_keys: list[str],
+        profile: FieldProfile,
+    ) -> Iterator[list[Issue]]:
+        """Yield the issues of a taxonomy search one shard at a time.
+
+        The search is split by project and resolved-date window until each shard's
+        approximate count is at most ``max_shard_size``. Shards are fetched concurrently
+        and a shard failing with a request error is retried on its own.
+        """
+        shards = plan_shards(
+            projects_keys,
+            start_date.date(),
+            end_date.date(),
+            lambda shard: self._count_issues(self._shard_jql(shard)),
+            self.max_shard_size,
+            self.max_workers,
+        )
+        raw_pages = iter_sharded_results(
+            shards,
+            lambda shard: list(
+                chain.from_iterable(self._iter_raw_pages_serial(self._shard_jql(shard), profile))
+            ),
+            retry_on=(JIRAError, RequestException),
+            max_workers=self.max_workers,
+        )
+        return self._map_pages(raw_pages)
+
+    def _shard_jql(self, shard: SearchShard) -> str:
+        """Build the taxonomy JQL restricted to a shard."""
+        return build_taxonomy_jql(shard.start, shard.end, list(shard.project_keys))
+
+    def _create_batch(self, requests: list[CreateIssueRequest]) -> list[IssueCreationResult]:
+        """Submit one bulk creation request and map its outcome per issue."""
+        payload = {
+            "issueUpdates": [{"fields": build_issue_fields(request)} for request in requests]
+        }
+        try:
+            response = self.session.post(f"{self.server_url}/rest/api/2/issue/bulk", json=payload)
+            data = response.json()
+        except JIRAError as error:
+            # Jira answers 400 when none of the issues could be created, still listing why
+            if error.status_code != HTTPStatus.BAD_REQUEST or error.response is None:
+                return _failed_batch(requests, describe_request_error(error))
+            data = error.response.json()
+        except RequestException as error:
+            return _failed_batch(requests, describe_request_error(error))
+        return parse_bulk_create_response(data, len(requests))
+
+    def _try_delete_issue(self, issue_key: str) -> IssueDeletionResult:
+        """Delete an issue, reporting a failure instead of raising it."""
+        try:
+            self.delete_issue(issue_key)
+        except (JIRAError, RequestException) as error:
+            return IssueDeletionResult(issue_key, error=describe_request_error(error))
+        return IssueDeletionResult(issue_key)
+
+    def _count_issues(self, jql: str) -> int:
+        """Get Jira's approximate count of the issues matching a JQL query."""
+        response = self.session.post(
+            f"{self.jira.server_url}/rest/api/3/search/approximate-count", json={"jql": jql}
+        )
+        response.raise_for_status()
+        return response.json()["count"]
+
+    def _iter_raw_pages_serial(
+        self, jql: str, profile: FieldProfile
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield raw pages one after another until Jira returns an empty page."""
         pos = 0
-        batch = 100  # 100 is the max batch size Jira will return results for
-        issues_all = []
 
         while True:
-            issues_batch = self.jira.search_issues(
-                jql,
-                startAt=pos,
-                maxResults=batch,
-                fields=self.jira_fields,
-                expand="changelog",
-            )
-            if issues_batch == []:
+            raw_issues = self._search_page(jql, pos, profile)["issues"]
+            if raw_issues == []:
                 break
-            issues_all.extend(
-                map_issue(issue, self.engineering_work_taxonomy) for issue in issues_batch
+            yield raw_issues
+            pos += len(raw_issues)
+
+    def _iter_raw_pages_parallel(
+        self, jql: str, profile: FieldProfile
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield raw pages in offset order while fetching the following ones concurrently.
+
+        The total reported by the first page determines the remaining offsets. At most
+        ``max_workers`` pages are requested ahead of the one being consumed, which bounds
+        both the number of concurrent requests and the number of pages held in memory.
+        """
+        first_page = self._search_page(jql, 0, profile)
+        page_size = len(first_page["issues"])
+        if page_size == 0:
+            return
+
+        offsets = iter(range(page_size, first_page["total"], page_size))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = deque(
+                pool.submit(self._search_page, jql, pos, profile)
+                for pos in islice(offsets, self.max_workers)
             )
-            pos += len(issues_batch)
+            yield first_page["issues"]
+            while pending:
+                page = pending.popleft().result()
+                next_pos = next(offsets, None)
+                if next_pos is not None:
+                    pending.append(pool.submit(self._search_page, jql, next_pos, profile))
+                yield page["issues"]
+
+    def _search_token_page(
+        self,
+        jql: str,
+        next_page_token: str | None,
+        profile: FieldProfile = FieldProfile.FULL,
+        fields: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Fetch a single page from the enhanced JQL search endpoint.
+
+        Pages carry the profile's fields and expansions unless ``fields`` names others.
+        """
+        projection = FIELD_PROFILES[profile]
+        payload: dict[str, Any] = {"jql": jql, "maxResults": PAGE_SIZE}
+        if fields is not None:
+            payload["fields"] = fields
+        else:
+            payload["fields"] = list(projection.fields)
+            if projection.expand:
+                payload["expand"] = projection.expand
+        if next_page_token:
+            payload["nextPageToken"] = next_page_token
+        response = self.session.post(f"{self.jira.server_url}/rest/api/2/search/jql", json=payload)
+        response.raise_for_status()
+        page = response.json()
+        if fields is None and projection.lazy_changelog:
+            self._attach_changelogs(page.get("issues", []))
+        self._complete_changelogs(page.get("issues", []))
+        return page
+
+    def _search_page(
+        self, jql: str, start_at: int, profile: FieldProfile = FieldProfile.FULL
+    ) -> dict[str, Any]:
+        """Fetch a single page of search results starting at the given offset.
+
+        Results are requested as decoded JSON so they can be mapped without
+        building ``jira.resources`` objects.
+        """
+        projection = FIELD_PROFILES[profile]
+        page = self.jira.search_issues(
+            jql,
+            startAt=start_at,
+            maxResults=PAGE_SIZE,
+            fields=list(projection.fields),
+            expand=projection.expand,
+            json_result=True,
+        )
+        if projection.lazy_changelog:
+            self._attach_changelogs(page["issues"])
+        self._complete_changelogs(page["issues"])
+        return page
+
+    def _attach_changelogs(self, raw_issues: list[dict[str, Any]]) -> None:
+        """Fetch the status changelogs of the resolved issues in bulk and attach them."""
+        issue_ids = [str(raw_issue["id"]) for raw_issue in raw_issues if needs_changelog(raw_issue)]
+        histories: dict[str, list[dict[str, Any]]] = {}
+        for payload in changelog_requests(issue_ids):
+            histories.update(collect_histories(self._post_changelog_page, payload))
+        attach_changelogs(raw_issues, histories)
+
+    def _complete_changelogs(self, raw_issues: list[dict[str, Any]]) -> None:
+        """Fetch the histories left out of truncated changelogs and merge them in.
+
+        Every missing page of every truncated changelog is requested at once, up to
+        ``max_workers`` at a time. Issues with complete changelogs cost no request.
+        """
+        missing = [
+            (raw_issue["key"], start_at)
+            for raw_issue in raw_issues
+            for start_at in missing_changelog_offsets(raw_issue)
+        ]
+        if not missing:
+            return
+        histories: dict[str, list[dict[str, Any]]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pages = pool.map(lambda page: self._get_changelog_page(*page), missing)
+            for (key, _), values in zip(missing, pages, strict=True):
+                histories.setdefault(key, []).extend(values)
+        for raw_issue in raw_issues:
+            if raw_issue["key"] in histories:
+                merge_histories(raw_issue, histories[raw_issue["key"]])
+        with self._completed_changelogs_lock:
+            self.completed_changelogs += len(histories)
+
+    def _get_changelog_page(self, key: str, start_at: int) -> list[dict[str, Any]]:
+        """Fetch the histories of one page of an issue's changelog."""
+        response = self.session.get(
+            f"{self.jira.server_url}{ISSUE_CHANGELOG_PATH.format(key=key)}",
+            params={"startAt": start_at, "maxResults": ISSUE_CHANGELOG_PAGE_SIZE},
+        )
+        response.raise_for_status()
+        return response.json()["values"]
 
-        return issues_all
+    def _post_changelog_page(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Fetch one page of the bulk changelog endpoint."""
+        response = self.session.post(f"{self.jira.server_url}{BULK_CHANGELOG_PATH}", json=payload)
+        response.raise_for_status()
+        return response.json()
@@ -1,15 +1,102 @@
-from jira import JIRA
-from src.adapters.secondary.jira.jira_adapter import JiraAdapter
-from src.lib.configuration import Settings
+"""Lazily built, process-wide JIRA adapter and its collaborators.
 
-_settings = Settings()
-_jira = JIRA(
-    server=_settings.jira_server,
-    basic_auth=(_settings.jira_user_email, _settings.jira_api_key),
-)
-_adapter = JiraAdapter(_jira)
+Nothing is configured or imported until first use, so CLI commands that never talk to
+JIRA (or ``--help``) neither read the settings nor load the jira client.
+"""
 
+from __future__ import annotations
 
+import atexit
+from functools import cache
+from typing import TYPE_CHECKING
+
+from src.adapters.secondary.jira.models import AdapterBackend
+
+if TYPE_CHECKING:
+    from src.adapters.secondary.jira.jira_adapter import JiraAdapter
+    from src.adapters.secondary.jira.response_cache import ResponseCache
+    from src.lib.configuration import Settings
+
+# Set by disable_response_cache, read when the response cache is created
+_response_cache_options = {"enabled": True}
+
+
+@cache
+def settings() -> Settings:
+    """Return the settings, read from the environment on first use."""
+    from src.lib.configuration import Settings
+
+    return Settings()
+
+
+def disable_response_cache() -> None:
+    """Bypass the response cache, whether or not it has been created yet."""
+    _response_cache_options["enabled"] = False
+    if response_cache.cache_info().currsize:
+        response_cache().enabled = False
+
+
+@cache
+def response_cache() -> ResponseCache:
+    """Return the response cache shared by the configured adapter."""
+    from src.adapters.secondary.jira.response_cache import ResponseCache
+
+    _settings = settings()
+    _response_cache = ResponseCache(
+        _settings.cache_dir / "http_cache.sqlite3",
+        max_bytes=_settings.jira_http_cache_max_mb * 1024 * 1024,
+    )
+    _response_cache.enabled = _response_cache_options["enabled"]
+    # Adds the run's hit and miss counts to the lifetime totals
+    atexit.register(_response_cache.close)
+    return _response_cache
+
+
+@cache
 def create() -> JiraAdapter:
-    """Create and return a configured JiraAdapter instance."""
-    return _adapter
+    """Create and return the configured JiraAdapter instance, building it on first use."""
+    from src.adapters.secondary.jira.request_scheduler import RequestScheduler
+
+    _settings = settings()
+    scheduler = RequestScheduler(
+        requests_per_second=_settings.jira_requests_per_second,
+        max_concurrency=_settings.jira_max_workers,
+    )
+    if _settings.jira_adapter_backend == AdapterBackend.ASYNC:
+        from src.adapters.secondary.jira.async_jira_adapter import (
+            AsyncAdapterRunner,
+            AsyncJiraAdapter,
+        )
+
+        runner = AsyncAdapterRunner(
+            AsyncJiraAdapter(
+                _settings.jira_server,
+                _settings.jira_user_email,
+                _settings.jira_api_key,
+                max_connections=_settings.jira_max_workers,
+                scheduler=scheduler,
+            )
+        )
+        # Closes the pooled connections and stops the runner's event loop thread
+        atexit.register(runner.close)
+        return runner
+
+    from jira import JIRA
+
+    from src.adapters.secondary.jira.jira_adapter import JiraAdapter
+
+    # Throttled requests are retried by the scheduler, not by the jira library. Skipping
+    # the server info lookup saves a round trip every time the client is built.
+    _jira = JIRA(
+        server=_settings.jira_server,
+        basic_auth=(_settings.jira_user_email, _settings.jira_api_key),
+        max_retries=0,
+        get_server_info=False,
+    )
+    return JiraAdapter(
+        _jira,
+        max_workers=_settings.jira_max_workers,
+        scheduler=scheduler,
+        max_shard_size=_settings.jira_shard_max_issues,
+        response_cache=response_cache(),
+    )
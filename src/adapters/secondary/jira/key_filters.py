@@ -0,0 +1,123 @@
+"""Compact JQL for large sets of issue keys.
+
+A plan over thousands of issues cannot be a single ``key in (...)`` filter: the JQL
+outgrows what Jira accepts for a filter and gets slow to evaluate. ``build_key_filter_jqls``
+collapses runs of consecutive keys of a project into key ranges and spreads the
+resulting clauses over as many JQL strings as needed to keep each below a length bound.
+``build_key_jql`` renders the same clauses as one JQL string, for display.
+"""
+
+from __future__ import annotations
+
+import re
+from itertools import groupby
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+DEFAULT_MAX_FILTER_JQL_LENGTH = 4000
+MIN_RANGE_LENGTH = 3  # Shorter runs are cheaper to list than to spell out as a range
+
+_KEY_PATTERN = re.compile(r"([A-Z][A-Z0-9_]*)-(\d+)")
+
+
+def compact_key_clauses(issue_keys: Iterable[str]) -> list[str]:
+    """Turn issue keys into JQL clauses, using ranges for runs of consecutive keys.
+
+    Every issue with a key inside a range is in ``issue_keys``, so the clauses select
+    exactly the given issues.
+
+    Args:
+        issue_keys: Keys of the issues to select
+
+    Returns:
+        Range clauses, followed by the remaining keys as single-key clauses
+
+    """
+    by_project: dict[str, set[int]] = {}
+    other_keys = []
+    for key in dict.fromkeys(issue_keys):
+        match = _KEY_PATTERN.fullmatch(key)
+        if match is None:
+            other_keys.append(key)
+        else:
+            by_project.setdefault(match[1], set()).add(int(match[2]))
+
+    ranges = []
+    single_keys = []
+    for project, numbers in by_project.items():
+        ordered = sorted(numbers)
+        # Consecutive numbers share the same difference to their position
+        for _, run in groupby(enumerate(ordered), lambda pair: pair[1] - pair[0]):
+            run_numbers = [number for _, number in run]
+            if len(run_numbers) >= MIN_RANGE_LENGTH:
+                ranges.append(
+                    f"(project = {project} AND key >= {project}-{run_numbers[0]} "
+                    f"AND key <= {project}-{run_numbers[-1]})"
+                )
+            else:
+                single_keys.extend(f"{project}-{number}" for number in run_numbers)
+    return ranges + single_keys + other_keys
+
+
+def build_key_filter_jqls(
+    issue_keys: Iterable[str], max_length: int = DEFAULT_MAX_FILTER_JQL_LENGTH
+) -> list[str]:
+    """Build JQL strings that together select exactly the given issues.
+
+    Args:
+        issue_keys: Keys of the issues to select
+        max_length: Length each JQL string should stay within. A single clause longer
+            than this still gets a JQL string of its own
+
+    Returns:
+        JQL strings, each either a ``key in (...)`` list, range clauses, or both
+
+    """
+    jqls = []
+    ranges: list[str] = []
+    keys: list[str] = []
+
+    for clause in compact_key_clauses(issue_keys):
+        is_range = clause.startswith("(")
+        new_ranges = [*ranges, clause] if is_range else ranges
+        new_keys = keys if is_range else [*keys, clause]
+        if _rendered_length(new_ranges, new_keys) > max_length and (ranges or keys):
+            jqls.append(_render(ranges, keys))
+            new_ranges = [clause] if is_range else []
+            new_keys = [] if is_range else [clause]
+        ranges, keys = new_ranges, new_keys
+    if ranges or keys:
+        jqls.append(_render(ranges, keys))
+    return jqls
+
+
+def build_key_jql(issue_keys: Iterable[str]) -> str:
+    """Build a single JQL string selecting exactly the given issues, however many.
+
+    Args:
+        issue_keys: Keys of the issues to select
+
+    Returns:
+        A ``key in (...)`` list of the keys outside of runs, OR-ed with the range clauses
+
+    """
+    clauses = compact_key_clauses(issue_keys)
+    return _render(
+        [clause for clause in clauses if clause.startswith("(")],
+        [clause for clause in clauses if not clause.startswith("(")],
+    )
+
+
+def _render(ranges: list[str], keys: list[str]) -> str:
+    """Join a key list and range clauses into one JQL string."""
+    clauses = ([f"key in ({','.join(keys)})"] if keys else []) + ranges
+    return " OR ".join(clauses)
+
+
+def _rendered_length(ranges: list[str], keys: list[str]) -> int:
+    """Get the length ``_render`` would produce, without building the string."""
+    clauses = len(ranges) + (1 if keys else 0)
+    keys_length = len("key in ()") + sum(map(len, keys)) + len(keys) - 1 if keys else 0
+    return keys_length + sum(map(len, ranges)) + len(" OR ") * (clauses - 1)
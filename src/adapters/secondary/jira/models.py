@@ -1,15 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Dict, List, Optional, Union
-from pydantic import BaseModel
+
 
 @dataclass
 class JiraFilter:
     """Model for a Jira Filter."""
+
     id: str
     name: str
     jql: str
     owner_account_id: str
+    issue_count: int | None = None  # Issues matched when the filter was created
+    evaluation_seconds: float | None = None  # Time Jira took to evaluate the JQL
 
 
 class ProjectCategory(StrEnum):
@@ -18,17 +20,41 @@ class ProjectCategory(StrEnum):
     CORE_CONNECTIVITY = "10002"
 
 
+class AdapterBackend(StrEnum):
+    """Available implementations of the JIRA adapter."""
+
+    SYNC = "sync"  # JiraAdapter on top of the synchronous jira library
+    ASYNC = "async"  # AsyncJiraAdapter on a pooled httpx client, run through AsyncAdapterRunner
+
+
+class FieldProfile(StrEnum):
+    """Named sets of the fields and expansions a search asks Jira for."""
+
+    ANALYTICS = "analytics"  # What analytics and the issue store need, changelogs fetched lazily
+    PLAN = "plan"  # What plans list and traverse, without changelogs
+    FULL = "full"  # Every mapped field, with the changelog expanded inline
+
+
+@dataclass(frozen=True)
+class FieldProjection:
+    """Fields and expansions requested by the searches of a field profile."""
+
+    fields: tuple[str, ...]
+    expand: str | None = None
+    lazy_changelog: bool = False  # Fetch status changelogs in bulk for resolved issues
+
+
 @dataclass
 class JiraPlanRequest:
     """Request model for creating a Jira Plan."""
 
     name: str
-    issue_sources: List[Dict[str, str]]  # List of issue sources (projects, boards)
-    scheduling: Dict[str, object]  # Scheduling configuration
+    issue_sources: list[dict[str, str]]  # List of issue sources (projects, boards)
+    scheduling: dict[str, object]  # Scheduling configuration
     lead_account_id: str
-    permissions: List[Dict[str, object]]  # List of permission settings
-    exclusion_rules: Optional[Dict[str, object]] = None  # Optional exclusion rules
-    custom_fields: Optional[List[Dict[str, object]]] = None  # Optional custom fields
+    permissions: list[dict[str, object]]  # List of permission settings
+    exclusion_rules: dict[str, object] | None = None  # Optional exclusion rules
+    custom_fields: list[dict[str, object]] | None = None  # Optional custom fields
 
 
 @dataclass
@@ -38,3 +64,4 @@ class JiraPlanResponse:
     id: str
     name: str
     url: str
+    filters: list[JiraFilter] = field(default_factory=list)  # Issue sources of the plan
@@ -0,0 +1,39 @@
+"""Pagination helpers for Jira's ``nextPageToken`` based search endpoints.
+
+The enhanced JQL search API hands out an opaque ``nextPageToken`` with every page and
+flags the final page with ``isLast``. The helpers here walk such an endpoint while
+overlapping the network round trip for the next page with processing of the current one.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+Page = dict[str, Any]
+
+
+def iter_token_pages(fetch_page: Callable[[str | None], Page]) -> Iterator[list[dict[str, Any]]]:
+    """Yield the issues of each page returned by a ``nextPageToken`` endpoint.
+
+    Page N+1 is requested on a background thread as soon as page N arrives, so the
+    caller's work on page N overlaps the next round trip. Paging stops on ``isLast``
+    (or a missing token) instead of requesting a trailing empty page.
+
+    Args:
+        fetch_page: Callable requesting a single page for the given token, ``None``
+            requesting the first page
+
+    """
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        pending: Future[Page] | None = prefetcher.submit(fetch_page, None)
+        while pending is not None:
+            page = pending.result()
+            token = page.get("nextPageToken")
+            pending = None
+            if token and not page.get("isLast", False):
+                pending = prefetcher.submit(fetch_page, token)
+            yield page.get("issues", [])
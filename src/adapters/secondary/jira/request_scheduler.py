@@ -0,0 +1,347 @@
+"""Rate-limit-aware scheduling of requests to the JIRA API.
+
+Every request made by the adapters goes through a ``RequestScheduler``, which combines:
+
+- a token bucket capping the steady request rate while allowing short bursts,
+- an AIMD concurrency limit that grows by one slot per round of successful requests
+  and is halved whenever JIRA throttles us,
+- retries of throttled requests that honor ``Retry-After`` and ``X-RateLimit-Reset``,
+  falling back to exponential backoff with full jitter.
+
+The synchronous ``JiraAdapter`` plugs it into its ``requests`` session through
+``ScheduledHTTPAdapter``, which also serves cacheable requests from a ``ResponseCache``;
+``AsyncJiraAdapter`` awaits ``RequestScheduler.asend``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping
+
+    import requests
+
+    from src.adapters.secondary.jira.response_cache import CachedResponse, ResponseCache
+
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+DEFAULT_BURST = 20
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_RETRIES = 5
+_SLOT_POLL_SECONDS = 0.01
+
+
+class _Response(Protocol):
+    """The parts of a ``requests`` or ``httpx`` response the scheduler inspects."""
+
+    status_code: int
+    headers: Mapping[str, str]
+
+
+R = TypeVar("R", bound=_Response)
+
+
+@dataclass
+class SchedulerStats:
+    """Counters describing how requests were scheduled during a run."""
+
+    requests: int = 0
+    retries: int = 0
+    throttle_events: int = 0
+    wait_seconds: float = 0.0  # Time spent waiting for tokens, slots or backoff
+    peak_in_flight: int = 0
+    concurrency_limit: float = 0.0
+
+    def summary(self) -> str:
+        """Render the stats as a single human-readable line."""
+        return (
+            f"requests={self.requests} retries={self.retries} "
+            f"throttled={self.throttle_events} waited={self.wait_seconds:.1f}s "
+            f"peak_in_flight={self.peak_in_flight} "
+            f"concurrency_limit={self.concurrency_limit:.1f}"
+        )
+
+
+class RequestScheduler:
+    """Token bucket plus AIMD concurrency limit shared by every request of a run."""
+
+    def __init__(  # noqa: PLR0913 - one parameter per tuning knob
+        self,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        min_concurrency: int = 1,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base_seconds: float = 1.0,
+        backoff_cap_seconds: float = 60.0,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            requests_per_second: Steady-state rate at which tokens are refilled
+            burst: Maximum number of tokens, i.e. requests that may start back to back
+            max_concurrency: Upper bound of the adaptive concurrency limit
+            min_concurrency: Lower bound of the adaptive concurrency limit
+            max_retries: Retries of a throttled request before its response is returned
+            backoff_base_seconds: Base delay of the exponential backoff
+            backoff_cap_seconds: Maximum delay of the exponential backoff
+
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_cap_seconds = backoff_cap_seconds
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self._limit = float(max(min_concurrency, max_concurrency // 2))
+        self.stats = SchedulerStats(concurrency_limit=self._limit)
+
+    def send(self, send_request: Callable[[], requests.Response]) -> requests.Response:
+        """Send a request through the scheduler, retrying while it is throttled.
+
+        Args:
+            send_request: Callable performing the HTTP request once
+
+        Returns:
+            The first non-throttled response, or the last response once retries run out
+
+        """
+        for attempt in range(self.max_retries + 1):
+            while (delay := self._try_acquire()) > 0:
+                self._record_wait(delay)
+                time.sleep(delay)
+            try:
+                response = send_request()
+            finally:
+                self._release()
+            delay = self._on_response(response, attempt)
+            if delay is None:
+                return response
+            response.close()
+            self._record_wait(delay)
+            time.sleep(delay)
+        return response
+
+    async def asend(self, send_request: Callable[[], Awaitable[R]]) -> R:
+        """Send a request from a coroutine, retrying while it is throttled.
+
+        Args:
+            send_request: Callable returning an awaitable that performs the request once
+
+        Returns:
+            The first non-throttled response, or the last response once retries run out
+
+        """
+        for attempt in range(self.max_retries + 1):
+            while (delay := self._try_acquire()) > 0:
+                self._record_wait(delay)
+                await asyncio.sleep(delay)
+            try:
+                response = await send_request()
+            finally:
+                self._release()
+            delay = self._on_response(response, attempt)
+            if delay is None:
+                return response
+            self._record_wait(delay)
+            await asyncio.sleep(delay)
+        return response
+
+    def _try_acquire(self) -> float:
+        """Take a token and a concurrency slot, or return how long to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._refilled_at) * self.requests_per_second
+            )
+            self._refilled_at = now
+            if self._in_flight >= int(self._limit):
+                return _SLOT_POLL_SECONDS
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.requests_per_second
+
+            self._tokens -= 1
+            self._in_flight += 1
+            self.stats.requests += 1
+            self.stats.peak_in_flight = max(self.stats.peak_in_flight, self._in_flight)
+            return 0.0
+
+    def _release(self) -> None:
+        """Give back a concurrency slot."""
+        with self._lock:
+            self._in_flight -= 1
+
+    def _record_wait(self, seconds: float) -> None:
+        """Add to the time spent waiting."""
+        with self._lock:
+            self.stats.wait_seconds += seconds
+
+    def _on_response(self, response: _Response, attempt: int) -> float | None:
+        """Adapt the concurrency limit to a response.
+
+        Returns:
+            How long to wait before retrying, or None if the response is final
+
+        """
+        with self._lock:
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                if response.headers.get("X-RateLimit-NearLimit", "").lower() != "true":
+                    self._limit = min(self.max_concurrency, self._limit + 1 / self._limit)
+                    self.stats.concurrency_limit = self._limit
+                return None
+
+            self.stats.throttle_events += 1
+            self._limit = max(self.min_concurrency, self._limit / 2)
+            self.stats.concurrency_limit = self._limit
+            if attempt >= self.max_retries:
+                return None
+
+            self.stats.retries += 1
+            delay = _server_delay(response.headers)
+            if delay is None:
+                backoff = min(self.backoff_cap_seconds, self.backoff_base_seconds * 2**attempt)
+                delay = random.uniform(0, backoff)  # noqa: S311 - jitter, not cryptography
+            else:
+                # Spread out the retries of requests that were throttled together
+                delay += random.uniform(0, min(1.0, delay / 10))  # noqa: S311
+            # Hold back every other request too until the server is ready again
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            return delay
+
+
+def _server_delay(headers: Mapping[str, str]) -> float | None:
+    """Get the delay the server asked for via ``Retry-After`` or ``X-RateLimit-Reset``."""
+    delays = []
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            delays.append(float(retry_after))
+        except ValueError:
+            retry_at = parsedate_to_datetime(retry_after)  # HTTP-date form
+            delays.append((retry_at - datetime.now(UTC)).total_seconds())
+
+    reset = headers.get("X-RateLimit-Reset")
+    if reset and headers.get("X-RateLimit-Remaining", "1") == "0":
+        try:
+            reset_at = datetime.fromisoformat(reset)
+        except ValueError:
+            reset_at = None
+        if reset_at is not None:
+            if reset_at.tzinfo is None:
+                reset_at = reset_at.replace(tzinfo=UTC)
+            delays.append((reset_at - datetime.now(UTC)).total_seconds())
+
+    return max((max(delay, 0.0) for delay in delays), default=None)
+
+
+class ScheduledHTTPAdapter(HTTPAdapter):
+    """``requests`` transport adapter sending every request through a scheduler.
+
+    When given a response cache, fresh cached responses are returned without sending
+    the request, and expired ones are revalidated with a conditional request.
+    """
+
+    def __init__(
+        self,
+        scheduler: RequestScheduler,
+        cache: ResponseCache | None = None,
+        **kwargs: Any,  # noqa: ANN401 - passed on to HTTPAdapter
+    ) -> None:
+        """Initialize the transport adapter.
+
+        Args:
+            scheduler: Scheduler every request is sent through
+            cache: Optional cache of responses to rarely changing requests
+            kwargs: Passed on to ``HTTPAdapter``
+
+        """
+        kwargs.setdefault("pool_maxsize", scheduler.max_concurrency)
+        super().__init__(**kwargs)
+        self.scheduler = scheduler
+        self.cache = cache
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        **kwargs: Any,  # noqa: ANN401 - passed on to HTTPAdapter.send
+    ) -> requests.Response:
+        """Send the request once the scheduler admits it, retrying throttled responses."""
+        send_once = super().send
+        if self.cache is None:
+            return self.scheduler.send(lambda: send_once(request, **kwargs))
+
+        ttl = self.cache.ttl_for(request.method, request.url)
+        if ttl is None:
+            response = self.scheduler.send(lambda: send_once(request, **kwargs))
+            if request.method != "GET" and response.ok:
+                self.cache.invalidate(request.url)
+            return response
+
+        key = self.cache.cache_key(
+            request.method, request.url, request.headers.get("Authorization")
+        )
+        cached = self.cache.get(key)
+        if cached is not None and time.time() - cached.stored_at < ttl:
+            self.cache.stats.hits += 1
+            return self._build_cached_response(request, cached)
+
+        if cached is not None:
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+        response = self.scheduler.send(lambda: send_once(request, **kwargs))
+        if cached is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            response.close()
+            self.cache.refresh(key, response.headers)
+            self.cache.stats.revalidated += 1
+            return self._build_cached_response(request, cached)
+
+        self.cache.stats.misses += 1
+        # Entries that expire immediately are only worth keeping if they can be revalidated
+        revalidatable = "ETag" in response.headers or "Last-Modified" in response.headers
+        if response.status_code == HTTPStatus.OK and (ttl or revalidatable):
+            self.cache.put(
+                key,
+                request.method,
+                request.url,
+                response.status_code,
+                response.headers,
+                response.content,
+            )
+        return response
+
+    def _build_cached_response(
+        self, request: requests.PreparedRequest, cached: CachedResponse
+    ) -> requests.Response:
+        """Build a response to the request from a cached one."""
+        raw = HTTPResponse(
+            body=io.BytesIO(cached.body),
+            headers=cached.headers,
+            status=cached.status_code,
+            preload_content=False,
+        )
+        return self.build_response(request, raw)
@@ -0,0 +1,302 @@
+"""On-disk cache of JIRA API responses that rarely change.
+
+Issues, projects and user lookups are fetched again by every CLI run although they
+barely change between runs. ``ResponseCache`` keeps successful ``GET`` responses of
+those endpoints in SQLite:
+
+- entries are keyed by method, normalized URL (query parameters sorted) and a digest
+  of the credentials, so different users never share entries,
+- each endpoint has its own time to live, and endpoints without one are never cached,
+- issues are edited too often to be served without asking JIRA: their time to live is
+  zero, so every use revalidates them, and ``PUT`` or ``DELETE`` requests to a path
+  drop its entries,
+- expired entries carrying an ``ETag`` or ``Last-Modified`` header are revalidated
+  with a conditional request instead of being downloaded again,
+- the least recently used entries are evicted once the cache exceeds its size bound.
+
+``ScheduledHTTPAdapter`` consults the cache before a request is scheduled, so hits
+cost neither a rate-limit token nor a round trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+MINUTE = 60
+DAY = 24 * 60 * MINUTE
+
+# Time to live per endpoint, matched against the URL path
+DEFAULT_TTLS: tuple[tuple[str, float], ...] = (
+    # get_issue, parents and issue links, always revalidated with their ETag
+    (r"/rest/api/\d+/issue/[^/]+", 0),
+    (r"/rest/api/\d+/project", DAY),  # jira.projects()
+    (r"/rest/api/\d+/project/[^/]+", DAY),  # get_project_id
+    (r"/rest/api/\d+/myself", DAY),  # current_user
+    (r"/rest/api/\d+/user/search", DAY),  # get_account_id
+)
+
+# Describe the transfer of the original body, not the decoded body that is stored
+_TRANSFER_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    path TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_path ON responses (path);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how requests were served by the cache."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0  # Expired entries confirmed unchanged by a 304 response
+    stores: int = 0
+    evictions: int = 0
+
+    def summary(self) -> str:
+        """Render the stats as a single human-readable line."""
+        return (
+            f"hits={self.hits} misses={self.misses} revalidated={self.revalidated} "
+            f"stores={self.stores} evictions={self.evictions}"
+        )
+
+
+@dataclass
+class CachedResponse:
+    """A stored response together with when it was stored."""
+
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        """Get the entity tag the server sent with the response."""
+        return _header(self.headers, "ETag")
+
+    @property
+    def last_modified(self) -> str | None:
+        """Get the modification date the server sent with the response."""
+        return _header(self.headers, "Last-Modified")
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    """Look up a header case-insensitively."""
+    return next((value for key, value in headers.items() if key.lower() == name.lower()), None)
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL so equivalent requests share a cache entry."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+
+class ResponseCache:
+    """SQLite-backed response cache with per-endpoint TTLs and LRU eviction."""
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: tuple[tuple[str, float], ...] = DEFAULT_TTLS,
+    ) -> None:
+        """Open (and create if needed) the cache at the given path.
+
+        Args:
+            path: Location of the SQLite database file
+            max_bytes: Total size of the stored bodies above which entries are evicted
+            ttls: Pairs of URL path pattern and time to live in seconds
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared by the threads of parallel searches, serialized by the lock
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self.max_bytes = max_bytes
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls]
+        self.enabled = True
+        self.stats = CacheStats()
+
+    def close(self) -> None:
+        """Add this run's stats to the lifetime totals and close the database."""
+        with self._lock, self._connection:
+            for field in fields(CacheStats):
+                self._connection.execute(
+                    "INSERT INTO counters (name, value) VALUES (?, ?) "
+                    "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+                    (field.name, getattr(self.stats, field.name)),
+                )
+        self.stats = CacheStats()
+        self._connection.close()
+
+    def ttl_for(self, method: str, url: str) -> float | None:
+        """Get the time to live of a request's response, or None if it is not cacheable."""
+        if not self.enabled or method.upper() != "GET":
+            return None
+        path = urlsplit(url).path
+        return next((ttl for pattern, ttl in self.ttls if pattern.fullmatch(path)), None)
+
+    def cache_key(self, method: str, url: str, credentials: str | None) -> str:
+        """Build the key of a request from its method, normalized URL and credentials."""
+        digest = hashlib.sha256(f"{method.upper()} {normalize_url(url)}".encode())
+        digest.update((credentials or "").encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get a stored response, marking it as recently used."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT status_code, headers, body, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return CachedResponse(row[0], json.loads(row[1]), row[2], row[3])
+
+    def put(  # noqa: PLR0913 - the cache key plus the parts of the response it keeps
+        self,
+        key: str,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> None:
+        """Store a response and evict least recently used entries beyond the size bound."""
+        stored_headers = {
+            name: value for name, value in headers.items() if name.lower() not in _TRANSFER_HEADERS
+        }
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    method.upper(),
+                    url,
+                    urlsplit(url).path,
+                    status_code,
+                    json.dumps(stored_headers),
+                    body,
+                    len(body),
+                    now,
+                    now,
+                ),
+            )
+            self.stats.stores += 1
+            self._evict()
+
+    def refresh(self, key: str, headers: Mapping[str, str]) -> None:
+        """Restart the time to live of an entry the server confirmed as unchanged.
+
+        Args:
+            key: Key of the revalidated entry
+            headers: Headers of the 304 response, which may carry a new ``ETag``
+
+        """
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT headers FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return
+            stored_headers = json.loads(row[0])
+            for name in ("ETag", "Last-Modified"):
+                value = _header(headers, name)
+                if value is not None:
+                    stored_headers = {
+                        header: old
+                        for header, old in stored_headers.items()
+                        if header.lower() != name.lower()
+                    }
+                    stored_headers[name] = value
+            self._connection.execute(
+                "UPDATE responses SET headers = ?, stored_at = ? WHERE key = ?",
+                (json.dumps(stored_headers), time.time(), key),
+            )
+
+    def invalidate(self, url: str) -> None:
+        """Drop every entry of a URL path, e.g. after the resource was modified."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE path = ?", (urlsplit(url).path,))
+
+    def clear(self) -> None:
+        """Drop every entry and the lifetime stats."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.execute("DELETE FROM counters")
+
+    def size(self) -> tuple[int, int]:
+        """Get the number of entries and the total size of their bodies in bytes."""
+        with self._lock:
+            count, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return count, size
+
+    def lifetime_stats(self) -> CacheStats:
+        """Get the stats of every closed run plus the current one."""
+        with self._lock:
+            totals = dict(self._connection.execute("SELECT name, value FROM counters"))
+        return CacheStats(
+            **{
+                field.name: totals.get(field.name, 0) + getattr(self.stats, field.name)
+                for field in fields(CacheStats)
+            }
+        )
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the bodies fit in ``max_bytes``."""
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.stats.evictions += len(evicted)
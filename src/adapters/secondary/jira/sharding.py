@@ -0,0 +1,140 @@
+"""Splitting of large JQL searches into shards that can be fetched independently.
+
+A taxonomy search covers several projects and a resolved-date window. Instead of paging
+through it as one long cursor, ``plan_shards`` cuts it into one shard per project and
+keeps halving shards, by project list first and then by date window, until Jira's
+approximate count of each shard is below a threshold. ``iter_sharded_results`` then
+fetches the shards concurrently, retrying a failed shard on its own.
+
+Date windows are split at a day boundary shared by both halves. Since the JQL bounds are
+inclusive, an issue resolved exactly at that boundary can be returned by both halves,
+so callers de-duplicate by issue key.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+DEFAULT_MAX_SHARD_SIZE = 2000
+DEFAULT_SHARD_ATTEMPTS = 3
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SearchShard:
+    """A slice of a taxonomy search: some projects and an inclusive resolved-date window."""
+
+    project_keys: tuple[str, ...]
+    start: date
+    end: date
+
+    def split(self) -> tuple[SearchShard, SearchShard] | None:
+        """Halve the shard by project list, or by date window for a single project.
+
+        Returns:
+            The two halves, or None if the shard covers a single project and day
+
+        """
+        if len(self.project_keys) > 1:
+            middle = len(self.project_keys) // 2
+            return (
+                SearchShard(self.project_keys[:middle], self.start, self.end),
+                SearchShard(self.project_keys[middle:], self.start, self.end),
+            )
+        days = (self.end - self.start).days
+        if days <= 1:
+            return None
+        middle_date = self.start + timedelta(days=days // 2)
+        return (
+            SearchShard(self.project_keys, self.start, middle_date),
+            SearchShard(self.project_keys, middle_date, self.end),
+        )
+
+
+def plan_shards(  # noqa: PLR0913 - the search, plus how to count and split it
+    project_keys: list[str],
+    start: date,
+    end: date,
+    count: Callable[[SearchShard], int],
+    max_shard_size: int = DEFAULT_MAX_SHARD_SIZE,
+    max_workers: int = 1,
+) -> list[SearchShard]:
+    """Split a search into shards whose approximate size is at most ``max_shard_size``.
+
+    Args:
+        project_keys: Keys of the projects to search
+        start: First day of the resolved-date window
+        end: Last day of the resolved-date window
+        count: Returns the approximate number of issues matching a shard
+        max_shard_size: Approximate count above which a shard is split further
+        max_workers: Maximum number of concurrent count requests
+
+    Returns:
+        The non-empty shards, together covering the whole search
+
+    """
+    shards = []
+    pending = [SearchShard((key,), start, end) for key in project_keys]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending:
+            counts = list(executor.map(count, pending))
+            next_pending = []
+            for shard, shard_count in zip(pending, counts, strict=True):
+                if shard_count == 0:
+                    continue
+                halves = shard.split() if shard_count > max_shard_size else None
+                if halves is None:
+                    shards.append(shard)
+                else:
+                    next_pending.extend(halves)
+            pending = next_pending
+    return shards
+
+
+def iter_sharded_results(
+    shards: list[SearchShard],
+    fetch: Callable[[SearchShard], T],
+    retry_on: tuple[type[Exception], ...],
+    max_workers: int = 1,
+    max_attempts: int = DEFAULT_SHARD_ATTEMPTS,
+) -> Iterator[T]:
+    """Fetch shards concurrently and yield each result as soon as its shard completes.
+
+    A shard failing with one of the ``retry_on`` exceptions is resubmitted on its own,
+    while the other shards keep running.
+
+    Args:
+        shards: Shards to fetch
+        fetch: Fetches every issue of a shard
+        retry_on: Exceptions after which a shard is fetched again
+        max_workers: Maximum number of shards fetched at the same time
+        max_attempts: Attempts per shard before its last error is raised
+
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        attempts = dict.fromkeys(shards, 1)
+        running = {executor.submit(fetch, shard): shard for shard in shards}
+        try:
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    shard = running.pop(future)
+                    try:
+                        result = future.result()
+                    except retry_on:
+                        if attempts[shard] >= max_attempts:
+                            raise
+                        attempts[shard] += 1
+                        running[executor.submit(fetch, shard)] = shard
+                        continue
+                    yield result
+        finally:
+            for future in running:
+                future.cancel()
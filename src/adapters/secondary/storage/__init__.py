@@ -0,0 +1 @@
+"""Local storage adapters for persisting data fetched from JIRA."""
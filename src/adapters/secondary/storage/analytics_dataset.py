@@ -0,0 +1,267 @@
+"""Hive-partitioned Parquet or Arrow IPC datasets of analytics rows, upserted by key.
+
+Rows are stored under ``<root>/week=<week>/project=<project>/part.<suffix>``, one file
+per partition, without the partition columns themselves, so readers get them back from
+the path and can skip whole partitions, e.g.
+``pl.scan_parquet(root / "**/*.parquet", hive_partitioning=True)``. Writing the same
+issue again replaces its previous rows, even when it moved to another partition.
+
+An analytics dataset pairs a dataset of issues with one of their status transitions,
+partitioned alike, which streaming sessions scan without loading either in memory.
+
+polars is only imported when a dataset is written or scanned, so the CLI can offer the
+formats without loading it at startup.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from src.domain.models import Bucket
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import polars as pl
+
+    from src.domain.analytics_session import AnalyticsSession
+
+PARTITION_COLUMNS = ("week", "project")
+KEY_COLUMN = "issue_key"
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"  # Hive's name for a missing value
+ISSUES_DATASET = "issues"  # Directories of an analytics dataset
+TRANSITIONS_DATASET = "transitions"
+# Partition file of every key, so upserts only open the partitions they change. Its
+# suffix keeps it out of scans of "**/*.parquet" or "**/*.arrow"
+KEY_INDEX = "_keys.ipc"
+
+
+class DatasetFormat(StrEnum):
+    """File formats of partitioned datasets."""
+
+    PARQUET = "parquet"
+    IPC = "ipc"
+
+
+_SUFFIXES = {DatasetFormat.PARQUET: ".parquet", DatasetFormat.IPC: ".arrow"}
+
+
+def write_dataset(
+    frame: pl.DataFrame,
+    root: Path,
+    dataset_format: DatasetFormat = DatasetFormat.PARQUET,
+) -> int:
+    """Upsert rows into a partitioned dataset, replacing earlier rows of the same key.
+
+    Every row of a key is replaced, so a key can have many rows, like the transitions
+    of an issue, as long as each write carries all of them. Only partitions receiving
+    rows, or holding rows of the written keys, are opened and rewritten: the dataset's
+    key index, ``KEY_INDEX``, tells which partitions hold the written keys. Every file
+    is written next to its destination first and then moved in place, so readers never
+    see a partial file.
+
+    Args:
+        frame: Rows to write, with the ``PARTITION_COLUMNS`` and ``KEY_COLUMN``
+        root: Directory of the dataset, created if needed
+        dataset_format: Format of the partition files
+
+    Returns:
+        Number of partition files written or removed
+
+    """
+    import polars as pl
+
+    suffix = _SUFFIXES[dataset_format]
+    keys = frame.get_column(KEY_COLUMN).unique()
+    incoming = {
+        _partition_path(root, values, suffix): rows.drop(PARTITION_COLUMNS)
+        for values, rows in frame.partition_by(list(PARTITION_COLUMNS), as_dict=True).items()
+    }
+    incoming_index = pl.concat(
+        [
+            rows.select(pl.col(KEY_COLUMN).unique(), partition=pl.lit(_relative(path, root)))
+            for path, rows in incoming.items()
+        ]
+        or [_empty_index()]
+    )
+    index = _read_index(root, dataset_format)
+    earlier_partitions = index.filter(pl.col(KEY_COLUMN).is_in(keys)).get_column("partition")
+
+    # Lists both the earlier and the new partitions of the written keys until they are
+    # all rewritten, so an interrupted write leaves no row the index does not point to
+    _write_index(pl.concat([index, incoming_index]), root)
+    changed = 0
+    for path in {root / partition for partition in earlier_partitions} | incoming.keys():
+        rows = incoming.get(path)
+        if path.exists():
+            kept = _read(path, dataset_format).filter(~pl.col(KEY_COLUMN).is_in(keys))
+            merged = kept if rows is None else pl.concat([kept, rows], how="diagonal_relaxed")
+        elif rows is None:
+            continue
+        else:
+            merged = rows
+        if merged.is_empty():
+            path.unlink()
+        else:
+            _write(merged, path, dataset_format)
+        changed += 1
+    _write_index(pl.concat([index.filter(~pl.col(KEY_COLUMN).is_in(keys)), incoming_index]), root)
+    return changed
+
+
+def write_analytics(session: AnalyticsSession, root: Path) -> int:
+    """Upsert the issues of a session and their status transitions into a dataset.
+
+    Transitions are stored with the ``hours`` until the next one, computed here where
+    the complete history of every issue is at hand, and partitioned like their issue.
+
+    Args:
+        session: Session built in memory, e.g. by ``TeamAnalysis.build_session``
+        root: Directory of the analytics dataset, created if needed
+
+    Returns:
+        Number of partition files written or removed
+
+    """
+    from src.domain.flow_metrics import transition_hours_plan
+
+    issues = session.issues
+    transitions = (
+        transition_hours_plan(session.transitions)
+        .join(issues.lazy().select(KEY_COLUMN, *PARTITION_COLUMNS), on=KEY_COLUMN)
+        .collect()
+    )
+    return write_dataset(issues, root / ISSUES_DATASET) + write_dataset(
+        transitions, root / TRANSITIONS_DATASET
+    )
+
+
+def scan_analytics(
+    root: Path,
+    bucket: Bucket = Bucket.WEEK,
+    resolved_from: datetime | None = None,
+    resolved_until: datetime | None = None,
+) -> AnalyticsSession:
+    """Open a streaming session over an analytics dataset.
+
+    Nothing is read until the session's charts collect their inputs, and then only the
+    partition files and columns they need.
+
+    Args:
+        root: Directory of a dataset written by ``write_analytics``, holding issues
+        bucket: Periods the session's charts group issues into
+        resolved_from: If given, leave out issues resolved before it. Naive times are
+            taken as UTC
+        resolved_until: If given, leave out issues resolved at or after it. Naive times
+            are taken as UTC
+
+    Returns:
+        A session with ``streaming`` set, over the issues and transitions
+
+    """
+    import polars as pl
+
+    from src.domain.analytics_session import AnalyticsSession
+    from src.domain.flow_metrics import TRANSITIONS_SCHEMA
+
+    issues = pl.scan_parquet(root / ISSUES_DATASET / "**/*.parquet", hive_partitioning=True)
+    # polars cannot compare the UTC resolution dates with naive times
+    if resolved_from is not None:
+        issues = issues.filter(pl.col("resolved") >= _as_utc(resolved_from))
+    if resolved_until is not None:
+        issues = issues.filter(pl.col("resolved") < _as_utc(resolved_until))
+
+    transitions_root = root / TRANSITIONS_DATASET
+    if any(transitions_root.glob("*=*/*=*/*.parquet")):
+        # Partitioned like their issues, whose partition columns they need not repeat
+        transitions = pl.scan_parquet(transitions_root / "**/*.parquet", hive_partitioning=False)
+    else:
+        # No issue of the dataset ever changed status
+        transitions = pl.LazyFrame(schema={**TRANSITIONS_SCHEMA, "hours": pl.Float64})
+    return AnalyticsSession(
+        issues,
+        transitions.select(*TRANSITIONS_SCHEMA, "hours"),
+        bucket,
+        streaming=True,
+    )
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Convert a time to UTC, taking naive times as UTC already."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC)
+
+
+def _read_index(root: Path, dataset_format: DatasetFormat) -> pl.DataFrame:
+    """Read the partition of every key, indexing the partition files if there is none yet."""
+    import polars as pl
+
+    index_path = root / KEY_INDEX
+    if index_path.exists():
+        return pl.read_ipc(index_path, memory_map=False)
+    # Datasets written before the index existed are read once to build it
+    return pl.concat(
+        [
+            _read(path, dataset_format, columns=[KEY_COLUMN]).select(
+                pl.col(KEY_COLUMN).unique(), partition=pl.lit(_relative(path, root))
+            )
+            for path in root.glob(f"*=*/*=*/part{_SUFFIXES[dataset_format]}")
+        ]
+        or [_empty_index()]
+    )
+
+
+def _write_index(index: pl.DataFrame, root: Path) -> None:
+    """Replace the key index of a dataset through a temporary file."""
+    root.mkdir(parents=True, exist_ok=True)
+    temporary = root / f".{KEY_INDEX}.tmp"
+    index.unique().write_ipc(temporary, compression="zstd")
+    temporary.replace(root / KEY_INDEX)
+
+
+def _empty_index() -> pl.DataFrame:
+    """Get a key index without entries."""
+    import polars as pl
+
+    return pl.DataFrame(schema={KEY_COLUMN: pl.Utf8, "partition": pl.Utf8})
+
+
+def _relative(path: Path, root: Path) -> str:
+    """Get the path of a partition file within its dataset, as stored in the key index."""
+    return path.relative_to(root).as_posix()
+
+
+def _partition_path(root: Path, values: tuple, suffix: str) -> Path:
+    """Get the file of a partition, percent-encoding values so any text is a safe name."""
+    directory = root
+    for column, value in zip(PARTITION_COLUMNS, values, strict=True):
+        text = NULL_PARTITION if value is None else quote(str(value), safe="")
+        directory = directory / f"{column}={text}"
+    return directory / f"part{suffix}"
+
+
+def _read(
+    path: Path, dataset_format: DatasetFormat, columns: list[str] | None = None
+) -> pl.DataFrame:
+    """Read the rows stored in a partition file, or only some of their columns."""
+    import polars as pl
+
+    if dataset_format == DatasetFormat.IPC:
+        return pl.read_ipc(path, columns=columns, memory_map=False)
+    # The partition columns live in the path, not in the file
+    return pl.read_parquet(path, columns=columns, hive_partitioning=False)
+
+
+def _write(frame: pl.DataFrame, path: Path, dataset_format: DatasetFormat) -> None:
+    """Write a partition file through a temporary file in the same directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.tmp")
+    if dataset_format == DatasetFormat.IPC:
+        frame.write_ipc(temporary, compression="zstd")
+    else:
+        frame.write_parquet(temporary, compression="zstd", statistics=True)
+    temporary.replace(path)
@@ -0,0 +1,182 @@
+"""SQLite-backed index of the parent and link relations between JIRA issues.
+
+Every issue seen by a sync or a plan traversal records its outgoing edges, its parent
+and the issues it links to, stamped with when they were read from JIRA. The whole index
+is loaded into memory when opened, so ancestor and descendant queries never touch the
+database or the API; callers decide from the timestamps which nodes to refresh.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import pytz
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from src.domain.models import Issue
+
+PARENT_EDGE = "parent"
+LINK_EDGE = "link"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issue_nodes (
+    key TEXT PRIMARY KEY,
+    synced_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issue_edges (
+    source_key TEXT NOT NULL,
+    target_key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (source_key, kind, target_key)
+);
+"""
+
+
+@dataclass
+class IssueNode:
+    """Relations of a single issue as last read from JIRA."""
+
+    key: str
+    parent_key: str | None
+    linked_issue_keys: tuple[str, ...]
+    synced_at: datetime
+
+
+class IssueGraph:
+    """Persistent parent/child/link index of issues, queried from memory."""
+
+    def __init__(self, path: Path) -> None:
+        """Open (and create if needed) the index at the given path and load it.
+
+        Args:
+            path: Location of the SQLite database file
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+        self._nodes: dict[str, IssueNode] = {}
+        self._children: dict[str, set[str]] = {}
+        self._load()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._connection.close()
+
+    def get_node(self, key: str) -> IssueNode | None:
+        """Get the relations of an issue, or None if it has never been indexed."""
+        return self._nodes.get(key)
+
+    def children(self, key: str) -> set[str]:
+        """Get the keys of the indexed issues whose parent is the given issue."""
+        return set(self._children.get(key, ()))
+
+    def update(self, issues: Iterable[Issue], synced_at: datetime | None = None) -> None:
+        """Record the current relations of issues, replacing what was known about them.
+
+        Args:
+            issues: Issues as just read from JIRA
+            synced_at: When the issues were read. Defaults to now
+
+        """
+        synced_at = synced_at or datetime.now(pytz.utc)
+        timestamp = synced_at.isoformat()
+        with self._connection:
+            for issue in issues:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO issue_nodes VALUES (?, ?)", (issue.key, timestamp)
+                )
+                self._connection.execute(
+                    "DELETE FROM issue_edges WHERE source_key = ?", (issue.key,)
+                )
+                edges = [(issue.parent_key, PARENT_EDGE)] if issue.parent_key else []
+                edges += [(key, LINK_EDGE) for key in issue.linked_issue_keys]
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO issue_edges VALUES (?, ?, ?, ?)",
+                    [(issue.key, target, kind, timestamp) for target, kind in edges],
+                )
+                self._set_node(
+                    IssueNode(issue.key, issue.parent_key, issue.linked_issue_keys, synced_at)
+                )
+
+    def ancestors(self, keys: Iterable[str], max_depth: int | None = None) -> list[str]:
+        """Get the keys of the parents, grandparents and so on of the given issues."""
+        return self._walk(keys, self._parent_keys, max_depth)
+
+    def descendants(self, keys: Iterable[str], max_depth: int | None = None) -> list[str]:
+        """Get the keys of the children, grandchildren and so on of the given issues."""
+        return self._walk(keys, self.children, max_depth)
+
+    def linked(self, keys: Iterable[str], max_depth: int | None = None) -> list[str]:
+        """Get the keys of the issues reachable from the given ones through links."""
+        return self._walk(keys, self._linked_keys, max_depth)
+
+    def _parent_keys(self, key: str) -> tuple[str, ...]:
+        """Get the key of an issue's parent, if it has one, as a tuple."""
+        node = self._nodes.get(key)
+        return (node.parent_key,) if node and node.parent_key else ()
+
+    def _linked_keys(self, key: str) -> tuple[str, ...]:
+        """Get the keys of the issues an issue links to."""
+        node = self._nodes.get(key)
+        return node.linked_issue_keys if node else ()
+
+    def _walk(
+        self,
+        keys: Iterable[str],
+        neighbours: Callable[[str], Iterable[str]],
+        max_depth: int | None,
+    ) -> list[str]:
+        """Breadth-first walk from ``keys``, returning the keys found in level order."""
+        frontier = list(dict.fromkeys(keys))
+        visited = set(frontier)
+        found: list[str] = []
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            next_frontier = []
+            for key in frontier:
+                for neighbour in neighbours(key):
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        next_frontier.append(neighbour)
+            found.extend(next_frontier)
+            frontier = next_frontier
+            depth += 1
+        return found
+
+    def _set_node(self, node: IssueNode) -> None:
+        """Replace a node in memory, keeping the reverse parent index in step."""
+        previous = self._nodes.get(node.key)
+        if previous is not None and previous.parent_key:
+            self._children.get(previous.parent_key, set()).discard(node.key)
+        self._nodes[node.key] = node
+        if node.parent_key:
+            self._children.setdefault(node.parent_key, set()).add(node.key)
+
+    def _load(self) -> None:
+        """Read every node and edge into memory."""
+        parents: dict[str, str] = {}
+        links: dict[str, list[str]] = {}
+        for source, target, kind in self._connection.execute(
+            "SELECT source_key, target_key, kind FROM issue_edges ORDER BY rowid"
+        ):
+            if kind == PARENT_EDGE:
+                parents[source] = target
+            else:
+                links.setdefault(source, []).append(target)
+        for key, synced_at in self._connection.execute("SELECT key, synced_at FROM issue_nodes"):
+            self._set_node(
+                IssueNode(
+                    key,
+                    parents.get(key),
+                    tuple(links.get(key, ())),
+                    datetime.fromisoformat(synced_at),
+                )
+            )
@@ -0,0 +1,7 @@
+from src.adapters.secondary.jira import jira_factory
+from src.adapters.secondary.storage.issue_graph import IssueGraph
+
+
+def create() -> IssueGraph:
+    """Create and return an IssueGraph in the configured cache directory."""
+    return IssueGraph(jira_factory.settings().cache_dir / "issue_graph.sqlite3")
@@ -0,0 +1,100 @@
+"""Files feeding bulk issue imports and the journal that lets them resume.
+
+Import files are CSV (one issue per row, a header naming the ``CreateIssueRequest``
+fields) or NDJSON (one JSON object per line). The journal is an NDJSON file next to the
+import file with a line per created issue, appended as soon as its batch finishes, so an
+interrupted import can be run again without creating any issue twice.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from src.domain.models import IssueCreationResult
+
+CSV_SUFFIXES = (".csv",)
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+def read_issue_rows(path: Path) -> Iterator[dict[str, Any]]:
+    """Read the rows of an import file lazily, dropping empty values.
+
+    Args:
+        path: CSV or NDJSON file, told apart by its suffix
+
+    Returns:
+        The field values of each row, with fields left empty omitted so they default
+
+    Raises:
+        ValueError: If the file is neither CSV nor NDJSON
+
+    """
+    suffix = path.suffix.lower()
+    if suffix in CSV_SUFFIXES:
+        return _read_csv(path)
+    if suffix in NDJSON_SUFFIXES:
+        return _read_ndjson(path)
+    msg = f"Unsupported import file {path.name}, expected CSV or NDJSON"
+    raise ValueError(msg)
+
+
+def default_journal_path(path: Path) -> Path:
+    """Get where the journal of an import file is kept unless told otherwise."""
+    return path.with_name(f"{path.name}.journal.ndjson")
+
+
+def _read_csv(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the non-empty values of each CSV row."""
+    with path.open(newline="", encoding="utf-8") as file:
+        for row in csv.DictReader(file):
+            yield {name: value for name, value in row.items() if value not in (None, "")}
+
+
+def _read_ndjson(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the non-null values of each NDJSON line, skipping blank lines."""
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield {name: value for name, value in json.loads(line).items() if value is not None}
+
+
+class ImportJournal:
+    """Append-only record of the issues an import has created, by row."""
+
+    def __init__(self, path: Path) -> None:
+        """Open the journal at the given path, reading what earlier runs recorded.
+
+        Args:
+            path: Location of the NDJSON journal file, created on first write
+
+        """
+        self.path = path
+        self._created: dict[int, str] = {}
+        if path.exists():
+            with path.open(encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._created[entry["row"]] = entry["key"]
+
+    def created_key(self, row: int) -> str | None:
+        """Get the key of the issue created for a row, or None if it was not created."""
+        return self._created.get(row)
+
+    def record(self, results: Iterable[IssueCreationResult]) -> None:
+        """Append the created issues among the results and flush them to disk."""
+        lines = []
+        for result in results:
+            if result.created and result.row not in self._created:
+                self._created[result.row] = result.key
+                lines.append(json.dumps({"row": result.row, "key": result.key}) + "\n")
+        if lines:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as file:
+                file.writelines(lines)
@@ -0,0 +1,318 @@
+"""SQLite-backed local store of mapped JIRA issues.
+
+Keeps domain ``Issue`` records and their status history on disk, together with a
+per-project sync state, so analytics runs only need to fetch issues that changed
+since the previous run.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import date, datetime
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from src.domain.models import (
+    Issue,
+    IssueStatus,
+    IssueType,
+    StatusTransition,
+    SyncState,
+    intern_text,
+    shared_project,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+# Mirrors the exclusions applied by JiraAdapter.search_issues
+EXCLUDED_ISSUE_TYPES = (IssueType.EPIC, IssueType.INITIATIVE)
+EXCLUDED_PROJECT_NAME = "Core Connectivity Intake"
+DEFAULT_PAGE_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    project_key TEXT NOT NULL,
+    project_name TEXT NOT NULL,
+    project_category_id TEXT,
+    issue_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    engineering_category TEXT NOT NULL,
+    resolution_date TEXT,
+    resolved_local TEXT,
+    updated TEXT,
+    url TEXT NOT NULL,
+    lead_time_hours REAL,
+    summary TEXT,
+    description TEXT,
+    parent_key TEXT,
+    linked_issue_keys TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS issues_project_resolved ON issues (project_key, resolved_local);
+CREATE TABLE IF NOT EXISTS status_transitions (
+    issue_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    PRIMARY KEY (issue_key, position)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project_key TEXT PRIMARY KEY,
+    covered_from TEXT NOT NULL,
+    high_water_mark TEXT NOT NULL
+);
+"""
+
+# Columns added to ``issues`` after its first release, with their definitions
+_ADDED_ISSUE_COLUMNS = (
+    ("parent_key", "TEXT"),
+    ("linked_issue_keys", "TEXT NOT NULL DEFAULT '[]'"),
+)
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    """Serialize an optional datetime for storage."""
+    return value.isoformat() if value else None
+
+
+def _fromisoformat(value: str | None) -> datetime | None:
+    """Deserialize an optional datetime from storage."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def _local_wall_time(value: datetime | None) -> str | None:
+    """Render a timestamp in its own offset without the offset.
+
+    JIRA reports timestamps in the user's time zone and evaluates JQL date
+    comparisons in that same zone, so comparing wall-clock strings reproduces
+    the JQL semantics.
+    """
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f") if value else None
+
+
+class IssueStore:
+    """Persistent store of mapped issues with per-project sync state."""
+
+    def __init__(self, path: Path) -> None:
+        """Open (and create if needed) the store at the given path.
+
+        Args:
+            path: Location of the SQLite database file
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+        self._migrate()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._connection.close()
+
+    def _migrate(self) -> None:
+        """Add the columns missing from a store created by an earlier version.
+
+        Issues stored before relations were kept have none, so the sync state of every
+        project is dropped and the next sync reloads its window with them.
+        """
+        existing = {row[1] for row in self._connection.execute("PRAGMA table_info(issues)")}
+        missing = [column for column in _ADDED_ISSUE_COLUMNS if column[0] not in existing]
+        if not missing:
+            return
+        with self._connection:
+            for name, definition in missing:
+                self._connection.execute(f"ALTER TABLE issues ADD COLUMN {name} {definition}")
+            self._connection.execute("DELETE FROM sync_state")
+
+    def get_sync_state(self, project_key: str) -> SyncState | None:
+        """Get the sync state of a project, or None if it has never been synced."""
+        row = self._connection.execute(
+            "SELECT covered_from, high_water_mark FROM sync_state WHERE project_key = ?",
+            (project_key,),
+        ).fetchone()
+        if row is None:
+            return None
+        return SyncState(
+            covered_from=date.fromisoformat(row[0]),
+            high_water_mark=datetime.fromisoformat(row[1]),
+        )
+
+    def save_sync_state(self, project_key: str, state: SyncState) -> None:
+        """Record the sync state of a project."""
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                (project_key, state.covered_from.isoformat(), state.high_water_mark.isoformat()),
+            )
+
+    def delete_project_issues(self, project_key: str) -> None:
+        """Drop every stored issue of a project along with its sync state."""
+        with self._connection:
+            self._connection.execute("DELETE FROM sync_state WHERE project_key = ?", (project_key,))
+            self._connection.execute(
+                "DELETE FROM status_transitions WHERE issue_key IN "
+                "(SELECT key FROM issues WHERE project_key = ?)",
+                (project_key,),
+            )
+            self._connection.execute("DELETE FROM issues WHERE project_key = ?", (project_key,))
+
+    def upsert_issues(self, issues: Iterable[Issue]) -> None:
+        """Insert new issues and overwrite stored issues with the same key."""
+        with self._connection:
+            self._write_issues(issues)
+
+    def load_issues(
+        self,
+        project_keys: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[Issue]:
+        """Load stored issues resolved within the date window.
+
+        Applies the same filters as ``JiraAdapter.search_issues``: epics, initiatives,
+        won't-do issues and the intake project are excluded.
+
+        Args:
+            project_keys: Keys of the projects to load
+            start_date: Earliest resolution date, inclusive
+            end_date: Latest resolution date, matching JQL's ``resolved <= "date"``
+
+        """
+        return list(chain.from_iterable(self.iter_issue_pages(project_keys, start_date, end_date)))
+
+    def iter_issue_pages(
+        self,
+        project_keys: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[list[Issue]]:
+        """Yield the issues ``load_issues`` returns, a page at a time.
+
+        Args:
+            project_keys: Keys of the projects to load
+            start_date: Earliest resolution date, inclusive
+            end_date: Latest resolution date, matching JQL's ``resolved <= "date"``
+            page_size: Number of issues per yielded page
+
+        """
+        if not project_keys:
+            return
+
+        placeholders = ",".join("?" * len(project_keys))
+        cursor = self._connection.execute(
+            # Only "?" placeholders are interpolated into the query
+            f"SELECT * FROM issues WHERE project_key IN ({placeholders}) "  # noqa: S608
+            "AND resolved_local >= ? AND resolved_local <= ? "
+            "AND issue_type NOT IN (?, ?) AND status != ? AND project_name != ? "
+            "ORDER BY resolved_local, key",
+            (
+                *project_keys,
+                start_date.strftime("%Y-%m-%d"),
+                end_date.strftime("%Y-%m-%dT00:00:00.000000"),
+                *EXCLUDED_ISSUE_TYPES,
+                IssueStatus.WONT_DO,
+                EXCLUDED_PROJECT_NAME,
+            ),
+        )
+        while rows := cursor.fetchmany(page_size):
+            histories = self._load_status_histories([row[0] for row in rows])
+            yield [self._row_to_issue(row, histories.get(row[0], [])) for row in rows]
+
+    def _write_issues(self, issues: Iterable[Issue]) -> None:
+        """Write issues and their status history inside the current transaction."""
+        for issue in issues:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO issues "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    issue.key,
+                    issue.project.key,
+                    issue.project.name,
+                    issue.project.category_id,
+                    issue.issue_type,
+                    issue.status,
+                    issue.engineering_category,
+                    _isoformat(issue.resolution_date),
+                    _local_wall_time(issue.resolution_date),
+                    _isoformat(issue.updated),
+                    issue.url,
+                    issue.lead_time_hours,
+                    issue.summary,
+                    issue.description,
+                    issue.parent_key,
+                    json.dumps(issue.linked_issue_keys),
+                ),
+            )
+            self._connection.execute(
+                "DELETE FROM status_transitions WHERE issue_key = ?", (issue.key,)
+            )
+            self._connection.executemany(
+                "INSERT INTO status_transitions VALUES (?, ?, ?, ?)",
+                [
+                    (issue.key, position, transition.status, transition.timestamp.isoformat())
+                    for position, transition in enumerate(issue.status_history)
+                ],
+            )
+
+    def _load_status_histories(self, issue_keys: list[str]) -> dict[str, list[StatusTransition]]:
+        """Load the ordered status history of each of the given issues."""
+        histories: dict[str, list[StatusTransition]] = {}
+        if not issue_keys:
+            return histories
+
+        placeholders = ",".join("?" * len(issue_keys))
+        rows = self._connection.execute(
+            # Only "?" placeholders are interpolated into the query
+            "SELECT issue_key, status, timestamp FROM status_transitions "  # noqa: S608
+            f"WHERE issue_key IN ({placeholders}) ORDER BY issue_key, position",
+            issue_keys,
+        )
+        for issue_key, status, timestamp in rows:
+            histories.setdefault(issue_key, []).append(
+                StatusTransition(
+                    status=intern_text(status), timestamp=datetime.fromisoformat(timestamp)
+                )
+            )
+        return histories
+
+    @staticmethod
+    def _row_to_issue(row: tuple, status_history: list[StatusTransition]) -> Issue:
+        """Rebuild a domain Issue from an ``issues`` row."""
+        (
+            key,
+            project_key,
+            project_name,
+            project_category_id,
+            issue_type,
+            status,
+            engineering_category,
+            resolution_date,
+            _resolved_local,
+            updated,
+            url,
+            lead_time_hours,
+            summary,
+            description,
+            parent_key,
+            linked_issue_keys,
+        ) = row
+        return Issue(
+            description=description,
+            summary=summary,
+            key=key,
+            project=shared_project(project_key, project_name, project_category_id),
+            issue_type=intern_text(issue_type),
+            resolution_date=_fromisoformat(resolution_date),
+            status=intern_text(status),
+            engineering_category=intern_text(engineering_category),
+            url=url,
+            status_history=status_history,
+            lead_time_hours=lead_time_hours,
+            updated=_fromisoformat(updated),
+            parent_key=parent_key,
+            linked_issue_keys=tuple(json.loads(linked_issue_keys)),
+        )
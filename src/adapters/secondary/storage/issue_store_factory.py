@@ -0,0 +1,7 @@
+from src.adapters.secondary.jira import jira_factory
+from src.adapters.secondary.storage.issue_store import IssueStore
+
+
+def create() -> IssueStore:
+    """Create and return an IssueStore in the configured cache directory."""
+    return IssueStore(jira_factory.settings().cache_dir / "issues.sqlite3")
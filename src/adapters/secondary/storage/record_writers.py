@@ -0,0 +1,198 @@
+"""Streaming writers turning pages of flat issue records into NDJSON, CSV or Parquet.
+
+Pages are written as they arrive, so exporting a query never holds more than one page
+of records in memory. NDJSON and CSV are flushed after every page, which lets their
+output be piped into another process while the query is still running. Parquet needs
+a file it can seek in: every page is written to a typed Parquet part in a temporary
+directory first, and polars then streams the parts into the Parquet file, widening a
+column whose pages disagree on its type, like whole and fractional numbers.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import sys
+import tempfile
+from contextlib import contextmanager
+from enum import StrEnum
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import polars as pl
+
+# JIRA fields holding timestamps like "2025-01-17T15:09:56.520-0800", stored in UTC
+TIMESTAMP_FIELDS = frozenset(
+    {"created", "updated", "resolutiondate", "lastViewed", "statuscategorychangedate"}
+)
+DATE_FIELDS = frozenset({"duedate"})  # JIRA fields holding dates like "2025-01-17"
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S%.f%z"
+
+
+class RecordFormat(StrEnum):
+    """Output formats of record exports."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+def write_records(
+    pages: Iterable[list[dict[str, Any]]],
+    columns: list[str],
+    record_format: RecordFormat,
+    output: Path | None = None,
+) -> int:
+    """Write pages of records to a file or stdout as they arrive.
+
+    Args:
+        pages: Records, one list per page
+        columns: Columns of CSV and Parquet output, in order. NDJSON lines keep every
+            key of their record
+        record_format: Format to write
+        output: File to write. Defaults to stdout, except for Parquet which needs a file
+
+    Returns:
+        Number of records written
+
+    Raises:
+        ValueError: If Parquet output is requested without a file
+
+    """
+    if record_format == RecordFormat.PARQUET:
+        if output is None:
+            msg = "Parquet output needs a file, stdout is not seekable"
+            raise ValueError(msg)
+        return _write_parquet(pages, columns, output)
+
+    with _open_text(output) as stream:
+        if record_format == RecordFormat.CSV:
+            return _write_csv(pages, columns, stream)
+        return _write_ndjson(pages, stream)
+
+
+@contextmanager
+def _open_text(output: Path | None) -> Iterator[IO[str]]:
+    """Open the output file for writing, or hand out stdout without closing it."""
+    if output is None:
+        yield sys.stdout
+        return
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", newline="", encoding="utf-8") as stream:
+        yield stream
+
+
+def _write_ndjson(pages: Iterable[list[dict[str, Any]]], stream: IO[str]) -> int:
+    """Write each record as a line of JSON, flushing after every page."""
+    count = 0
+    for records in pages:
+        stream.writelines(json.dumps(record, default=str) + "\n" for record in records)
+        stream.flush()
+        count += len(records)
+    return count
+
+
+def _write_csv(pages: Iterable[list[dict[str, Any]]], columns: list[str], stream: IO[str]) -> int:
+    """Write the records' columns as CSV rows, flushing after every page."""
+    writer = csv.writer(stream)
+    writer.writerow(columns)
+    count = 0
+    for records in pages:
+        writer.writerows(
+            [_csv_value(record.get(column)) for column in columns] for record in records
+        )
+        stream.flush()
+        count += len(records)
+    return count
+
+
+def _csv_value(value: object) -> object:
+    """Render lists and objects as JSON so they fit in a single cell."""
+    if isinstance(value, list | dict):
+        return json.dumps(value, default=str)
+    return value
+
+
+def _write_parquet(pages: Iterable[list[dict[str, Any]]], columns: list[str], output: Path) -> int:
+    """Write every page to a typed Parquet part and stream the parts into one file."""
+    import polars as pl
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=output.parent) as spill_dir:
+        parts = []
+        count = 0
+        for records in pages:
+            part = Path(spill_dir) / f"part-{len(parts):06}.parquet"
+            _page_frame(records, columns).write_parquet(part)
+            parts.append(part)
+            count += len(records)
+        if not parts:
+            _page_frame([], columns).write_parquet(output)
+            return count
+        # Columns are widened to a type every page's values fit in
+        scans = [pl.scan_parquet(part) for part in parts]
+        pl.concat(scans, how="vertical_relaxed").sink_parquet(output)
+    return count
+
+
+def _page_frame(records: list[dict[str, Any]], columns: list[str]) -> pl.DataFrame:
+    """Build a frame of the records' columns, each with its own type."""
+    import polars as pl
+
+    return pl.DataFrame(
+        [_parquet_column(column, [record.get(column) for record in records]) for column in columns]
+    )
+
+
+def _parquet_column(name: str, values: list[Any]) -> pl.Series:
+    """Build a typed column of a page's values of a field.
+
+    Timestamps and dates are parsed, numbers, booleans, text and lists of them keep
+    their type, and anything else, like objects or values of mixed types, is stored as
+    text, with lists and objects rendered as JSON as in CSV output.
+    """
+    import polars as pl
+
+    if name in TIMESTAMP_FIELDS:
+        return pl.Series(name, values, dtype=pl.Utf8).str.to_datetime(
+            _TIMESTAMP_FORMAT, time_unit="us", time_zone="UTC"
+        )
+    if name in DATE_FIELDS:
+        return pl.Series(name, values, dtype=pl.Utf8).str.to_date("%Y-%m-%d")
+
+    present = [value for value in values if value is not None]
+    if present and all(isinstance(value, list) for value in present):
+        item_dtype = _scalar_dtype([item for value in present for item in value])
+        if item_dtype is not None:
+            return pl.Series(name, values, dtype=pl.List(item_dtype))
+    else:
+        dtype = _scalar_dtype(present)
+        if dtype is not None:
+            return pl.Series(name, values, dtype=dtype)
+    # polars would turn values not matching the first one's type into nulls
+    return pl.Series(
+        name,
+        [value if value is None else str(_csv_value(value)) for value in values],
+        dtype=pl.Utf8,
+    )
+
+
+def _scalar_dtype(values: list[Any]) -> pl.DataType | None:
+    """Get the polars type of non-null scalar values, or None if they have none in common."""
+    import polars as pl
+
+    kinds = {type(value) for value in values}
+    if not kinds:
+        return pl.Null()
+    if kinds == {str}:
+        return pl.Utf8()
+    if kinds == {bool}:
+        return pl.Boolean()
+    if kinds == {int}:
+        return pl.Int64()
+    if kinds in ({int, float}, {float}):
+        return pl.Float64()
+    return None
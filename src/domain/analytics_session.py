@@ -0,0 +1,118 @@
+"""Lazy query plan shared by the charts of an analysis run.
+
+Charts of a run all aggregate the same analytics frame. Planning every aggregation
+lazily on top of it and collecting them together lets polars evaluate the shared
+subplans once, instead of each chart regrouping and re-joining the frame eagerly.
+
+The frame can as well be a scan of an on-disk dataset: streaming sessions then run
+every aggregation with polars' streaming engine, so memory stays flat however many
+periods are analyzed, and never collect the frame itself.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import polars as pl
+
+from src.domain.flow_metrics import TRANSITIONS_SCHEMA, FlowMetric, time_in_status_plan
+from src.domain.models import Bucket
+
+
+def period_expr(bucket: Bucket) -> pl.Expr:
+    """Get the label of the period each issue was resolved in, as a ``period`` column.
+
+    Labels sort chronologically: weeks are named after the Sunday they end on, as in
+    the frame's ``week`` column, months like ``2025-01`` and quarters like ``2025-Q1``.
+    """
+    resolved = pl.col("resolved")
+    if bucket == Bucket.MONTH:
+        period = resolved.dt.strftime("%Y-%m")
+    elif bucket == Bucket.QUARTER:
+        period = pl.format("{}-Q{}", resolved.dt.year(), resolved.dt.quarter())
+    else:
+        period = pl.col("week")
+    return period.alias("period")
+
+
+@dataclass
+class AnalyticsSession:
+    """Lazy query plan of one analysis run, collected once for all its charts.
+
+    The analytics frame and every chart input are lazy queries over the same pages.
+    The first chart to need data collects all of them in a single ``collect_all`` call,
+    so polars evaluates the subplans they share, like the per-project, category and
+    period counts, only once, prunes unused columns and runs the queries in parallel.
+    """
+
+    plan: pl.LazyFrame  # One row per issue, see ``ANALYTICS_SCHEMA``
+    transitions: pl.LazyFrame = field(
+        default_factory=lambda: pl.LazyFrame(schema=TRANSITIONS_SCHEMA)
+    )
+    bucket: Bucket = Bucket.WEEK  # Periods the charts group issues into
+    streaming: bool = False  # Run with the streaming engine and never collect ``plan``
+
+    @cached_property
+    def frames(self) -> dict[str, pl.DataFrame]:
+        """Collect every chart input, and the analytics frame unless streaming, by name."""
+        plans = self._plans()
+        if not self.streaming:
+            # Shares its subplans with every chart input
+            plans["issues"] = self.plan
+        frames = pl.collect_all(list(plans.values()), streaming=self.streaming)
+        return dict(zip(plans, frames, strict=True))
+
+    @property
+    def issues(self) -> pl.DataFrame:
+        """Analytics frame, one row per issue. Streaming sessions collect it on each call."""
+        if self.streaming:
+            return self.plan.collect(streaming=True)
+        return self.frames["issues"]
+
+    def is_empty(self) -> bool:
+        """Check whether the run found no issues."""
+        return self.frames["project_periods"].is_empty()
+
+    def _plans(self) -> dict[str, pl.LazyFrame]:
+        """Plan the inputs of every chart on top of the analytics frame."""
+        issues = self.plan.with_columns(period_expr(self.bucket))
+        category_periods = issues.group_by(["project", "category", "period"]).agg(
+            pl.len().alias("count"),
+            pl.col("lead_time_hours").sum().round(1).alias("total_lead_time"),
+        )
+        return {
+            # Issue count, share of the project's period and total lead time per category
+            "composition": category_periods.with_columns(
+                _percentage_of("count", ["project", "period"])
+            ).sort(["period", "project", "category"]),
+            # Issue count and share of the period per category, over all projects
+            "trends": category_periods.group_by(["period", "category"])
+            .agg(pl.col("count").sum())
+            .with_columns(_percentage_of("count", ["period"]))
+            .sort(["period", "category"]),
+            # Issue count and mean of every ``FlowMetric`` per project and period
+            "project_periods": issues.group_by(["project", "period"])
+            .agg(
+                pl.len().alias("count_total"),
+                *(pl.col(metric).mean().round(1).alias(f"mean_{metric}") for metric in FlowMetric),
+            )
+            .sort(["period", "project"]),
+            # Mean hours issues of each project spent in each status
+            # (grouped under another name: polars' streaming engine loses a hive
+            # partition column grouped by its own name after a join)
+            "time_in_status": time_in_status_plan(self.transitions)
+            .join(
+                self.plan.select("issue_key", pl.col("project").alias("issue_project")),
+                on="issue_key",
+            )
+            .group_by(["issue_project", "status"])
+            .agg(pl.col("hours").mean().round(1))
+            .rename({"issue_project": "project"})
+            .sort(["project", "status"]),
+        }
+
+
+def _percentage_of(column: str, partition: list[str]) -> pl.Expr:
+    """Get a column's rounded percentage of its total within each partition."""
+    return (pl.col(column) / pl.col(column).sum().over(partition) * 100).round().alias("percentage")
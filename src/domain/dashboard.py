@@ -0,0 +1,276 @@
+"""Single-page dashboard of every chart of an analysis run.
+
+Writing each chart with ``fig.write_html`` embeds the whole plotly.js bundle, several
+megabytes, in every file, and faceting the bar charts by period makes them grow with
+the length of the window. The dashboard instead holds every chart in one page that
+loads plotly.js once and only carries the session's aggregates:
+
+- per-project bar charts show one period at a time, picked with a slider, instead of
+  one facet per period, so their height stays the same however long the window is;
+- line charts switch to WebGL traces once they have enough points for SVG rendering
+  to slow the browser down.
+"""
+
+from __future__ import annotations
+
+from html import escape
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.colors import qualitative
+
+from src.domain.flow_metrics import FLOW_METRIC_LABELS, FlowMetric
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from src.domain.analytics_session import AnalyticsSession
+
+WEBGL_MIN_POINTS = 1000  # Points from which a line chart is drawn with WebGL
+CHART_HEIGHT = 600
+COLORS = qualitative.Prism
+
+_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+</head>
+<body>
+{charts}
+</body>
+</html>
+"""
+
+
+def write_dashboard(
+    session: AnalyticsSession,
+    output_path: str | Path,
+    *,
+    include_plotlyjs: bool | str = True,
+    title: str = "Engineering Work Dashboard",
+) -> None:
+    """Write every chart of a session to one HTML page.
+
+    Args:
+        session: Session whose chart inputs to render
+        output_path: Path to save the HTML file
+        include_plotlyjs: How the page loads plotly.js, as in ``plotly.io.to_html``:
+            ``True`` inlines it once so the page works offline, ``"cdn"`` loads it
+            from the plotly CDN
+        title: Title of the page
+
+    Raises:
+        ValueError: If no data is available for visualization
+
+    """
+    if session.is_empty():
+        msg = "No data available for visualization"
+        raise ValueError(msg)
+
+    charts = [
+        pio.to_html(
+            figure,
+            full_html=False,
+            # The first chart loads plotly.js for all of them
+            include_plotlyjs=include_plotlyjs if index == 0 else False,
+            config={"responsive": True},
+        )
+        for index, figure in enumerate(dashboard_figures(session))
+    ]
+    Path(output_path).write_text(
+        _PAGE.format(title=escape(title), charts="\n".join(charts)), encoding="utf-8"
+    )
+
+
+def dashboard_figures(session: AnalyticsSession) -> list[go.Figure]:
+    """Build the figures of the dashboard from a session's chart inputs.
+
+    Args:
+        session: Session whose chart inputs to render
+
+    Returns:
+        Work composition trends, composition and lead time per project, mean cycle
+        time and reopens per project and period, and mean time in status per project
+
+    """
+    frames = session.frames
+    period_label = session.bucket.label
+    return [
+        _trends_figure(frames["trends"], period_label),
+        _paged_bars(
+            frames["composition"],
+            "percentage",
+            "Engineering Work Taxonomy by Project",
+            "Percentage of Work",
+            period_label,
+            "%{text:.0f}%",
+        ),
+        _paged_bars(
+            frames["composition"],
+            "total_lead_time",
+            "Lead Time by Project and Category",
+            "Total Lead Time (Hours)",
+            period_label,
+            "%{text:.1f}",
+        ),
+        _flow_metric_figure(frames["project_periods"], FlowMetric.CYCLE_TIME, period_label),
+        _flow_metric_figure(frames["project_periods"], FlowMetric.REOPENS, period_label),
+        _time_in_status_figure(frames["time_in_status"]),
+    ]
+
+
+def _line_trace(points: int) -> type[go.Scatter | go.Scattergl]:
+    """Get the trace type to draw a line chart of that many points with."""
+    return go.Scattergl if points >= WEBGL_MIN_POINTS else go.Scatter
+
+
+def _trends_figure(trends: pl.DataFrame, period_label: str) -> go.Figure:
+    """Chart each category's share of the issues of every period, over all projects."""
+    trace = _line_trace(trends.height)
+    figure = go.Figure(
+        [
+            trace(
+                name=category,
+                x=rows["period"].to_list(),
+                y=rows["percentage"].to_list(),
+                mode="lines+markers",
+                line_color=COLORS[index % len(COLORS)],
+            )
+            for index, ((category,), rows) in enumerate(
+                trends.sort("category").partition_by(["category"], as_dict=True).items()
+            )
+        ]
+    )
+    return figure.update_layout(
+        # Weekly, Monthly or Quarterly
+        title=f"{period_label}ly Work Composition Trends",
+        xaxis={"title": period_label, "type": "category", "categoryorder": "category ascending"},
+        yaxis_title="Percentage of Issues",
+        legend_title_text="Work Category",
+        height=CHART_HEIGHT,
+    )
+
+
+def _paged_bars(  # noqa: PLR0913 - the frame and column, plus how to label them
+    composition: pl.DataFrame,
+    column: str,
+    title: str,
+    axis_title: str,
+    period_label: str,
+    texttemplate: str,
+) -> go.Figure:
+    """Chart a column stacked by category per project, one period at a time.
+
+    There is one trace per category. Each step of the period slider restyles them with
+    the projects and values of its period, so every aggregate is in the page once.
+    """
+    categories = composition["category"].unique().sort().to_list()
+    periods = composition["period"].unique().sort().to_list()
+    cells = composition.partition_by(["period", "category"], as_dict=True)
+
+    def page(period: str | None) -> dict[str, list[list]]:
+        """Get the projects and values of every category trace in a period."""
+        projects, values = [], []
+        for category in categories:
+            rows = cells.get((period, category))
+            projects.append([] if rows is None else rows["project"].to_list())
+            values.append([] if rows is None else rows[column].to_list())
+        return {"x": projects, "y": values, "text": values}
+
+    # Opens on the latest period
+    latest = page(periods[-1])
+    figure = go.Figure(
+        [
+            go.Bar(
+                name=category,
+                x=latest["x"][index],
+                y=latest["y"][index],
+                text=latest["text"][index],
+                texttemplate=texttemplate,
+                textposition="inside",
+                marker_color=COLORS[index % len(COLORS)],
+            )
+            for index, category in enumerate(categories)
+        ]
+    )
+    steps = [{"label": period, "method": "restyle", "args": [page(period)]} for period in periods]
+    return figure.update_layout(
+        title=title,
+        barmode="stack",
+        xaxis={"title": "Project", "type": "category"},
+        yaxis_title=axis_title,
+        legend={"title_text": "Work Category", "traceorder": "reversed"},
+        height=CHART_HEIGHT,
+        sliders=[
+            {
+                "active": len(periods) - 1,
+                "currentvalue": {"prefix": f"{period_label}: "},
+                "pad": {"t": 60},
+                "steps": steps,
+            }
+        ],
+    )
+
+
+def _flow_metric_figure(
+    project_periods: pl.DataFrame, metric: FlowMetric, period_label: str
+) -> go.Figure:
+    """Chart a flow metric's mean per project and period.
+
+    Short windows get grouped bars. Long ones get one line per project instead, drawn
+    with WebGL once there are enough points, as thousands of bars render slowly.
+    """
+    points = project_periods.height
+    lines = points >= WEBGL_MIN_POINTS
+    traces = []
+    for index, ((project,), rows) in enumerate(
+        project_periods.sort("project").partition_by(["project"], as_dict=True).items()
+    ):
+        periods = rows["period"].to_list()
+        means = rows[f"mean_{metric}"].to_list()
+        color = COLORS[index % len(COLORS)]
+        if lines:
+            traces.append(
+                _line_trace(points)(
+                    name=project, x=periods, y=means, mode="lines", line_color=color
+                )
+            )
+        else:
+            traces.append(go.Bar(name=project, x=periods, y=means, text=means, marker_color=color))
+    return go.Figure(traces).update_layout(
+        title=f"Mean {FLOW_METRIC_LABELS[metric]} by Project",
+        barmode="group",
+        xaxis={"title": period_label, "type": "category", "categoryorder": "category ascending"},
+        yaxis_title=FLOW_METRIC_LABELS[metric],
+        legend_title_text="Project",
+        height=CHART_HEIGHT,
+    )
+
+
+def _time_in_status_figure(time_in_status: pl.DataFrame) -> go.Figure:
+    """Chart the mean hours issues of each project spent in each status."""
+    figure = go.Figure(
+        [
+            go.Bar(
+                name=status,
+                x=rows["project"].to_list(),
+                y=rows["hours"].to_list(),
+                text=rows["hours"].to_list(),
+                marker_color=COLORS[index % len(COLORS)],
+            )
+            for index, ((status,), rows) in enumerate(
+                time_in_status.sort("status").partition_by(["status"], as_dict=True).items()
+            )
+        ]
+    )
+    return figure.update_layout(
+        title="Mean Time in Status by Project",
+        barmode="stack",
+        xaxis_title="Project",
+        yaxis_title="Mean Hours in Status",
+        legend_title_text="Status",
+        height=CHART_HEIGHT,
+    )
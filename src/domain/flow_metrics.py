@@ -0,0 +1,178 @@
+"""Flow metrics computed from a columnar table of status transitions.
+
+Every status change of every issue in a result set is one row of a long
+``(issue_key, status, timestamp)`` table. Lead time, cycle time, time in status and
+reopen counts are then derived for all issues at once with polars window expressions,
+instead of looping over each issue's ``StatusTransition`` list in Python.
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from src.domain.models import IssueStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from src.domain.models import IssueAnalytics
+
+TRANSITIONS_SCHEMA = {
+    "issue_key": pl.Utf8,
+    "status": pl.Utf8,
+    "timestamp": pl.Datetime("us", "UTC"),
+}
+
+_SECONDS_PER_HOUR = 3600
+
+
+class FlowMetric(StrEnum):
+    """Per-issue flow metrics, named after their column in the analytics frame."""
+
+    LEAD_TIME = "lead_time_hours"  # First "In Progress" to last "Done"
+    CYCLE_TIME = "cycle_time_hours"  # First "In Progress" to the first "Done" after it
+    REOPENS = "reopen_count"  # Times the issue left "Done" again
+
+
+# Name of each metric in chart titles and axes
+FLOW_METRIC_LABELS = {
+    FlowMetric.LEAD_TIME: "Lead Time (Hours)",
+    FlowMetric.CYCLE_TIME: "Cycle Time (Hours)",
+    FlowMetric.REOPENS: "Reopens",
+}
+
+
+def transitions_frame(analytics_page: Iterable[IssueAnalytics]) -> pl.DataFrame:
+    """Flatten the status histories of a page of issues into a transitions table.
+
+    Args:
+        analytics_page: Issues whose ``status_history`` to flatten
+
+    Returns:
+        One row per status change, with timestamps converted to UTC
+
+    """
+    issue_keys: list[str] = []
+    statuses: list[str] = []
+    timestamps = []
+    for analytics in analytics_page:
+        for transition in analytics.status_history:
+            issue_keys.append(analytics.issue_key)
+            statuses.append(transition.status)
+            timestamps.append(transition.timestamp)
+    return pl.DataFrame(
+        {"issue_key": issue_keys, "status": statuses, "timestamp": timestamps},
+        schema=TRANSITIONS_SCHEMA,
+    )
+
+
+def _with_neighbours(transitions: pl.DataFrame | pl.LazyFrame) -> pl.LazyFrame:
+    """Order transitions per issue and add the next timestamp and previous status."""
+    return (
+        transitions.lazy()
+        .sort(["issue_key", "timestamp"])
+        .with_columns(
+            pl.col("timestamp").shift(-1).over("issue_key").alias("left_at"),
+            pl.col("status").shift(1).over("issue_key").alias("previous_status"),
+        )
+    )
+
+
+def _hours(end: pl.Expr, start: pl.Expr) -> pl.Expr:
+    """Get the hours between two datetime expressions."""
+    return (end - start).dt.total_seconds() / _SECONDS_PER_HOUR
+
+
+def flow_metrics(transitions: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame:
+    """Compute lead time, cycle time and reopen count of every issue in one pass.
+
+    See ``flow_metrics_plan`` for the columns.
+    """
+    return flow_metrics_plan(transitions).collect()
+
+
+def flow_metrics_plan(transitions: pl.DataFrame | pl.LazyFrame) -> pl.LazyFrame:
+    """Plan the computation of the lead time, cycle time and reopen count of every issue.
+
+    Lead time matches ``calculate_lead_time``. Cycle time stops at the first "Done"
+    after work started, so later reopenings do not count towards it.
+
+    Args:
+        transitions: Table with the columns of ``TRANSITIONS_SCHEMA``
+
+    Returns:
+        One row per issue with a status change, with a column per ``FlowMetric``.
+        Times are null for issues that never reached the statuses they need
+
+    """
+    in_progress = pl.col("status") == IssueStatus.IN_PROGRESS
+    done = pl.col("status") == IssueStatus.DONE
+    started_at = pl.col("timestamp").filter(in_progress).min()
+    done_after_start = done & (pl.col("timestamp") >= pl.col("started_at"))
+    return (
+        _with_neighbours(transitions)
+        .with_columns(started_at.over("issue_key").alias("started_at"))
+        .group_by("issue_key")
+        .agg(
+            _hours(pl.col("timestamp").filter(done).max(), started_at).alias(FlowMetric.LEAD_TIME),
+            _hours(
+                pl.col("timestamp").filter(done_after_start).min(), pl.col("started_at").first()
+            ).alias(FlowMetric.CYCLE_TIME),
+            ((pl.col("previous_status") == IssueStatus.DONE) & ~done)
+            .sum()
+            .cast(pl.UInt32)
+            .alias(FlowMetric.REOPENS),
+        )
+    )
+
+
+def time_in_status(transitions: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame:
+    """Compute how long every issue spent in each status it went through.
+
+    See ``time_in_status_plan`` for the columns.
+    """
+    return time_in_status_plan(transitions).collect()
+
+
+def time_in_status_plan(transitions: pl.DataFrame | pl.LazyFrame) -> pl.LazyFrame:
+    """Plan the computation of how long every issue spent in each status it went through.
+
+    The status an issue is currently in has no end yet and is left out. Transitions
+    that already carry their ``hours``, see ``transition_hours_plan``, are summed as
+    they are, which needs no per-issue ordering and so can be streamed.
+
+    Args:
+        transitions: Table with the columns of ``TRANSITIONS_SCHEMA``, and optionally
+            ``hours``
+
+    Returns:
+        One row per issue and status, with the total ``hours`` spent in it
+
+    """
+    timed = transitions.lazy()
+    if "hours" not in timed.columns:
+        timed = transition_hours_plan(timed)
+    return (
+        timed.filter(pl.col("hours").is_not_null())
+        .group_by(["issue_key", "status"])
+        .agg(pl.col("hours").sum())
+    )
+
+
+def transition_hours_plan(transitions: pl.DataFrame | pl.LazyFrame) -> pl.LazyFrame:
+    """Plan adding to every transition the ``hours`` until the issue's next transition.
+
+    Args:
+        transitions: Table with the columns of ``TRANSITIONS_SCHEMA``, holding the
+            complete history of every issue in it
+
+    Returns:
+        The transitions with an ``hours`` column, null for each issue's last one
+
+    """
+    return _with_neighbours(transitions).select(
+        *TRANSITIONS_SCHEMA, _hours(pl.col("left_at"), pl.col("timestamp")).alias("hours")
+    )
@@ -1,29 +1,72 @@
 """Service for creating and managing Jira Plans."""
 
-from typing import Set, Tuple
+from __future__ import annotations
 
-from src.adapters.secondary.jira.jira_adapter import JiraAdapter
-from src.adapters.secondary.jira.models import JiraPlanRequest, JiraPlanResponse
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytz
+
+from src.adapters.secondary.jira.key_filters import (
+    DEFAULT_MAX_FILTER_JQL_LENGTH,
+    build_key_filter_jqls,
+    build_key_jql,
+)
+from src.adapters.secondary.jira.models import JiraFilter, JiraPlanRequest, JiraPlanResponse
 from src.domain.models import Issue, JiraPlan
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from src.adapters.secondary.jira.jira_adapter import JiraAdapter
+    from src.adapters.secondary.storage.issue_graph import IssueGraph, IssueNode
+
+# Levels of parents and of linked issues followed from the root issues
+DEFAULT_MAX_DEPTH = 1
+# Relations read from the issue graph are trusted for this long before being refetched
+DEFAULT_GRAPH_MAX_AGE = timedelta(days=1)
+
 
 class JiraPlanService:
     """Service for creating and managing Jira Plans."""
 
-    def __init__(self, jira_adapter: JiraAdapter) -> None:
-        """Initialize JiraPlanService with a JIRA adapter."""
+    def __init__(
+        self,
+        jira_adapter: JiraAdapter,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        issue_graph: IssueGraph | None = None,
+        graph_max_age: timedelta = DEFAULT_GRAPH_MAX_AGE,
+        max_filter_length: int = DEFAULT_MAX_FILTER_JQL_LENGTH,
+    ) -> None:
+        """Initialize JiraPlanService with a JIRA adapter.
+
+        Args:
+            jira_adapter: Adapter used to read issues and create the plan
+            max_depth: Levels of parents and of linked issues to follow from the roots
+            issue_graph: Index of issue relations consulted before calling the API
+            graph_max_age: Age after which an indexed issue's relations are refetched
+            max_filter_length: Length of the JQL above which the plan's issues are
+                split over several filters
+
+        """
         self.jira_adapter = jira_adapter
+        self.max_depth = max_depth
+        self.issue_graph = issue_graph
+        self.graph_max_age = graph_max_age
+        self.max_filter_length = max_filter_length
 
     def create_plan(
         self, issue_ids: list[str], name: str, lead_email: str | None = None
-    ) -> Tuple[JiraPlan, JiraPlanResponse]:
+    ) -> tuple[JiraPlan, JiraPlanResponse]:
         """Create a Jira Plan from a list of issue IDs.
 
         This method will:
         1. Get the root issues from the provided IDs
-        2. Recursively get all parent issues (epics, initiatives)
-        3. Recursively get all child issues (stories, tasks, bugs)
+        2. Get the parent issues (epics, initiatives), up to ``max_depth`` levels up
+        3. Get the linked child issues (stories, tasks, bugs), up to ``max_depth`` levels
         4. Generate a JQL query that includes all related issues
+        5. Create as many filters as needed to keep each one's JQL short, and use them
+           all as issue sources of the plan
         """
         # First get all related issues and their JQL
         plan = self._get_related_issues(issue_ids)
@@ -31,16 +74,12 @@ class JiraPlanService:
         # Get account ID from email
         lead_account_id = self.jira_adapter.get_account_id(lead_email)
 
-        # Create a filter with the JQL
-        filter_name = f"Filter for plan: {name}"
-        jira_filter = self.jira_adapter.create_filter(
-            name=filter_name, jql=plan.jql, owner_account_id=lead_account_id
-        )
+        filters = self._create_filters(name, plan, lead_account_id)
 
-        # Create the Jira Plan using the filter
+        # Create the Jira Plan using the filters
         request = JiraPlanRequest(
             name=name,
-            issue_sources=[{"type": "Filter", "value": jira_filter.id}],
+            issue_sources=[{"type": "Filter", "value": jira_filter.id} for jira_filter in filters],
             scheduling={
                 "dependencies": "Sequential",
                 "endDate": {"type": "DueDate"},
@@ -55,59 +94,141 @@ class JiraPlanService:
         )
 
         response = self.jira_adapter.create_jira_plan(request)
+        response.filters = filters
         return plan, response
 
+    def _create_filters(
+        self, name: str, plan: JiraPlan, owner_account_id: str | None
+    ) -> list[JiraFilter]:
+        """Create the filters selecting the plan's issues, timing each one's JQL.
+
+        Runs of consecutive keys are written as key ranges, and the clauses are spread
+        over several filters when a single JQL string would exceed ``max_filter_length``.
+        """
+        issue_keys = [
+            issue.key for issue in plan.root_issues + plan.parent_issues + plan.child_issues
+        ]
+        jqls = build_key_filter_jqls(issue_keys, self.max_filter_length)
+        filters = []
+        for number, jql in enumerate(jqls, start=1):
+            issue_count, evaluation_seconds = self.jira_adapter.time_jql(jql)
+            filter_name = f"Filter for plan: {name}"
+            if len(jqls) > 1:
+                filter_name += f" ({number}/{len(jqls)})"
+            jira_filter = self.jira_adapter.create_filter(
+                name=filter_name, jql=jql, owner_account_id=owner_account_id
+            )
+            jira_filter.issue_count = issue_count
+            jira_filter.evaluation_seconds = evaluation_seconds
+            filters.append(jira_filter)
+        return filters
+
     def _get_related_issues(self, issue_ids: list[str]) -> JiraPlan:
-        """Get all related issues for the given issue IDs."""
-        # Get root issues
-        root_issues = [self.jira_adapter.get_issue(id) for id in issue_ids]
-
-        # Get parent issues recursively
-        parent_issues: list[Issue] = []
-        parent_keys: Set[str] = set()
-        for issue in root_issues:
-            self._get_parent_issues_recursive(issue.key, parent_issues, parent_keys)
-
-        # Get child issues recursively
-        child_issues: list[Issue] = []
-        child_keys: Set[str] = set()
-        for issue in root_issues + parent_issues:
-            self._get_child_issues_recursive(issue.key, child_keys)
-
-        # Generate JQL
-        all_keys = (
-            [issue.key for issue in root_issues]
-            + [issue.key for issue in parent_issues]
-            + list(child_keys)
+        """Get all related issues for the given issue IDs.
+
+        Relations are read from the issue graph where it holds recent enough data, so
+        the API is only asked about the remaining issues. The details of every issue
+        found are then fetched in one batched lookup.
+        """
+        root_issues = [self.jira_adapter.get_issue(issue_id) for issue_id in issue_ids]
+        fetched = {issue.key: issue for issue in root_issues}
+        self._record(root_issues)
+        visited = set(fetched)
+
+        parent_keys = self._walk_levels(
+            list(fetched),
+            lambda node: [node.parent_key] if node.parent_key else [],
+            visited,
+            fetched,
         )
-        jql = f"key in ({','.join(all_keys)})"
+        child_keys = self._walk_levels(
+            list(fetched) + parent_keys, lambda node: node.linked_issue_keys, visited, fetched
+        )
+
+        missing_keys = [key for key in parent_keys + child_keys if key not in fetched]
+        if missing_keys:
+            issues = self.jira_adapter.get_issues(missing_keys)
+            fetched.update((issue.key, issue) for issue in issues)
+        parent_issues = [fetched[key] for key in parent_keys if key in fetched]
+        child_issues = [fetched[key] for key in child_keys if key in fetched]
+
+        # Generate JQL, with runs of consecutive keys as ranges
+        all_keys = [issue.key for issue in root_issues + parent_issues + child_issues]
+        jql = build_key_jql(all_keys)
 
         return JiraPlan(
             root_issues=root_issues, parent_issues=parent_issues, child_issues=child_issues, jql=jql
         )
 
-    def _get_parent_issues_recursive(
-        self, issue_key: str, parent_issues: list[Issue], seen_keys: Set[str]
-    ) -> None:
-        """Recursively get all parent issues of a given issue."""
-        if issue_key in seen_keys:
-            return
-
-        parent = self.jira_adapter.get_parent_issue(issue_key)
-        if parent:
-            seen_keys.add(parent.key)
-            parent_issues.append(parent)
-            self._get_parent_issues_recursive(parent.key, parent_issues, seen_keys)
-
-    def _get_child_issues_recursive(
-        self, issue_key: str, seen_keys: Set[str]
-    ) -> set[str]:
-        """Recursively get all child issues of a given issue."""
-        if issue_key in seen_keys:
-            return
-
-        children_keys = self.jira_adapter.get_child_issues_keys(issue_key)
-        for child_key in children_keys:
-            if child_key not in seen_keys:
-                seen_keys.add(child_key)
-                self._get_child_issues_recursive(child_key, seen_keys)
+    def _walk_levels(
+        self,
+        start_keys: list[str],
+        neighbour_keys: Callable[[Issue | IssueNode], Iterable[str]],
+        visited: set[str],
+        fetched: dict[str, Issue],
+    ) -> list[str]:
+        """Collect the keys of the issues reachable from ``start_keys``, level by level.
+
+        The relations of a whole level are resolved at once: from issues already
+        fetched, from fresh issue graph nodes, and with one batched lookup for the rest.
+        Issues already in ``visited`` are never visited again.
+
+        Args:
+            start_keys: Keys of the issues to walk from
+            neighbour_keys: Keys of the issues one level away from an issue or graph node
+            visited: Keys of the issues found so far, updated in place
+            fetched: Issues fetched so far by key, updated in place
+
+        Returns:
+            The keys found, level by level
+
+        """
+        found: list[str] = []
+        frontier = start_keys
+        for _ in range(self.max_depth):
+            relations = self._get_relations(frontier, fetched)
+            next_keys = [
+                key
+                for key in dict.fromkeys(key for node in relations for key in neighbour_keys(node))
+                if key not in visited
+            ]
+            if not next_keys:
+                break
+            visited.update(next_keys)
+            found.extend(next_keys)
+            frontier = next_keys
+        return found
+
+    def _get_relations(
+        self, issue_keys: list[str], fetched: dict[str, Issue]
+    ) -> list[Issue | IssueNode]:
+        """Get the relations of issues, fetching only those not known well enough."""
+        relations: list[Issue | IssueNode] = []
+        stale_keys = []
+        for key in issue_keys:
+            if key in fetched:
+                relations.append(fetched[key])
+            elif (node := self._fresh_node(key)) is not None:
+                relations.append(node)
+            else:
+                stale_keys.append(key)
+        if stale_keys:
+            issues = self.jira_adapter.get_issues(stale_keys)
+            self._record(issues)
+            fetched.update((issue.key, issue) for issue in issues)
+            relations.extend(issues)
+        return relations
+
+    def _fresh_node(self, issue_key: str) -> IssueNode | None:
+        """Get an issue's graph node if it was synced within ``graph_max_age``."""
+        if self.issue_graph is None:
+            return None
+        node = self.issue_graph.get_node(issue_key)
+        if node is None or datetime.now(pytz.utc) - node.synced_at > self.graph_max_age:
+            return None
+        return node
+
+    def _record(self, issues: list[Issue]) -> None:
+        """Write the relations of freshly fetched issues to the issue graph."""
+        if self.issue_graph is not None:
+            self.issue_graph.update(issues)
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import sys
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
 from enum import StrEnum
-
+from functools import cache
 
 import pytz
 from pydantic import BaseModel, ConfigDict, Field
@@ -25,16 +26,62 @@ class IssueStatus(StrEnum):
     WONT_DO = "Won't Do"
 
 
+class Bucket(StrEnum):
+    """Periods resolved issues are grouped into by analytics charts."""
+
+    WEEK = "week"
+    MONTH = "month"
+    QUARTER = "quarter"
+
+    @property
+    def label(self) -> str:
+        """Name of the period in chart labels."""
+        return self.name.title()
+
+
+class SearchMode(StrEnum):
+    """Strategies for paging through JQL search results."""
+
+    PARALLEL = "parallel"  # Read the total from the first page, fetch the rest concurrently
+    SERIAL = "serial"  # Walk the pages one after another
+    # Pipelined nextPageToken paging on the enhanced JQL search endpoint
+    TOKEN = "token"  # noqa: S105 - a paging mode, not a credential
+    SHARDED = "sharded"  # Split by project and resolved date, fetch the shards concurrently
+
+
 @dataclass
+class SyncState:
+    """Sync progress of a single project in the local store."""
+
+    covered_from: date  # Every issue resolved on or after this date has been loaded
+    high_water_mark: datetime  # Latest ``updated`` timestamp seen for the project
+
+
+@dataclass(frozen=True, slots=True)
 class Project:
-    """Represents a JIRA project with its key, name and optional category."""
+    """Represents a JIRA project with its key, name and optional category.
+
+    Projects are immutable so that every issue of a project can share one instance,
+    see ``shared_project``.
+    """
 
     key: str
     name: str
     category_id: str | None = None
 
 
-@dataclass
+@cache
+def shared_project(key: str, name: str, category_id: str | None = None) -> Project:
+    """Get the single Project instance for the given values, creating it on first use."""
+    return Project(sys.intern(key), sys.intern(name), category_id)
+
+
+def intern_text(value: str | None) -> str | None:
+    """Intern a value repeated across many issues, like a status or category name."""
+    return sys.intern(value) if value is not None else None
+
+
+@dataclass(slots=True)
 class StatusTransition:
     """Represents a status change event with the new status and timestamp."""
 
@@ -55,8 +102,40 @@ class CreateIssueRequest(BaseModel):
 
 
 @dataclass
+class IssueCreationResult:
+    """Outcome of creating one issue of a bulk import."""
+
+    row: int  # Position of the request in the import, starting at 1
+    key: str | None = None  # Key of the created issue
+    error: str | None = None  # Why the issue could not be created
+    resumed: bool = False  # Created by an earlier, interrupted run of the import
+
+    @property
+    def created(self) -> bool:
+        """Whether the issue exists in JIRA."""
+        return self.key is not None
+
+
+@dataclass
+class IssueDeletionResult:
+    """Outcome of deleting one issue of a bulk delete."""
+
+    key: str
+    error: str | None = None  # Why the issue could not be deleted
+
+    @property
+    def deleted(self) -> bool:
+        """Whether the issue was deleted."""
+        return self.error is None
+
+
+@dataclass(slots=True)
 class Issue:
-    """Represents a JIRA issue with all its attributes and history."""
+    """Represents a JIRA issue with all its attributes and history.
+
+    Issues are slotted, share their ``Project`` and hold interned status, type and
+    category values, as analyses keep hundreds of thousands of them in memory.
+    """
 
     description: str
     summary: str
@@ -69,6 +148,9 @@ class Issue:
     url: str
     status_history: list[StatusTransition]
     lead_time_hours: float | None = None
+    updated: datetime | None = None
+    parent_key: str | None = None  # Epic or initiative the issue belongs to
+    linked_issue_keys: tuple[str, ...] = ()  # Issues linked in either direction
 
     @property
     def is_completed(self) -> bool:
@@ -91,17 +173,18 @@ class JiraPlan:
     jql: str  # The JQL query that can fetch all related issues
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueAnalytics:
     """Analytics view of an Issue, containing only the fields needed for analysis."""
 
     project: str
     issue_key: str
     category: str
-    resolved: str
+    resolved: datetime | None
     type: str
     url: str
     lead_time_hours: float | None
+    status_history: list[StatusTransition] = field(default_factory=list)
 
     @classmethod
     def from_issue(cls, issue: Issue) -> "IssueAnalytics":
@@ -110,8 +193,9 @@ class IssueAnalytics:
             project=issue.project.name,
             issue_key=issue.key,
             category=issue.engineering_category,
-            resolved=issue.resolution_date.isoformat() if issue.resolution_date else None,
+            resolved=issue.resolution_date,
             type=issue.issue_type,
             url=issue.url,
             lead_time_hours=issue.lead_time_hours,
+            status_history=issue.status_history,
         )
@@ -1,20 +1,108 @@
-from datetime import datetime
+from __future__ import annotations
 
-from src.adapters.secondary.jira.jira_adapter import JiraAdapter
-from src.domain.models import CreateIssueRequest, Issue, IssueAnalytics, Project
+from datetime import datetime, timedelta
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any
+
+import pytz
+from pydantic import ValidationError
+
+from src.domain.models import (
+    CreateIssueRequest,
+    Issue,
+    IssueAnalytics,
+    IssueCreationResult,
+    IssueDeletionResult,
+    Project,
+    SearchMode,
+    SyncState,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from src.adapters.secondary.jira.jira_adapter import JiraAdapter
+    from src.adapters.secondary.storage.issue_graph import IssueGraph
+    from src.adapters.secondary.storage.issue_import import ImportJournal
+    from src.adapters.secondary.storage.issue_store import IssueStore
+
+# JQL compares dates in the user's time zone, so delta syncs re-fetch a day of overlap
+DELTA_SYNC_OVERLAP = timedelta(days=1)
+# Rows validated and handed to the adapter at once, which submits them in bulk batches
+IMPORT_CHUNK_SIZE = 500
 
 
 class TaskService:
     """Service class responsible for handling JIRA task-related operations and analytics."""
 
-    def __init__(self, jira_adapter: JiraAdapter) -> None:
-        """Initialize TaskService with a JIRA adapter."""
+    def __init__(
+        self,
+        jira_adapter: JiraAdapter,
+        issue_store: IssueStore | None = None,
+        issue_graph: IssueGraph | None = None,
+    ) -> None:
+        """Initialize TaskService with a JIRA adapter and optional local storage.
+
+        Args:
+            jira_adapter: Adapter used to read and write issues
+            issue_store: Local copy of issues that analytics are synced into
+            issue_graph: Index of issue relations, kept current by syncs
+
+        """
         self.jira_adapter = jira_adapter
+        self.issue_store = issue_store
+        self.issue_graph = issue_graph
 
     def create_issue(self, create_issue_request: CreateIssueRequest) -> Issue:
         """Create a new JIRA issue."""
         return self.jira_adapter.create_issue(create_issue_request)
 
+    def create_issues(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        journal: ImportJournal | None = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> Iterator[IssueCreationResult]:
+        """Create an issue for every row of an import.
+
+        Rows are validated ``chunk_size`` at a time and the valid ones created with
+        bulk requests. Rows the journal lists as created by an earlier run are skipped,
+        and every issue created is added to the journal.
+
+        Args:
+            rows: Field values of the ``CreateIssueRequest`` of each issue
+            journal: Record of the rows already created, for resuming an import
+            chunk_size: Number of rows validated and submitted at a time
+
+        Returns:
+            One result per row, in row order, with ``row`` counting from 1
+
+        """
+        numbered_rows = enumerate(rows, start=1)
+        while chunk := list(islice(numbered_rows, chunk_size)):
+            results = []
+            pending: list[tuple[int, CreateIssueRequest]] = []
+            for row, values in chunk:
+                key = journal.created_key(row) if journal is not None else None
+                if key is not None:
+                    results.append(IssueCreationResult(row=row, key=key, resumed=True))
+                    continue
+                try:
+                    pending.append((row, CreateIssueRequest.model_validate(values)))
+                except ValidationError as error:
+                    results.append(IssueCreationResult(row=row, error=_describe(error)))
+
+            if pending:
+                created = self.jira_adapter.create_issues([request for _, request in pending])
+                created = [
+                    IssueCreationResult(row=row, key=result.key, error=result.error)
+                    for (row, _), result in zip(pending, created, strict=True)
+                ]
+                if journal is not None:
+                    journal.record(created)
+                results.extend(created)
+            yield from sorted(results, key=lambda result: result.row)
+
     def get_issue(self, issue_id: str) -> Issue:
         """Get details of a specific issue."""
         return self.jira_adapter.get_issue(issue_id)
@@ -23,6 +111,18 @@ class TaskService:
         """Delete a JIRA issue."""
         self.jira_adapter.delete_issue(issue_id)
 
+    def delete_issues(self, issue_keys: list[str]) -> list[IssueDeletionResult]:
+        """Delete several JIRA issues concurrently, reporting the outcome per issue."""
+        return self.jira_adapter.delete_issues(issue_keys)
+
+    def iter_issue_records(self, jql: str, fields: list[str]) -> Iterator[list[dict[str, Any]]]:
+        """Yield flat records of the issues matching a JQL query, one page at a time."""
+        return self.jira_adapter.iter_issue_records(jql, fields)
+
+    def search_issue_keys(self, jql: str) -> list[str]:
+        """Get the keys of the issues matching a JQL query."""
+        return self.jira_adapter.search_issue_keys(jql)
+
     def get_core_connectivity_projects_keys(self) -> list[Project]:
         """Get list of all Core Connectivity projects."""
         return self.jira_adapter.get_core_connectivity_projects_keys()
@@ -32,20 +132,135 @@ class TaskService:
         start_date: datetime,
         end_date: datetime,
         projects: list[str] | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        *,
+        full_refresh: bool = False,
     ) -> list[IssueAnalytics]:
         """Get engineering work taxonomy for all projects or specified projects.
 
+        When an issue store is configured, the store is delta-synced first and the
+        issues are read from it; otherwise they are searched directly in JIRA.
+
         Args:
             start_date: Start date for analysis
             end_date: End date for analysis
             projects: Optional list of specific projects to analyze.
                 If None, analyzes all projects.
+            search_mode: How to page through the search results. Defaults to parallel
+            full_refresh: Reload every issue in the window instead of a delta sync
 
         Returns:
             DataFrame with project work composition
 
         """
-        issues = self.jira_adapter.search_issues(start_date, end_date, projects)
+        pages = self.iter_engineering_taxonomy(
+            start_date, end_date, projects, search_mode, full_refresh=full_refresh
+        )
+        return list(chain.from_iterable(pages))
+
+    def iter_engineering_taxonomy(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        projects: list[str] | None = None,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        *,
+        full_refresh: bool = False,
+    ) -> Iterator[list[IssueAnalytics]]:
+        """Yield the engineering work taxonomy one page of issues at a time.
+
+        Only one page of issues is materialized at a time, so callers that consume the
+        pages incrementally need memory proportional to the page size.
+
+        Args:
+            start_date: Start date for analysis
+            end_date: End date for analysis
+            projects: Optional list of specific projects to analyze.
+                If None, analyzes all projects.
+            search_mode: How to page through the search results. Defaults to parallel
+            full_refresh: Reload every issue in the window instead of a delta sync
+
+        """
+        if self.issue_store is None:
+            pages = self.jira_adapter.iter_search_issue_pages(
+                start_date, end_date, projects, search_mode
+            )
+        else:
+            project_keys = self._resolve_project_keys(projects)
+            self.sync_issues(project_keys, start_date, search_mode, full_refresh=full_refresh)
+            pages = self.issue_store.iter_issue_pages(project_keys, start_date, end_date)
+
+        for issues in pages:
+            # Convert issues to IssueAnalytics domain models
+            yield [IssueAnalytics.from_issue(issue) for issue in issues]
+
+    def sync_issues(
+        self,
+        project_keys: list[str],
+        since: datetime,
+        search_mode: SearchMode = SearchMode.PARALLEL,
+        *,
+        full_refresh: bool = False,
+    ) -> None:
+        """Bring the local issue store up to date for the given projects.
+
+        A project is fully reloaded from ``since`` when it has never been synced, when
+        ``since`` is earlier than what the store covers, or when ``full_refresh`` is set.
+        Otherwise only issues updated since the project's high-water mark are fetched
+        and merged in. Issues are written to the store page by page as they arrive,
+        and their relations to the issue graph if one is configured.
+
+        Args:
+            project_keys: Keys of the projects to sync
+            since: Earliest resolution date the store must cover
+            search_mode: How to page through the search results. Defaults to parallel
+            full_refresh: Reload every issue resolved since ``since``
+
+        """
+        if self.issue_store is None:
+            msg = "No issue store configured"
+            raise ValueError(msg)
+
+        for project_key in project_keys:
+            state = self.issue_store.get_sync_state(project_key)
+
+            if full_refresh or state is None or since.date() < state.covered_from:
+                # Dropping the sync state first means an interrupted reload is redone
+                self.issue_store.delete_project_issues(project_key)
+                state = SyncState(covered_from=since.date(), high_water_mark=datetime.now(pytz.utc))
+                pages = self.jira_adapter.iter_project_issue_pages(
+                    project_key, resolved_since=since, search_mode=search_mode
+                )
+                latest_update = None
+            else:
+                pages = self.jira_adapter.iter_project_issue_pages(
+                    project_key,
+                    updated_since=state.high_water_mark - DELTA_SYNC_OVERLAP,
+                    search_mode=search_mode,
+                )
+                latest_update = state.high_water_mark
+
+            for issues in pages:
+                self.issue_store.upsert_issues(issues)
+                if self.issue_graph is not None:
+                    self.issue_graph.update(issues)
+                for issue in issues:
+                    if issue.updated and (latest_update is None or issue.updated > latest_update):
+                        latest_update = issue.updated
+
+            if latest_update is not None:
+                state.high_water_mark = latest_update
+            self.issue_store.save_sync_state(project_key, state)
+
+    def _resolve_project_keys(self, projects: list[str] | list[Project] | None) -> list[str]:
+        """Get the keys of the requested projects, defaulting to Core Connectivity."""
+        if projects is None:
+            projects = self.get_core_connectivity_projects_keys()
+        return [project.key if isinstance(project, Project) else project for project in projects]
+
 
-        # Convert issues to IssueAnalytics domain models
-        return [IssueAnalytics.from_issue(issue) for issue in issues]
+def _describe(error: ValidationError) -> str:
+    """Summarize a row's validation errors on a single line."""
+    return "; ".join(
+        f"{'.'.join(map(str, detail['loc']))}: {detail['msg']}" for detail in error.errors()
+    )
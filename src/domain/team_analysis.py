@@ -1,13 +1,45 @@
 """Team analysis module for generating engineering work visualizations.
 
 This module provides functionality to analyze and visualize engineering work data,
-including project composition, lead times, and weekly trends.
+including project composition, lead times, weekly trends and flow metrics.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import plotly.express as px
 import polars as pl
 
-from src.domain.models import IssueAnalytics
+from src.domain import dashboard
+from src.domain.analytics_session import AnalyticsSession
+from src.domain.flow_metrics import (
+    FLOW_METRIC_LABELS,
+    FlowMetric,
+    flow_metrics_plan,
+    transitions_frame,
+)
+from src.domain.models import Bucket, IssueAnalytics
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Columns of the analytics frame, in IssueAnalytics field order
+ANALYTICS_SCHEMA = {
+    "project": pl.Utf8,
+    "issue_key": pl.Utf8,
+    "category": pl.Utf8,
+    "resolved": pl.Datetime("us", "UTC"),
+    "type": pl.Utf8,
+    "url": pl.Utf8,
+    "lead_time_hours": pl.Float64,
+}
+
+# Columns of the CSV export, in the order it has always had them
+CSV_COLUMNS = (*ANALYTICS_SCHEMA, "week")
+
+# Flow metrics joined onto the analytics frame, next to the mapped lead time
+JOINED_FLOW_METRICS = (FlowMetric.CYCLE_TIME, FlowMetric.REOPENS)
 
 
 class TeamAnalysis:
@@ -17,29 +49,103 @@ class TeamAnalysis:
     of team performance and work distribution.
     """
 
-    def _to_dataframe(self, analytics_data: list[IssueAnalytics]) -> pl.DataFrame:
-        """Convert IssueAnalytics list to DataFrame with calculated week column."""
-        if not analytics_data:
-            return pl.DataFrame()
-
-        issue_data = pl.DataFrame([vars(analytics) for analytics in analytics_data])
-        if not issue_data.is_empty():
-            issue_data = issue_data.with_columns(
-                [
-                    (pl.col("resolved").str.strptime(pl.Datetime).dt.truncate("1w") + pl.duration(days=6)).dt.strftime("%Y-%m-%d").alias("week"),
-                ],
-            )
-        return issue_data.unique()
+    def build_dataframe(self, analytics_pages: Iterable[list[IssueAnalytics]]) -> pl.DataFrame:
+        """Build the analytics DataFrame incrementally from pages of IssueAnalytics.
+
+        Each page is converted to a small columnar frame as soon as it arrives, so only
+        one page of Python objects is alive at a time and the result is held in
+        polars' compact columnar form.
+
+        Args:
+            analytics_pages: Pages of IssueAnalytics, e.g. from
+                ``TaskService.iter_engineering_taxonomy``
+
+        """
+        return self.build_session(analytics_pages).issues
+
+    def build_session(
+        self,
+        analytics_pages: Iterable[list[IssueAnalytics]],
+        bucket: Bucket = Bucket.WEEK,
+    ) -> AnalyticsSession:
+        """Build the analytics frame and status transitions table of a run, once.
+
+        Like ``build_dataframe``, but also flattens the issues' status histories into
+        one transitions table, page by page, and joins the flow metrics computed from
+        it onto the analytics frame. Pass the session to every chart of the run.
+
+        Args:
+            analytics_pages: Pages of IssueAnalytics, e.g. from
+                ``TaskService.iter_engineering_taxonomy``
+            bucket: Periods the session's charts group issues into
+
+        Returns:
+            The session holding the analytics frame, with a column per
+            ``JOINED_FLOW_METRICS``, and the transitions table
+
+        """
+        # Starts with empty pages, so an empty run still has every column
+        chunks = [self._page_to_dataframe([])]
+        transition_chunks = [transitions_frame([])]
+        for page in analytics_pages:
+            if page:
+                chunks.append(self._page_to_dataframe(page))
+                transition_chunks.append(transitions_frame(page))
+
+        transitions = pl.concat(transition_chunks, rechunk=True).lazy().unique(maintain_order=True)
+        metrics = flow_metrics_plan(transitions).select("issue_key", *JOINED_FLOW_METRICS)
+        plan = (
+            pl.concat(chunks, rechunk=True)
+            .lazy()
+            # Overlapping pages or shards return the same issue more than once
+            .unique(subset="issue_key")
+            .join(metrics, on="issue_key", how="left", coalesce=True)
+            .with_columns(pl.col(FlowMetric.REOPENS).fill_null(0))
+        )
+        return AnalyticsSession(plan, transitions, bucket)
+
+    def _page_to_dataframe(self, analytics_page: list[IssueAnalytics]) -> pl.DataFrame:
+        """Convert one page of IssueAnalytics to a DataFrame with calculated week column.
+
+        Columns are built with their final types, so resolution dates are never
+        rendered to text and parsed back.
+        """
+        issue_data = pl.DataFrame(
+            {
+                column: [getattr(analytics, column) for analytics in analytics_page]
+                for column in ANALYTICS_SCHEMA
+            },
+            schema=ANALYTICS_SCHEMA,
+        )
+        return issue_data.with_columns(
+            (pl.col("resolved").dt.truncate("1w") + pl.duration(days=6))
+            .dt.strftime("%Y-%m-%d")
+            .alias("week"),
+        )
+
+    def _to_session(
+        self, analytics_data: list[IssueAnalytics] | pl.DataFrame | AnalyticsSession
+    ) -> AnalyticsSession:
+        """Wrap analytics data in a session, building the frame only if needed.
+
+        Sessions are returned unchanged, so the groupings they cached are reused.
+        """
+        if isinstance(analytics_data, AnalyticsSession):
+            return analytics_data
+        if isinstance(analytics_data, pl.DataFrame):
+            return AnalyticsSession(analytics_data.lazy())
+        return self.build_session([analytics_data])
 
     def visualize_project_composition(
         self,
-        analytics_data: list[IssueAnalytics],
+        analytics_data: list[IssueAnalytics] | pl.DataFrame | AnalyticsSession,
         output_path: str = "project_composition.html",
     ) -> None:
         """Create an interactive bar chart of project work composition.
 
         Args:
-            analytics_data: List of IssueAnalytics objects containing work data
+            analytics_data: IssueAnalytics objects, a frame from ``build_dataframe`` or
+                a session from ``build_session``
             output_path: Path to save the visualization HTML file. Defaults to
                 'project_composition.html'
 
@@ -47,43 +153,26 @@ class TeamAnalysis:
             ValueError: If no data is available for visualization
 
         """
-        issue_data = self._to_dataframe(analytics_data)
-        if issue_data.is_empty():
+        session = self._to_session(analytics_data)
+        if session.is_empty():
             msg = "No data available for visualization"
             raise ValueError(msg)
 
-        # Calculate composition percentages
-        composition = (
-            issue_data.groupby(["project", "category", "week"])
-            .agg(pl.count().alias("count"))
-            .join(
-                issue_data.groupby(["project", "week"]).agg(
-                    pl.count().alias("count_total"),
-                ),
-                on=["project", "week"],
-            )
-            .with_columns(
-                (pl.col("count") / pl.col("count_total") * 100).round().alias("percentage"),
-            )
-            .sort("project")
-            .sort("week")
-        )
-
-        # Create stacked bar chart
+        # Create stacked bar chart of the composition percentages
         fig = (
             px.bar(
-                composition,
+                session.frames["composition"],
                 x="project",
                 y="percentage",
                 color="category",
                 title="Engineering Work Taxonomy by project",
-                facet_col="week",
+                facet_col="period",
                 facet_col_wrap=1,
                 labels={
                     "percentage": "Percentage of Work",
                     "category": "Work Category",
                     "project": "Project",
-                    "Week": "Week",
+                    "period": session.bucket.label,
                 },
                 barmode="stack",
                 height=2000,
@@ -99,13 +188,14 @@ class TeamAnalysis:
 
     def visualize_project_lead_time(
         self,
-        analytics_data: list[IssueAnalytics],
+        analytics_data: list[IssueAnalytics] | pl.DataFrame | AnalyticsSession,
         output_path: str = "project_lead_time.html",
     ) -> None:
         """Create an interactive bar chart showing lead time by project and category.
 
         Args:
-            analytics_data: List of IssueAnalytics objects containing work data
+            analytics_data: IssueAnalytics objects, a frame from ``build_dataframe`` or
+                a session from ``build_session``
             output_path: Path to save the visualization HTML file. Defaults to
                 'project_lead_time.html'
 
@@ -113,34 +203,26 @@ class TeamAnalysis:
             ValueError: If no data is available for visualization
 
         """
-        issue_data = self._to_dataframe(analytics_data)
-        if issue_data.is_empty():
+        session = self._to_session(analytics_data)
+        if session.is_empty():
             msg = "No data available for visualization"
             raise ValueError(msg)
 
-        # Calculate total lead time for each project/category/week
-        composition = (
-            issue_data.groupby(["project", "category", "week"])
-            .agg(pl.col("lead_time_hours").sum().round(1).alias("total_lead_time"))
-            .sort("project")
-            .sort("week")
-        )
-
-        # Create stacked bar chart
+        # Create stacked bar chart of the total lead time of each project/category/period
         fig = (
             px.bar(
-                composition,
+                session.frames["composition"],
                 x="project",
                 y="total_lead_time",
                 color="category",
                 title="Lead Time by Project and Category",
-                facet_col="week",
+                facet_col="period",
                 facet_col_wrap=1,
                 labels={
                     "total_lead_time": "Total Lead Time (Hours)",
                     "category": "Work Category",
                     "project": "Project",
-                    "Week": "Week",
+                    "period": session.bucket.label,
                 },
                 barmode="stack",
                 height=2000,
@@ -156,13 +238,14 @@ class TeamAnalysis:
 
     def analyze_weekly_trends(
         self,
-        analytics_data: list[IssueAnalytics],
+        analytics_data: list[IssueAnalytics] | pl.DataFrame | AnalyticsSession,
         output_path: str = "weekly_trends.html",
     ) -> None:
-        """Create an interactive line chart showing weekly work composition trends.
+        """Create an interactive line chart showing work composition trends per period.
 
         Args:
-            analytics_data: List of IssueAnalytics objects containing work data
+            analytics_data: IssueAnalytics objects, a frame from ``build_dataframe`` or
+                a session from ``build_session``
             output_path: Path to save the visualization HTML file. Defaults to
                 'weekly_trends.html'
 
@@ -170,35 +253,23 @@ class TeamAnalysis:
             ValueError: If no data is available for visualization
 
         """
-        issue_data = self._to_dataframe(analytics_data)
-        if issue_data.is_empty():
+        session = self._to_session(analytics_data)
+        if session.is_empty():
             msg = "No data available for visualization"
             raise ValueError(msg)
 
-        composition = (
-            issue_data.groupby(["week", "category"])
-            .agg(pl.count().alias("count"))
-            .join(
-                issue_data.groupby("week").agg(pl.count().alias("count_total")),
-                on="week",
-            )
-            .with_columns(
-                (pl.col("count") / pl.col("count_total") * 100).round().alias("percentage"),
-            )
-            .sort("week")
-        )
-
         fig = (
             px.line(
-                composition,
-                x="week",
+                session.frames["trends"],
+                x="period",
                 y="percentage",
                 color="category",
                 facet_col_wrap=2,
-                title="Weekly Work Composition Trends",
+                # Weekly, Monthly or Quarterly
+                title=f"{session.bucket.label}ly Work Composition Trends",
                 labels={
                     "percentage": "Percentage of Issues",
-                    "week": "Week",
+                    "period": session.bucket.label,
                     "category": "Work Category",
                 },
                 text="percentage",
@@ -210,18 +281,141 @@ class TeamAnalysis:
 
         fig.write_html(output_path)
 
+    def visualize_flow_metric(
+        self,
+        analytics_data: list[IssueAnalytics] | pl.DataFrame | AnalyticsSession,
+        metric: FlowMetric,
+        output_path: str = "flow_metric.html",
+    ) -> None:
+        """Create an interactive bar chart of a flow metric's mean per project and period.
+
+        Args:
+            analytics_data: IssueAnalytics objects, a frame from ``build_dataframe`` or
+                a session from ``build_session``
+            metric: Flow metric to chart
+            output_path: Path to save the visualization HTML file. Defaults to
+                'flow_metric.html'
+
+        Raises:
+            ValueError: If no data is available for visualization
+
+        """
+        session = self._to_session(analytics_data)
+        if session.is_empty():
+            msg = "No data available for visualization"
+            raise ValueError(msg)
+
+        means = session.frames["project_periods"].select(
+            "project", "period", pl.col(f"mean_{metric}").alias("mean")
+        )
+
+        fig = px.bar(
+            means,
+            x="period",
+            y="mean",
+            color="project",
+            title=f"Mean {FLOW_METRIC_LABELS[metric]} by Project",
+            labels={
+                "mean": FLOW_METRIC_LABELS[metric],
+                "period": session.bucket.label,
+                "project": "Project",
+            },
+            barmode="group",
+            text="mean",
+            color_discrete_sequence=px.colors.qualitative.Prism,
+        ).update_xaxes(type="category")
+
+        fig.write_html(output_path)
+
+    def visualize_time_in_status(
+        self,
+        analytics_data: list[IssueAnalytics] | AnalyticsSession,
+        output_path: str = "time_in_status.html",
+    ) -> None:
+        """Create an interactive bar chart of the mean time issues spend in each status.
+
+        Args:
+            analytics_data: IssueAnalytics objects or a session from ``build_session``,
+                which unlike a frame carries the status transitions
+            output_path: Path to save the visualization HTML file. Defaults to
+                'time_in_status.html'
+
+        Raises:
+            ValueError: If no data is available for visualization
+
+        """
+        session = self._to_session(analytics_data)
+        if session.is_empty():
+            msg = "No data available for visualization"
+            raise ValueError(msg)
+
+        fig = px.bar(
+            session.frames["time_in_status"],
+            x="project",
+            y="hours",
+            color="status",
+            title="Mean Time in Status by Project",
+            labels={"hours": "Mean Hours in Status", "project": "Project", "status": "Status"},
+            barmode="stack",
+            text="hours",
+            color_discrete_sequence=px.colors.qualitative.Prism,
+        )
+
+        fig.write_html(output_path)
+
+    def write_dashboard(
+        self,
+        analytics_data: list[IssueAnalytics] | AnalyticsSession,
+        output_path: str = "dashboard.html",
+        *,
+        include_plotlyjs: bool | str = True,
+    ) -> None:
+        """Write every chart to one HTML page that loads plotly.js once.
+
+        Unlike the separate chart files, bar charts page through periods with a slider
+        instead of stacking a facet per period, so the page stays light for long
+        windows. See ``dashboard.write_dashboard``.
+
+        Args:
+            analytics_data: IssueAnalytics objects or a session from ``build_session``
+            output_path: Path to save the HTML file. Defaults to 'dashboard.html'
+            include_plotlyjs: ``True`` to inline plotly.js once, ``"cdn"`` to load it
+                from the plotly CDN
+
+        Raises:
+            ValueError: If no data is available for visualization
+
+        """
+        dashboard.write_dashboard(
+            self._to_session(analytics_data), output_path, include_plotlyjs=include_plotlyjs
+        )
+
     def write_to_csv(
         self,
-        analytics_data: list[IssueAnalytics],
+        analytics_data: list[IssueAnalytics] | pl.DataFrame | AnalyticsSession,
         output_path: str = "analysis_output/engineering_taxonomy.csv",
     ) -> None:
         """Write analysis data to CSV file.
 
+        The file keeps the columns of ``CSV_COLUMNS``, in that order, with resolution
+        dates as ISO 8601 text. Those are in UTC, as the analytics frame holds them.
+
         Args:
-            analytics_data: List of IssueAnalytics objects containing work data
+            analytics_data: IssueAnalytics objects, a frame from ``build_dataframe`` or
+                a session from ``build_session``
             output_path: Path to save the CSV file. Defaults to
                 'analysis_output/engineering_taxonomy.csv'
 
         """
-        issue_data = self._to_dataframe(analytics_data)
-        issue_data.write_csv(output_path)
+        session = self._to_session(analytics_data)
+        if session.streaming:
+            # Rows go from the dataset to the file without being collected
+            self._csv_rows(session.plan).sink_csv(output_path)
+        else:
+            self._csv_rows(session.issues.lazy()).collect().write_csv(output_path)
+
+    def _csv_rows(self, issues: pl.LazyFrame) -> pl.LazyFrame:
+        """Select the CSV columns of the analytics frame, rendering resolution dates."""
+        return issues.select(CSV_COLUMNS).with_columns(
+            pl.col("resolved").dt.strftime("%Y-%m-%dT%H:%M:%S%.6f%:z")
+        )
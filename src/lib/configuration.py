@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from pydantic import (
     Field,
 )
@@ -19,3 +21,27 @@ class Settings(BaseSettings):
         default="https://shippo.atlassian.net",
         alias="JIRA_SERVER",
     )
+    jira_max_workers: int = Field(
+        default=8,
+        alias="JIRA_MAX_WORKERS",
+    )
+    jira_requests_per_second: float = Field(
+        default=10.0,
+        alias="JIRA_REQUESTS_PER_SECOND",
+    )
+    jira_shard_max_issues: int = Field(
+        default=2000,
+        alias="JIRA_SHARD_MAX_ISSUES",
+    )
+    jira_http_cache_max_mb: int = Field(
+        default=64,
+        alias="JIRA_HTTP_CACHE_MAX_MB",
+    )
+    jira_adapter_backend: str = Field(
+        default="sync",
+        alias="JIRA_ADAPTER_BACKEND",
+    )
+    cache_dir: Path = Field(
+        default=Path.home() / ".cache" / "jira-automation",
+        alias="JIRA_CACHE_DIR",
+    )
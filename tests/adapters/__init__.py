@@ -0,0 +1 @@
+"""Test suite for adapter layer functionality."""
@@ -0,0 +1,353 @@
+"""In-memory stand-ins for the JIRA client used by adapter tests."""
+
+from __future__ import annotations
+
+import itertools
+import re
+import threading
+import zlib
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from jira.exceptions import JIRAError
+from jira.resources import Issue as JiraIssue
+
+from src.adapters.secondary.jira.mappers import map_issue
+
+if TYPE_CHECKING:
+    from requests.adapters import HTTPAdapter
+
+    from src.domain.models import Issue
+
+SERVER = "https://example.atlassian.net"
+OPTIONS = {
+    "server": SERVER,
+    "rest_path": "api",
+    "rest_api_version": "2",
+    "agile_rest_path": "agile",
+    "agile_rest_api_version": "1.0",
+}
+TAXONOMY_FIELD = "customfield_11173"
+
+
+def make_raw_issue(  # noqa: PLR0913
+    key: str,
+    *,
+    project_key: str = "ATP",
+    status: str = "Done",
+    category: str | None = "Technical Investment (Tech Inv)",
+    transitions: list[tuple[str, str]] | None = None,
+    resolved: str | None = "2025-01-08T09:06:29.078-0800",
+    updated: str = "2025-01-08T09:06:29.078-0800",
+    issue_type: str = "Task",
+    parent: str | None = None,
+    links: list[tuple[str, str]] | None = None,
+) -> dict[str, Any]:
+    """Build the JSON Jira returns for a single searched issue.
+
+    ``links`` are pairs of direction (``"outwardIssue"`` or ``"inwardIssue"``) and key.
+    """
+    issue_id = str(zlib.crc32(key.encode()))
+    fields: dict[str, Any] = {
+        "summary": f"Summary of {key}",
+        "description": f"Description of {key}",
+        "project": {
+            "self": f"{SERVER}/rest/api/2/project/{project_key}",
+            "key": project_key,
+            "name": f"Project {project_key}",
+            "projectCategory": {
+                "self": f"{SERVER}/rest/api/2/projectCategory/10002",
+                "id": "10002",
+                "name": "Core Connectivity",
+            },
+        },
+        "issuetype": {"self": f"{SERVER}/rest/api/2/issuetype/1", "name": issue_type},
+        "status": {"self": f"{SERVER}/rest/api/2/status/1", "name": status},
+        "resolutiondate": resolved,
+        "updated": updated,
+    }
+    if parent is not None:
+        fields["parent"] = {
+            "id": parent.split("-")[1],
+            "key": parent,
+            "self": f"{SERVER}/rest/api/2/issue/{parent}",
+        }
+    if links is not None:
+        fields["issuelinks"] = [
+            {
+                "id": str(index),
+                "type": {"name": "Relates"},
+                direction: {"key": key, "self": f"{SERVER}/rest/api/2/issue/{key}"},
+            }
+            for index, (direction, key) in enumerate(links)
+        ]
+    if category is not None:
+        fields[TAXONOMY_FIELD] = {
+            "self": f"{SERVER}/rest/api/2/customFieldOption/1",
+            "value": category,
+            "id": "1",
+        }
+    histories = [
+        {
+            "id": str(index),
+            "created": created,
+            "items": [{"field": "status", "fromString": "To Do", "toString": to_status}],
+        }
+        for index, (to_status, created) in enumerate(transitions or [])
+    ]
+    return {
+        "id": issue_id,
+        "key": key,
+        "self": f"{SERVER}/rest/api/2/issue/{issue_id}",
+        "fields": fields,
+        "changelog": {
+            "startAt": 0,
+            "maxResults": len(histories),
+            "total": len(histories),
+            "histories": histories,
+        },
+    }
+
+
+def without_changelog(raw_issue: dict[str, Any]) -> dict[str, Any]:
+    """Drop the changelog of a raw issue, as searches not expanding it return it."""
+    return {name: value for name, value in raw_issue.items() if name != "changelog"}
+
+
+def truncated_changelog(raw_issue: dict[str, Any], limit: int | None) -> dict[str, Any]:
+    """Keep the first ``limit`` histories of a raw issue, as searches expanding it do."""
+    changelog = raw_issue.get("changelog")
+    if limit is None or changelog is None:
+        return raw_issue
+    histories = changelog["histories"]
+    return {
+        **raw_issue,
+        "changelog": {**changelog, "maxResults": limit, "histories": histories[:limit]},
+    }
+
+
+class FakeResponse:
+    """Minimal ``requests.Response`` replacement carrying a JSON body."""
+
+    def __init__(self, payload: object, status_code: int = 200) -> None:
+        """Initialize the response with its decoded JSON payload."""
+        self.payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        """Raise for error status codes like ``requests`` does."""
+        if self.status_code >= 400:
+            msg = f"HTTP {self.status_code}"
+            raise RuntimeError(msg)
+
+    def json(self) -> object:
+        """Return the decoded JSON payload."""
+        return self.payload
+
+
+class FakeSession:
+    """Serves the enhanced JQL search endpoint from the fake's raw issues."""
+
+    def __init__(self, fake: FakeJira) -> None:
+        """Initialize the session for the given fake client."""
+        self.fake = fake
+        self.tokens: list[str | None] = []
+        self.requested_fields: list[list[str]] = []
+
+    def mount(self, prefix: str, adapter: HTTPAdapter) -> None:
+        """Accept transport adapters like ``requests.Session`` does."""
+
+    def post(self, url: str, json: dict[str, Any]) -> FakeResponse:
+        """Answer ``POST /search/jql`` with offset-encoded page tokens.
+
+        ``POST /search/approximate-count`` is answered with the exact count, and
+        ``POST /issue/bulk`` creates every issue whose summary does not start with
+        "reject", failing with 400 like Jira when none could be created.
+        """
+        if url.endswith("/issue/bulk"):
+            return self._create_issues(json["issueUpdates"])
+        if url.endswith("/changelog/bulkfetch"):
+            return self._bulk_changelogs(json)
+        if url.endswith("/search/approximate-count"):
+            self.fake.count_queries.append(json["jql"])
+            return FakeResponse({"count": len(self.fake.matching(json["jql"]))})
+        assert url.endswith("/search/jql")
+        token = json.get("nextPageToken")
+        self.tokens.append(token)
+        self.requested_fields.append(json["fields"])
+        start = int(token or 0)
+        end = start + min(json["maxResults"], self.fake.page_size)
+        is_last = end >= len(self.fake.raw_issues)
+        raw_issues = self.fake.raw_issues[start:end]
+        if "expand" not in json:
+            raw_issues = [without_changelog(raw) for raw in raw_issues]
+        else:
+            raw_issues = [truncated_changelog(raw, self.fake.changelog_limit) for raw in raw_issues]
+        payload: dict[str, Any] = {"issues": raw_issues, "isLast": is_last}
+        if not is_last:
+            payload["nextPageToken"] = str(end)
+        return FakeResponse(payload)
+
+    def get(self, url: str, params: dict[str, Any]) -> FakeResponse:
+        """Answer ``GET /issue/{key}/changelog`` with the requested page of histories."""
+        assert url.endswith("/changelog")
+        key = url.rsplit("/", 2)[-2]
+        self.fake.changelog_pages.append((key, params["startAt"]))
+        by_key = {raw["key"]: raw for raw in self.fake.raw_issues}
+        histories = by_key[key]["changelog"]["histories"]
+        start = params["startAt"]
+        end = start + params["maxResults"]
+        return FakeResponse(
+            {
+                "startAt": start,
+                "maxResults": params["maxResults"],
+                "total": len(histories),
+                "isLast": end >= len(histories),
+                "values": histories[start:end],
+            }
+        )
+
+    def delete(self, url: str) -> FakeResponse:
+        """Answer ``DELETE /issue/{key}``, failing with 404 for unknown keys."""
+        key = url.rsplit("/", 1)[-1]
+        if key not in {raw["key"] for raw in self.fake.raw_issues}:
+            raise JIRAError(status_code=404, text="Issue does not exist")
+        self.fake.deleted.append(key)
+        return FakeResponse(None, status_code=204)
+
+    def _bulk_changelogs(self, json: dict[str, Any]) -> FakeResponse:
+        """Answer the bulk changelog endpoint, ``changelog_page_size`` histories a page."""
+        self.fake.changelog_requests.append(list(json["issueIdsOrKeys"]))
+        by_id = {raw["id"]: raw for raw in self.fake.raw_issues}
+        histories = [
+            # Unlike the v2 endpoints, it gives ``created`` as epoch milliseconds
+            (
+                issue_id,
+                {**history, "created": _epoch_milliseconds(history["created"]), "items": items},
+            )
+            for issue_id in json["issueIdsOrKeys"]
+            for history in by_id[issue_id]["changelog"]["histories"]
+            if (items := [i for i in history["items"] if i["field"] in json["fieldIds"]])
+        ]
+        start = int(json.get("nextPageToken") or 0)
+        end = start + min(json["maxResults"], self.fake.changelog_page_size)
+        changelogs: dict[str, list[dict[str, Any]]] = {}
+        for issue_id, history in histories[start:end]:
+            changelogs.setdefault(issue_id, []).append(history)
+        payload: dict[str, Any] = {
+            "issueChangeLogs": [
+                {"issueId": issue_id, "changeHistories": changes}
+                for issue_id, changes in changelogs.items()
+            ]
+        }
+        if end < len(histories):
+            payload["nextPageToken"] = str(end)
+        return FakeResponse(payload)
+
+    def _create_issues(self, issue_updates: list[dict[str, Any]]) -> FakeResponse:
+        """Create the accepted issues, numbering their keys after the ones created before."""
+        self.fake.bulk_sizes.append(len(issue_updates))
+        payload: dict[str, Any] = {"issues": [], "errors": []}
+        for position, update in enumerate(issue_updates):
+            fields = update["fields"]
+            if fields["summary"].startswith("reject"):
+                payload["errors"].append(
+                    {
+                        "failedElementNumber": position,
+                        "elementErrors": {"errors": {"summary": "Rejected"}},
+                        "status": 400,
+                    }
+                )
+            else:
+                key = f"{fields['project']['key']}-{next(self.fake.created_numbers)}"
+                payload["issues"].append({"id": key, "key": key})
+        if not payload["issues"]:
+            raise JIRAError(status_code=400, text="Bad Request", response=FakeResponse(payload))
+        return FakeResponse(payload)
+
+
+class FakeJira:
+    """Serves ``search_issues`` pages from a fixed list of raw issues.
+
+    Key lists, project lists and resolved-date bounds in the JQL are applied, other
+    clauses are ignored. Setting ``failures`` makes that many of the next searches fail,
+    and setting ``changelog_limit`` truncates the changelogs searches expand.
+    """
+
+    server_url = SERVER
+
+    def __init__(self, raw_issues: list[dict[str, Any]], page_size: int = 100) -> None:
+        """Initialize the fake with the issues every search returns."""
+        self.raw_issues = raw_issues
+        self.page_size = page_size
+        self.search_calls: list[int] = []
+        self.count_queries: list[str] = []
+        self.bulk_sizes: list[int] = []
+        self.deleted: list[str] = []
+        self.changelog_requests: list[list[str]] = []
+        self.changelog_page_size = 1000
+        self.changelog_limit: int | None = None
+        self.changelog_pages: list[tuple[str, int]] = []
+        self.requested_fields: list[list[str]] = []
+        self.created_numbers = itertools.count(1)
+        self.failures = 0
+        self._failures_lock = threading.Lock()
+        self._options = OPTIONS
+        # The adapter reaches the session through ``_session``, like on the jira client
+        self.session = self._session = FakeSession(self)
+
+    def search_issues(
+        self,
+        jql: str,
+        startAt: int = 0,  # noqa: N803 - the jira client's parameter names
+        maxResults: int = 50,  # noqa: N803
+        **kwargs: object,
+    ) -> dict[str, Any]:
+        """Return the JSON of one page of issues starting at ``startAt``."""
+        assert kwargs.get("json_result")
+        with self._failures_lock:
+            if self.failures:
+                self.failures -= 1
+                raise JIRAError(status_code=500, text="Internal Server Error")
+        self.search_calls.append(startAt)
+        self.requested_fields.append(kwargs.get("fields"))
+        size = min(maxResults, self.page_size)
+        raw_issues = self.matching(jql)
+        if not kwargs.get("expand"):
+            raw_issues = [without_changelog(raw) for raw in raw_issues]
+        else:
+            raw_issues = [truncated_changelog(raw, self.changelog_limit) for raw in raw_issues]
+        return {
+            "startAt": startAt,
+            "maxResults": size,
+            "total": len(raw_issues),
+            "issues": raw_issues[startAt : startAt + size],
+        }
+
+    def matching(self, jql: str) -> list[dict[str, Any]]:
+        """Return the raw issues selected by the key list, project list and resolved bounds."""
+        raw_issues = self.raw_issues
+        if keys := re.search(r"key in \(([^)]*)\)", jql):
+            wanted = set(keys.group(1).split(","))
+            raw_issues = [raw for raw in raw_issues if raw["key"] in wanted]
+        if projects := re.search(r"project in \(([^)]*)\)", jql):
+            keys = set(projects.group(1).split(","))
+            raw_issues = [raw for raw in raw_issues if raw["fields"]["project"]["key"] in keys]
+        for operator, day in re.findall(r'resolved ([<>]=) "([\d-]+)"', jql):
+            # A date bound means midnight, so "<=" excludes issues resolved later that day
+            raw_issues = [
+                raw
+                for raw in raw_issues
+                if (raw["fields"]["resolutiondate"][:10] >= day) == (operator == ">=")
+            ]
+        return raw_issues
+
+
+def make_issue(key: str, **kwargs: object) -> Issue:
+    """Build a domain Issue the way the adapter maps a searched issue."""
+    return map_issue(JiraIssue(OPTIONS, None, raw=make_raw_issue(key, **kwargs)), TAXONOMY_FIELD)
+
+
+def _epoch_milliseconds(timestamp: str) -> int:
+    """Convert a v2 ISO timestamp to the epoch milliseconds of the bulk changelog API."""
+    return round(datetime.fromisoformat(timestamp).timestamp() * 1000)
@@ -0,0 +1,179 @@
+"""Unit tests for the partitioned analytics datasets."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from src.adapters.secondary.storage.analytics_dataset import (
+    KEY_COLUMN,
+    KEY_INDEX,
+    DatasetFormat,
+    scan_analytics,
+    write_analytics,
+    write_dataset,
+)
+from src.domain.analytics_session import AnalyticsSession
+from src.domain.flow_metrics import TRANSITIONS_SCHEMA
+from src.domain.models import Bucket
+
+
+def _rows(*rows: tuple[str, str, str, float]) -> pl.DataFrame:
+    return pl.DataFrame(
+        rows, schema=["issue_key", "week", "project", "lead_time_hours"], orient="row"
+    )
+
+
+@pytest.mark.parametrize("dataset_format", list(DatasetFormat))
+def test_rewriting_an_issue_replaces_it_across_partitions(
+    tmp_path: Path, dataset_format: DatasetFormat
+) -> None:
+    """Test upserts move issues between partitions and leave other partitions alone."""
+    write_dataset(
+        _rows(
+            ("ATP-1", "2025-01-12", "Access Point", 1.0),
+            ("ATP-2", "2025-01-12", "Access Point", 2.0),
+            ("RATE-1", "2025-01-12", "Rates/Fees", 3.0),
+        ),
+        tmp_path,
+        dataset_format,
+    )
+    changed = write_dataset(
+        _rows(
+            ("ATP-2", "2025-01-19", "Access Point", 5.0),
+            ("ATP-3", "2025-01-19", "Access Point", 6.0),
+        ),
+        tmp_path,
+        dataset_format,
+    )
+
+    suffix = "parquet" if dataset_format == DatasetFormat.PARQUET else "arrow"
+    files = sorted(tmp_path.glob(f"**/*.{suffix}"))
+    read = pl.read_parquet if dataset_format == DatasetFormat.PARQUET else pl.read_ipc
+    rows = pl.concat(
+        [
+            read(path, columns=["issue_key", "lead_time_hours"], memory_map=False).with_columns(
+                week=pl.lit(path.parent.parent.name.removeprefix("week="))
+            )
+            for path in files
+        ]
+    )
+    assert changed == 2
+    assert len(files) == 3
+    assert "project=Rates%2FFees" in {path.parent.name for path in files}
+    assert sorted(rows.select("issue_key", "week", "lead_time_hours").rows()) == [
+        ("ATP-1", "2025-01-12", 1.0),
+        ("ATP-2", "2025-01-19", 5.0),
+        ("ATP-3", "2025-01-19", 6.0),
+        ("RATE-1", "2025-01-12", 3.0),
+    ]
+
+
+def test_parquet_dataset_scans_with_partition_pruning(tmp_path: Path) -> None:
+    """Test readers get the partition columns back from the hive layout."""
+    write_dataset(
+        _rows(
+            ("ATP-1", "2025-01-12", "Access Point", 1.0),
+            ("RATE-1", "2025-01-19", "Rates", 2.0),
+        ),
+        tmp_path,
+    )
+
+    scan = pl.scan_parquet(tmp_path / "**/*.parquet", hive_partitioning=True)
+
+    assert scan.filter(pl.col("week") == "2025-01-19").collect().rows() == [
+        ("RATE-1", 2.0, "2025-01-19", "Rates")
+    ]
+
+
+def test_upserts_only_open_the_partitions_of_their_keys(tmp_path: Path) -> None:
+    """Test the key index spares partitions holding none of the written keys."""
+    write_dataset(
+        _rows(
+            ("ATP-1", "2025-01-12", "Access Point", 1.0),
+            ("RATE-1", "2025-01-12", "Rates", 2.0),
+        ),
+        tmp_path,
+    )
+    # Reading this partition would now fail, so it must not be opened
+    (tmp_path / "week=2025-01-12" / "project=Rates" / "part.parquet").write_bytes(b"")
+
+    changed = write_dataset(_rows(("ATP-1", "2025-01-19", "Access Point", 3.0)), tmp_path)
+
+    index = pl.read_ipc(tmp_path / KEY_INDEX, memory_map=False).sort(KEY_COLUMN)
+    assert changed == 2
+    assert index.rows() == [
+        ("ATP-1", "week=2025-01-19/project=Access%20Point/part.parquet"),
+        ("RATE-1", "week=2025-01-12/project=Rates/part.parquet"),
+    ]
+
+
+def test_missing_key_index_is_rebuilt_from_the_partitions(tmp_path: Path) -> None:
+    """Test datasets written without an index still have moved keys replaced."""
+    write_dataset(_rows(("ATP-1", "2025-01-12", "Access Point", 1.0)), tmp_path)
+    (tmp_path / KEY_INDEX).unlink()
+
+    write_dataset(_rows(("ATP-1", "2025-01-19", "Access Point", 2.0)), tmp_path)
+
+    assert [path.parent.parent.name for path in tmp_path.glob("**/*.parquet")] == [
+        "week=2025-01-19"
+    ]
+    assert (tmp_path / KEY_INDEX).exists()
+
+
+def _session(*issues: tuple[str, str, str, datetime]) -> AnalyticsSession:
+    """Build an in-memory session of issues that each spent a day in progress."""
+    keys = [key for key, *_ in issues]
+    plan = pl.LazyFrame(
+        {
+            "project": [project for _, project, _, _ in issues],
+            "issue_key": keys,
+            "category": [category for _, _, category, _ in issues],
+            "resolved": [resolved for *_, resolved in issues],
+            "week": [resolved.strftime("%Y-%m-%d") for *_, resolved in issues],
+            "lead_time_hours": [24.0] * len(issues),
+            "cycle_time_hours": [24.0] * len(issues),
+            "reopen_count": [0] * len(issues),
+        }
+    )
+    transitions = pl.LazyFrame(
+        {
+            "issue_key": [key for key in keys for _ in range(2)],
+            "status": ["In Progress", "Done"] * len(issues),
+            "timestamp": [datetime(2025, 1, day, tzinfo=UTC) for _ in issues for day in (1, 2)],
+        },
+        schema=TRANSITIONS_SCHEMA,
+    )
+    return AnalyticsSession(plan, transitions)
+
+
+def test_streaming_session_over_dataset_matches_in_memory_one(tmp_path: Path) -> None:
+    """Test chunks upserted into a dataset chart like one session over every issue."""
+    issues = [
+        ("ATP-1", "Access Point", "Maintenance", datetime(2025, 1, 10, tzinfo=UTC)),
+        ("ATP-2", "Access Point", "Product Dev", datetime(2025, 2, 14, tzinfo=UTC)),
+        ("RATE-1", "Rates", "Product Dev", datetime(2025, 4, 4, tzinfo=UTC)),
+    ]
+    write_analytics(_session(*issues[:2]), tmp_path)
+    # Overlapping chunks replace the issue and its transitions
+    write_analytics(_session(*issues[1:]), tmp_path)
+
+    streamed = scan_analytics(tmp_path, Bucket.QUARTER)
+    in_memory = _session(*issues)
+    in_memory.bucket = Bucket.QUARTER
+
+    assert streamed.streaming
+    for name in ("composition", "trends", "project_periods", "time_in_status"):
+        assert streamed.frames[name].rows() == in_memory.frames[name].rows(), name
+    assert streamed.frames["trends"]["period"].to_list() == ["2025-Q1", "2025-Q1", "2025-Q2"]
+    assert streamed.frames["time_in_status"]["hours"].to_list() == [24.0, 24.0]
+    assert scan_analytics(
+        tmp_path, Bucket.MONTH, resolved_from=datetime(2025, 2, 1, tzinfo=UTC)
+    ).frames["project_periods"].select("project", "period").rows() == [
+        ("Access Point", "2025-02"),
+        ("Rates", "2025-04"),
+    ]
+    # As typer parses --start-date
+    naive = scan_analytics(tmp_path, resolved_from=datetime(2025, 2, 1))  # noqa: DTZ001
+    assert naive.frames["project_periods"]["count_total"].to_list() == [1, 1]
@@ -0,0 +1,96 @@
+"""Unit tests for the asyncio JIRA adapter and its synchronous runner."""
+
+import asyncio
+import json
+import threading
+
+import httpx
+
+from src.adapters.secondary.jira.async_jira_adapter import AsyncAdapterRunner, AsyncJiraAdapter
+from src.adapters.secondary.jira.jira_adapter import JiraAdapter
+from src.domain.models import SearchMode
+from tests.adapters.jira_fakes import SERVER, FakeJira, make_raw_issue
+
+
+def _search_transport(raw_issues: list[dict], page_size: int) -> httpx.MockTransport:
+    """Serve offset and token searches over the given raw issues."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path.endswith("/search/jql"):
+            start = int(body.get("nextPageToken") or 0)
+        else:
+            start = body["startAt"]
+        end = start + page_size
+        payload = {"issues": raw_issues[start:end], "total": len(raw_issues)}
+        if end < len(raw_issues):
+            payload["nextPageToken"] = str(end)
+        payload["isLast"] = end >= len(raw_issues)
+        return httpx.Response(200, json=payload)
+
+    return httpx.MockTransport(handler)
+
+
+def test_runner_search_matches_sync_adapter() -> None:
+    """Test every search mode returns the same issues as the synchronous adapter."""
+    raw_issues = [make_raw_issue(f"ATP-{number}") for number in range(1, 131)]
+    pages = JiraAdapter(FakeJira(raw_issues)).iter_issue_pages("project = ATP")
+    expected = [issue for page in pages for issue in page]
+    transport = _search_transport(raw_issues, page_size=50)
+    adapter = AsyncJiraAdapter(SERVER, "me@example.com", "token", transport=transport)
+    runner = AsyncAdapterRunner(adapter)
+
+    try:
+        for search_mode in SearchMode:
+            pages = runner.iter_issue_pages("project = ATP", search_mode)
+            assert [issue for page in pages for issue in page] == expected
+    finally:
+        runner.close()
+
+
+def test_runner_prefetches_while_a_page_is_processed() -> None:
+    """Test the next page downloads while the caller still holds the current one."""
+    raw_issues = [make_raw_issue(f"ATP-{number}") for number in range(1, 101)]
+    serve_page = _search_transport(raw_issues, page_size=50).handle_request
+    second_page_served = threading.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)  # Network latency
+        response = serve_page(request)
+        if json.loads(request.content).get("nextPageToken"):
+            second_page_served.set()
+        return response
+
+    transport = httpx.MockTransport(handler)
+    adapter = AsyncJiraAdapter(SERVER, "me@example.com", "token", transport=transport)
+    runner = AsyncAdapterRunner(adapter)
+
+    try:
+        pages = runner.iter_issue_pages("project = ATP", SearchMode.TOKEN)
+        next(pages)
+        assert second_page_served.wait(timeout=5)
+        pages.close()
+    finally:
+        runner.close()
+
+
+def test_runner_gathers_requests_concurrently() -> None:
+    """Test the runner fans out several adapter calls on one event loop."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.url.path.rsplit("/", 1)[1]
+        link = {"outwardIssue": {"key": f"{key}-child"}}
+        return httpx.Response(200, json={"key": key, "fields": {"issuelinks": [link]}})
+
+    transport = httpx.MockTransport(handler)
+    adapter = AsyncJiraAdapter(SERVER, "me@example.com", "token", transport=transport)
+    runner = AsyncAdapterRunner(adapter)
+
+    try:
+        results = runner.gather(
+            *(runner.adapter.get_child_issues_keys(key) for key in ("ATP-1", "ATP-2"))
+        )
+    finally:
+        runner.close()
+
+    assert results == [{"ATP-1-child"}, {"ATP-2-child"}]
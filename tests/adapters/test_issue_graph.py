@@ -0,0 +1,47 @@
+"""Unit tests for the persisted issue relation graph."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytz
+
+from src.adapters.secondary.storage.issue_graph import IssueGraph
+from tests.adapters.jira_fakes import make_issue
+
+SYNCED_AT = datetime(2025, 1, 8, 17, tzinfo=pytz.utc)
+
+
+def test_relations_persist_and_are_walked_from_memory(tmp_path: Path) -> None:
+    """Test ancestors, descendants and links are answered after reopening the graph."""
+    path = tmp_path / "issue_graph.sqlite3"
+    IssueGraph(path).update(
+        [
+            make_issue("EPIC-1", parent="INIT-1"),
+            make_issue("ATP-1", parent="EPIC-1", links=[("outwardIssue", "ATP-2")]),
+            make_issue("ATP-2", parent="EPIC-1", links=[("outwardIssue", "ATP-3")]),
+        ],
+        SYNCED_AT,
+    )
+
+    graph = IssueGraph(path)
+
+    assert graph.ancestors(["ATP-1"]) == ["EPIC-1", "INIT-1"]
+    assert sorted(graph.descendants(["INIT-1"])) == ["ATP-1", "ATP-2", "EPIC-1"]
+    assert graph.descendants(["INIT-1"], max_depth=1) == ["EPIC-1"]
+    assert graph.linked(["ATP-1"]) == ["ATP-2", "ATP-3"]
+    assert graph.get_node("ATP-1").synced_at == SYNCED_AT
+    assert graph.get_node("INIT-1") is None
+
+
+def test_update_replaces_the_edges_of_an_issue(tmp_path: Path) -> None:
+    """Test re-syncing an issue that moved to another epic drops its old edges."""
+    path = tmp_path / "issue_graph.sqlite3"
+    graph = IssueGraph(path)
+    graph.update([make_issue("ATP-1", parent="EPIC-1", links=[("inwardIssue", "ATP-9")])])
+
+    graph.update([make_issue("ATP-1", parent="EPIC-2")])
+
+    for reopened in (graph, IssueGraph(path)):
+        assert reopened.children("EPIC-1") == set()
+        assert reopened.children("EPIC-2") == {"ATP-1"}
+        assert reopened.linked(["ATP-1"]) == []
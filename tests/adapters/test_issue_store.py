@@ -0,0 +1,98 @@
+"""Unit tests for the local SQLite issue store."""
+
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+
+import pytz
+
+from src.adapters.secondary.storage.issue_store import IssueStore
+from src.domain.models import SyncState
+from tests.adapters.jira_fakes import make_issue
+
+# Resolution window every loading test reads
+WINDOW = (datetime(2025, 1, 6, tzinfo=pytz.utc), datetime(2025, 1, 13, tzinfo=pytz.utc))
+
+
+def test_round_trips_issues_with_status_history(tmp_path: Path) -> None:
+    """Test stored issues load back identical to the mapped ones, relations included."""
+    store = IssueStore(tmp_path / "issues.sqlite3")
+    issue = make_issue(
+        "ATP-1",
+        parent="EPIC-1",
+        links=[("outwardIssue", "ATP-2"), ("inwardIssue", "CTP-3")],
+        transitions=[
+            ("In Progress", "2025-01-06T08:00:00.000-0800"),
+            ("Done", "2025-01-08T09:06:29.078-0800"),
+        ],
+    )
+
+    store.upsert_issues([issue])
+
+    assert store.load_issues(["ATP"], *WINDOW) == [issue]
+    assert (issue.parent_key, issue.linked_issue_keys) == ("EPIC-1", ("ATP-2", "CTP-3"))
+
+
+def test_stores_without_relations_are_migrated(tmp_path: Path) -> None:
+    """Test a store created before relations were kept gains them and resyncs."""
+    path = tmp_path / "issues.sqlite3"
+    store = IssueStore(path)
+    store.save_sync_state("ATP", SyncState(date(2025, 1, 6), WINDOW[0]))
+    store.close()
+    with sqlite3.connect(path) as connection:
+        connection.execute("ALTER TABLE issues DROP COLUMN linked_issue_keys")
+        connection.execute("ALTER TABLE issues DROP COLUMN parent_key")
+    connection.close()
+
+    store = IssueStore(path)
+    issue = make_issue("ATP-1", parent="EPIC-1", links=[("outwardIssue", "ATP-2")])
+    store.upsert_issues([issue])
+
+    assert store.get_sync_state("ATP") is None
+    assert store.load_issues(["ATP"], *WINDOW) == [issue]
+
+
+def test_load_applies_search_filters_and_window(tmp_path: Path) -> None:
+    """Test loading excludes epics, won't-do issues and issues outside the window."""
+    store = IssueStore(tmp_path / "issues.sqlite3")
+    store.upsert_issues(
+        [
+            make_issue("ATP-1"),
+            make_issue("ATP-2", issue_type="Epic"),
+            make_issue("ATP-3", status="Won't Do"),
+            make_issue("ATP-4", resolved="2025-01-13T00:30:00.000-0800"),
+            make_issue("ATP-5", resolved=None),
+            make_issue("RATE-1", project_key="RATE"),
+        ]
+    )
+
+    issues = store.load_issues(["ATP"], *WINDOW)
+
+    assert [issue.key for issue in issues] == ["ATP-1"]
+
+
+def test_upsert_overwrites_and_delete_drops_project(tmp_path: Path) -> None:
+    """Test upserts replace issues by key and full reloads drop stale issues."""
+    store = IssueStore(tmp_path / "issues.sqlite3")
+    store.upsert_issues([make_issue("ATP-1"), make_issue("ATP-2")])
+
+    store.upsert_issues([make_issue("ATP-1", category="Team Management (TM)")])
+    assert [i.engineering_category for i in store.load_issues(["ATP"], *WINDOW)] == [
+        "Team Management (TM)",
+        "Technical Investment (Tech Inv)",
+    ]
+
+    store.delete_project_issues("ATP")
+    store.upsert_issues([make_issue("ATP-3")])
+    assert [i.key for i in store.load_issues(["ATP"], *WINDOW)] == ["ATP-3"]
+
+
+def test_sync_state_round_trip(tmp_path: Path) -> None:
+    """Test the per-project sync state persists across store instances."""
+    path = tmp_path / "issues.sqlite3"
+    state = SyncState(date(2025, 1, 6), datetime(2025, 1, 8, 17, tzinfo=pytz.utc))
+
+    IssueStore(path).save_sync_state("ATP", state)
+
+    assert IssueStore(path).get_sync_state("ATP") == state
+    assert IssueStore(path).get_sync_state("RATE") is None
@@ -0,0 +1,196 @@
+"""Unit tests for the JIRA adapter search paths."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from src.adapters.secondary.jira.jira_adapter import JiraAdapter
+from src.adapters.secondary.jira.models import FieldProfile
+from src.domain.models import CreateIssueRequest, Project, SearchMode
+from tests.adapters.jira_fakes import FakeJira, make_raw_issue
+
+if TYPE_CHECKING:
+    from src.domain.models import Issue
+
+
+def _fetch(adapter: JiraAdapter, search_mode: SearchMode = SearchMode.PARALLEL) -> list[Issue]:
+    """Fetch every issue of the test project through the adapter's public paging."""
+    return list(chain.from_iterable(adapter.iter_issue_pages("project = ATP", search_mode)))
+
+
+def test_parallel_fetch_matches_serial_order() -> None:
+    """Test parallel fetching returns the same issues, in the same order, as serial."""
+    raw_issues = [make_raw_issue(f"ATP-{number}") for number in range(1, 251)]
+
+    parallel = _fetch(JiraAdapter(FakeJira(raw_issues), max_workers=4), SearchMode.PARALLEL)
+    serial = _fetch(JiraAdapter(FakeJira(raw_issues)), SearchMode.SERIAL)
+
+    assert [issue.key for issue in parallel] == [issue.key for issue in serial]
+    assert len(parallel) == 250
+
+
+def test_parallel_fetch_skips_empty_page_and_uses_total() -> None:
+    """Test parallel fetching requests each offset once, without a trailing empty page."""
+    fake = FakeJira([make_raw_issue(f"ATP-{number}") for number in range(1, 121)], page_size=50)
+
+    issues = _fetch(JiraAdapter(fake))
+
+    assert sorted(fake.search_calls) == [0, 50, 100]
+    assert len(issues) == 120
+
+
+def test_parallel_fetch_deduplicates_by_key() -> None:
+    """Test issues that shift across page boundaries are only returned once."""
+    raw_issues = [make_raw_issue(f"ATP-{number}") for number in range(1, 101)]
+    raw_issues.insert(60, make_raw_issue("ATP-10"))
+    fake = FakeJira(raw_issues, page_size=50)
+
+    issues = _fetch(JiraAdapter(fake))
+
+    assert [issue.key for issue in issues] == [f"ATP-{number}" for number in range(1, 101)]
+
+
+def test_token_fetch_stops_on_is_last() -> None:
+    """Test token paging walks every page once and never requests an empty page."""
+    raw_issues = [make_raw_issue(f"ATP-{number}") for number in range(1, 121)]
+    fake = FakeJira(raw_issues, page_size=50)
+
+    issues = _fetch(JiraAdapter(fake), SearchMode.TOKEN)
+
+    assert fake.session.tokens == [None, "50", "100"]
+    assert [issue.key for issue in issues] == [raw["key"] for raw in raw_issues]
+
+
+def test_sharded_search_matches_single_query() -> None:
+    """Test a sharded search returns the same issues as one query, despite failed shards."""
+    raw_issues = [
+        make_raw_issue(
+            f"{project}-{day}",
+            project_key=project,
+            resolved=f"2025-01-{day:02d}T09:06:29.078-0800",
+        )
+        for project in ("ATP", "RATE")
+        for day in range(1, 29)
+    ]
+    start, end = datetime(2025, 1, 1, tzinfo=UTC), datetime(2025, 1, 29, tzinfo=UTC)
+    projects = [Project("ATP", "Access Point", "10002"), Project("RATE", "Rate", "10002")]
+    fake = FakeJira(raw_issues, page_size=5)
+    fake.failures = 2
+
+    sharded = JiraAdapter(fake, max_workers=4, max_shard_size=10).search_issues(
+        start, end, projects, SearchMode.SHARDED
+    )
+    single = JiraAdapter(FakeJira(raw_issues)).search_issues(start, end, projects)
+
+    assert sorted(issue.key for issue in sharded) == sorted(issue.key for issue in single)
+    assert len(sharded) == len(raw_issues)
+    assert len(fake.count_queries) > len(projects)
+
+
+def test_get_issues_batches_keys_and_keeps_order() -> None:
+    """Test issues are fetched with one search per batch of keys, in the requested order."""
+    fake = FakeJira([make_raw_issue(f"ATP-{number}") for number in range(1, 301)])
+    keys = [f"ATP-{number}" for number in range(250, 0, -1)] + ["ATP-250", "ATP-999"]
+
+    issues = JiraAdapter(fake, max_workers=4).get_issues(keys)
+
+    assert [issue.key for issue in issues] == keys[:250]
+    assert len(fake.search_calls) == 3
+
+
+def test_create_issues_submits_bulk_batches_and_reports_each_row() -> None:
+    """Test issues go out 50 per request and rejected rows keep their position."""
+    fake = FakeJira([])
+    summaries = [f"Task {number}" for number in range(1, 121)]
+    summaries[60] = "reject me"
+    summaries[100:] = [f"reject {number}" for number in range(20)]
+    requests = [CreateIssueRequest(project_key="ATP", summary=s, description="") for s in summaries]
+
+    results = JiraAdapter(fake, max_workers=3).create_issues(requests)
+
+    assert sorted(fake.bulk_sizes) == [20, 50, 50]
+    assert [result.row for result in results] == list(range(1, 121))
+    assert [result.row for result in results if not result.created] == [61, *range(101, 121)]
+    assert results[60].error == "summary: Rejected"
+    assert len({result.key for result in results if result.created}) == 99
+
+
+def test_delete_issues_found_by_jql_reports_each_key() -> None:
+    """Test keys are searched without fields and deleted directly, failures per key."""
+    fake = FakeJira([make_raw_issue(f"ATP-{number}") for number in range(1, 151)])
+    adapter = JiraAdapter(fake, max_workers=4)
+
+    keys = adapter.search_issue_keys("project = ATP")
+    results = adapter.delete_issues([*keys, "ATP-999"])
+
+    assert keys == [f"ATP-{number}" for number in range(1, 151)]
+    assert sorted(fake.deleted) == sorted(keys)
+    assert [result.key for result in results] == [*keys, "ATP-999"]
+    assert [result.error for result in results if not result.deleted] == [
+        "HTTP 404: Issue does not exist"
+    ]
+
+
+def test_issue_records_fetch_only_requested_fields() -> None:
+    """Test record pages are streamed with the projection sent to Jira."""
+    fake = FakeJira([make_raw_issue(f"ATP-{number}") for number in range(1, 151)])
+
+    pages = list(JiraAdapter(fake).iter_issue_records("project = ATP", ["status"]))
+
+    assert fake.session.requested_fields == [["key", "status"], ["key", "status"]]
+    assert [len(page) for page in pages] == [100, 50]
+    assert pages[0][0] == {"key": "ATP-1", "status": "Done"}
+
+
+def test_analytics_profile_fetches_changelogs_lazily_in_bulk() -> None:
+    """Test only resolved issues get a changelog, fetched in bulk, with the same lead times."""
+    transitions = [
+        ("In Progress", "2025-01-06T09:00:00.000-0800"),
+        ("Done", "2025-01-08T09:00:00.000-0800"),
+    ]
+    raw_issues = [
+        make_raw_issue(f"ATP-{number}", transitions=transitions, resolved=resolved)
+        for number, resolved in enumerate(
+            ["2025-01-08T09:06:29.078-0800", None, "2025-01-08T09:06:29.078-0800"], start=1
+        )
+    ]
+    fake = FakeJira(raw_issues)
+    fake.changelog_page_size = 3
+
+    full = _fetch(JiraAdapter(fake))
+    analytics = list(
+        chain.from_iterable(
+            JiraAdapter(fake).iter_issue_pages("project = ATP", profile=FieldProfile.ANALYTICS)
+        )
+    )
+
+    assert fake.changelog_requests == [[raw_issues[0]["id"], raw_issues[2]["id"]]] * 2
+    assert [issue.lead_time_hours for issue in analytics] == [48.0, None, 48.0]
+    assert [issue.lead_time_hours for issue in full] == [48.0, 48.0, 48.0]
+    assert analytics[0].status_history == full[0].status_history
+    assert "summary" not in fake.requested_fields[-1]
+
+
+def test_truncated_changelogs_are_completed_before_mapping() -> None:
+    """Test only issues with truncated changelogs fetch their missing history pages."""
+    transitions = [
+        ("In Progress", "2025-01-06T09:00:00.000-0800"),
+        *[("In Review", "2025-01-07T09:00:00.000-0800")] * 248,
+        ("Done", "2025-01-08T09:00:00.000-0800"),
+    ]
+    raw_issues = [
+        make_raw_issue("ATP-1", transitions=transitions),
+        make_raw_issue("ATP-2", transitions=transitions[:1] + transitions[-1:]),
+    ]
+    fake = FakeJira(raw_issues)
+    fake.changelog_limit = 100
+    adapter = JiraAdapter(fake)
+
+    issues = list(chain.from_iterable(adapter.iter_issue_pages("project = ATP")))
+
+    assert sorted(fake.changelog_pages) == [("ATP-1", 100), ("ATP-1", 200)]
+    assert adapter.completed_changelogs == 1
+    assert [len(issue.status_history) for issue in issues] == [250, 2]
+    assert [issue.lead_time_hours for issue in issues] == [48.0, 48.0]
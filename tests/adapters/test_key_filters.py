@@ -0,0 +1,51 @@
+"""Unit tests for the compact key-set JQL builder."""
+
+import re
+
+from src.adapters.secondary.jira.key_filters import (
+    build_key_filter_jqls,
+    build_key_jql,
+    compact_key_clauses,
+)
+
+
+def test_consecutive_runs_become_ranges() -> None:
+    """Test runs of three or more keys become ranges and shorter runs stay listed."""
+    keys = ["ATP-3", "ATP-1", "ATP-2", "ATP-7", "ATP-8", "CTP-10", "ATP-1"]
+
+    clauses = compact_key_clauses(keys)
+
+    assert clauses == [
+        "(project = ATP AND key >= ATP-1 AND key <= ATP-3)",
+        "ATP-7",
+        "ATP-8",
+        "CTP-10",
+    ]
+
+
+def test_single_jql_ors_ranges_with_listed_keys() -> None:
+    """Test the single JQL string lists the keys outside of runs and ORs the ranges."""
+    keys = [f"ATP-{number}" for number in range(1, 1001)] + ["ATP-2000", "CTP-5"]
+
+    assert build_key_jql(keys) == (
+        "key in (ATP-2000,CTP-5) OR (project = ATP AND key >= ATP-1 AND key <= ATP-1000)"
+    )
+
+
+def test_jqls_stay_within_bound_and_cover_exactly_the_keys() -> None:
+    """Test the JQL strings respect the length bound and together select every key."""
+    keys = [f"ATP-{number}" for number in range(1, 2000, 2)] + [
+        f"CTP-{number}" for number in range(100, 400)
+    ]
+
+    jqls = build_key_filter_jqls(keys, max_length=1000)
+
+    assert len(jqls) > 1
+    assert all(len(jql) <= 1000 for jql in jqls)
+    selected = set()
+    for jql in jqls:
+        for listed in re.findall(r"key in \(([^)]*)\)", jql):
+            selected.update(listed.split(","))
+        for project, first, last in re.findall(r"key >= (\w+)-(\d+) AND key <= \w+-(\d+)", jql):
+            selected.update(f"{project}-{number}" for number in range(int(first), int(last) + 1))
+    assert selected == set(keys)
@@ -0,0 +1,128 @@
+"""Unit tests for the JIRA to domain model mappers."""
+
+import json
+from datetime import datetime
+
+import pytest
+from jira.resources import Issue as JiraIssue
+from jira.resources import Project as JiraProject
+
+from src.adapters.secondary.jira.mappers import (
+    map_issue,
+    map_issue_json,
+    map_project,
+    map_project_json,
+    map_record_json,
+)
+from tests.adapters.jira_fakes import OPTIONS, SERVER, TAXONOMY_FIELD, make_raw_issue
+
+TRANSITIONS = [
+    ("In Progress", "2025-01-06T08:00:00.000-0800"),
+    ("In Review", "2025-01-07T08:00:00.000-0800"),
+    ("Done", "2025-01-08T09:06:29.078-0800"),
+]
+
+
+def _raw_issue_variants() -> list[dict]:
+    """Raw issues covering the optional and unusual field shapes."""
+    cascading = make_raw_issue("ATP-4")
+    cascading["fields"][TAXONOMY_FIELD]["child"] = {
+        "self": f"{SERVER}/rest/api/2/customFieldOption/2",
+        "value": "Bug",
+        "id": "2",
+    }
+    null_category = make_raw_issue("ATP-5")
+    null_category["fields"][TAXONOMY_FIELD] = None
+    no_changelog = make_raw_issue("ATP-6")
+    del no_changelog["changelog"]
+    no_project_category = make_raw_issue("ATP-7")
+    del no_project_category["fields"]["project"]["projectCategory"]
+    return [
+        make_raw_issue("ATP-1", transitions=TRANSITIONS),
+        make_raw_issue("ATP-2", category=None, resolved=None),
+        make_raw_issue("ATP-3", status="In Progress", transitions=TRANSITIONS[:1]),
+        cascading,
+        null_category,
+        no_changelog,
+        no_project_category,
+        make_raw_issue(
+            "ATP-8",
+            parent="ATP-100",
+            links=[("outwardIssue", "RATE-1"), ("inwardIssue", "ATP-9")],
+        ),
+    ]
+
+
+@pytest.mark.parametrize("raw_issue", _raw_issue_variants(), ids=lambda raw: raw["key"])
+def test_json_mapper_matches_resource_mapper(raw_issue: dict) -> None:
+    """Test mapping decoded JSON gives the same Issue as mapping the jira resource."""
+    expected = map_issue(JiraIssue(OPTIONS, None, raw=raw_issue), TAXONOMY_FIELD)
+
+    assert map_issue_json(raw_issue, TAXONOMY_FIELD) == expected
+
+
+def test_json_project_mapper_matches_resource_mapper() -> None:
+    """Test mapping a decoded project gives the same Project as the resource mapper."""
+    raw_project = make_raw_issue("ATP-1")["fields"]["project"]
+
+    assert map_project_json(raw_project) == map_project(JiraProject(OPTIONS, None, raw=raw_project))
+
+
+def test_json_mapper_reads_parent_and_links() -> None:
+    """Test the parent key and the keys of links in both directions are mapped."""
+    raw_issue = make_raw_issue(
+        "ATP-8", parent="ATP-100", links=[("outwardIssue", "RATE-1"), ("inwardIssue", "ATP-9")]
+    )
+
+    issue = map_issue_json(raw_issue, TAXONOMY_FIELD)
+
+    assert issue.parent_key == "ATP-100"
+    assert issue.linked_issue_keys == ("RATE-1", "ATP-9")
+
+
+def test_record_mapper_flattens_requested_fields() -> None:
+    """Test records hold the key and the readable value of each requested field."""
+    raw_issue = make_raw_issue("ATP-8", parent="ATP-100")
+    raw_issue["fields"]["labels"] = ["api", "rates"]
+
+    record = map_record_json(raw_issue, ["key", "status", "project", "parent", "labels", "due"])
+
+    assert record == {
+        "key": "ATP-8",
+        "status": "Done",
+        "project": "ATP",
+        "parent": "ATP-100",
+        "labels": ["api", "rates"],
+        "due": None,
+    }
+
+
+def test_json_mapper_shares_projects_and_repeated_values() -> None:
+    """Test issues of a project share one Project and the same status and category strings."""
+    first, second = (
+        map_issue_json(json.loads(json.dumps(make_raw_issue(key))), TAXONOMY_FIELD)
+        for key in ("ATP-1", "ATP-2")
+    )
+
+    assert first.project is second.project
+    assert first.status is second.status
+    assert first.engineering_category is second.engineering_category
+    assert not hasattr(first, "__dict__")
+
+
+@pytest.mark.parametrize("scale", [1, 1000])
+def test_json_mapper_reads_epoch_changelog_times(scale: int) -> None:
+    """Test bulk changelog times, in epoch seconds or milliseconds, match ISO ones."""
+    iso_issue = make_raw_issue("ATP-1", transitions=TRANSITIONS)
+    epoch_issue = make_raw_issue("ATP-1", transitions=TRANSITIONS)
+    for history in epoch_issue["changelog"]["histories"]:
+        seconds = datetime.fromisoformat(history["created"]).timestamp()
+        history["created"] = round(seconds * scale)
+
+    epoch_history = map_issue_json(epoch_issue, TAXONOMY_FIELD).status_history
+    iso_history = map_issue_json(iso_issue, TAXONOMY_FIELD).status_history
+
+    # Epoch seconds drop the milliseconds of the ISO times
+    assert [t.timestamp for t in epoch_history] == [
+        t.timestamp if scale == 1000 else t.timestamp.replace(microsecond=0) for t in iso_history
+    ]
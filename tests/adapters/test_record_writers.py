@@ -0,0 +1,65 @@
+"""Unit tests for the streaming record writers."""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from src.adapters.secondary.storage.record_writers import RecordFormat, write_records
+
+PAGES = [
+    [{"key": "ATP-1", "summary": "First", "labels": ["api"]}],
+    [{"key": "ATP-2", "summary": None, "labels": []}, {"key": "ATP-3", "summary": "Third"}],
+]
+
+
+def test_ndjson_and_csv_write_every_page(tmp_path: Path) -> None:
+    """Test every record of every page is written in order in both text formats."""
+    count = write_records(PAGES, ["key", "summary"], RecordFormat.NDJSON, tmp_path / "a.ndjson")
+    write_records(PAGES, ["key", "labels"], RecordFormat.CSV, tmp_path / "a.csv")
+
+    lines = (tmp_path / "a.ndjson").read_text(encoding="utf-8").splitlines()
+    assert count == 3
+    assert [json.loads(line) for line in lines] == [*PAGES[0], *PAGES[1]]
+    assert (tmp_path / "a.csv").read_text(encoding="utf-8").splitlines() == [
+        "key,labels",
+        'ATP-1,"[""api""]"',
+        "ATP-2,[]",
+        "ATP-3,",
+    ]
+
+
+def test_parquet_needs_a_file() -> None:
+    """Test Parquet output is refused for stdout."""
+    with pytest.raises(ValueError, match="needs a file"):
+        write_records(PAGES, ["key"], RecordFormat.PARQUET)
+
+
+def test_parquet_keeps_field_types_across_pages(tmp_path: Path) -> None:
+    """Test Parquet columns are typed, widened across pages, and text when values mix."""
+    pages = [
+        [{"key": "ATP-1", "updated": "2025-01-17T15:09:56.520-0800", "points": 3}],
+        [{"key": "ATP-2", "updated": None, "points": 2.5, "labels": ["api"], "team": 7}],
+        [{"key": "ATP-3", "points": None, "labels": [], "team": "Core", "rank": {"a": 1}}],
+    ]
+    columns = ["key", "updated", "points", "labels", "team", "rank"]
+
+    count = write_records(pages, columns, RecordFormat.PARQUET, tmp_path / "a.parquet")
+
+    frame = pl.read_parquet(tmp_path / "a.parquet")
+    assert count == 3
+    assert frame.schema == {
+        "key": pl.Utf8,
+        "updated": pl.Datetime("us", "UTC"),
+        "points": pl.Float64,
+        "labels": pl.List(pl.Utf8),
+        "team": pl.Utf8,
+        "rank": pl.Utf8,
+    }
+    assert frame.rows() == [
+        ("ATP-1", datetime(2025, 1, 17, 23, 9, 56, 520000, tzinfo=UTC), 3.0, None, None, None),
+        ("ATP-2", None, 2.5, ["api"], "7", None),
+        ("ATP-3", None, None, [], "Core", '{"a": 1}'),
+    ]
@@ -0,0 +1,95 @@
+"""Unit tests for the rate-limit-aware request scheduler."""
+
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.adapters.secondary.jira.request_scheduler import RequestScheduler, ScheduledHTTPAdapter
+
+
+def _response(status_code: int, headers: dict[str, str] | None = None) -> requests.Response:
+    """Build a bare ``requests.Response`` with the given status and headers."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(b"")
+    return response
+
+
+def test_retries_throttled_requests_and_halves_concurrency() -> None:
+    """Test a 429 is retried after Retry-After and cuts the concurrency limit."""
+    scheduler = RequestScheduler(max_concurrency=8)
+    responses = iter([_response(429, {"Retry-After": "0"}), _response(200)])
+
+    response = scheduler.send(lambda: next(responses))
+
+    assert response.status_code == 200
+    assert scheduler.stats.throttle_events == 1
+    assert scheduler.stats.retries == 1
+    assert scheduler.stats.requests == 2
+    assert scheduler.stats.concurrency_limit == pytest.approx(2 + 1 / 2)
+
+
+def test_returns_last_throttled_response_when_retries_run_out() -> None:
+    """Test the throttled response is handed back once every retry was used."""
+    scheduler = RequestScheduler(max_retries=2)
+
+    response = scheduler.send(lambda: _response(503, {"Retry-After": "0"}))
+
+    assert response.status_code == 503
+    assert scheduler.stats.throttle_events == 3
+    assert scheduler.stats.retries == 2
+
+
+def test_successes_grow_concurrency_up_to_the_maximum() -> None:
+    """Test the concurrency limit increases additively while requests succeed."""
+    scheduler = RequestScheduler(max_concurrency=6, burst=100)
+
+    for _ in range(50):
+        scheduler.send(lambda: _response(200))
+
+    assert scheduler.stats.concurrency_limit == 6
+
+
+def test_near_limit_responses_do_not_grow_concurrency() -> None:
+    """Test responses flagged as near the rate limit hold the concurrency limit."""
+    scheduler = RequestScheduler(max_concurrency=8)
+
+    scheduler.send(lambda: _response(200, {"X-RateLimit-NearLimit": "true"}))
+
+    assert scheduler.stats.concurrency_limit == 4
+
+
+def test_in_flight_requests_stay_within_the_limit() -> None:
+    """Test concurrent callers never exceed the adaptive concurrency limit."""
+    scheduler = RequestScheduler(max_concurrency=4, burst=100, requests_per_second=1000)
+
+    def slow_request() -> requests.Response:
+        time.sleep(0.01)
+        return _response(200, {"X-RateLimit-NearLimit": "true"})
+
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        list(pool.map(lambda _: scheduler.send(slow_request), range(30)))
+
+    assert scheduler.stats.peak_in_flight == 2
+    assert scheduler.stats.requests == 30
+
+
+def test_http_adapter_routes_session_requests_through_scheduler(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test requests sent through a mounted session are scheduled and retried."""
+    responses = iter([_response(429, {"Retry-After": "0"}), _response(200)])
+    monkeypatch.setattr(HTTPAdapter, "send", lambda *_, **__: next(responses))
+    scheduler = RequestScheduler()
+    session = requests.Session()
+    session.mount("https://example.atlassian.net", ScheduledHTTPAdapter(scheduler))
+
+    response = session.get("https://example.atlassian.net/rest/api/2/myself")
+
+    assert response.status_code == 200
+    assert scheduler.stats.throttle_events == 1
@@ -0,0 +1,141 @@
+"""Unit tests for the on-disk JIRA response cache."""
+
+import io
+from pathlib import Path
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.adapters.secondary.jira.request_scheduler import RequestScheduler, ScheduledHTTPAdapter
+from src.adapters.secondary.jira.response_cache import ResponseCache, normalize_url
+
+SERVER = "https://example.atlassian.net"
+
+
+class RecordingTransport:
+    """Replaces ``HTTPAdapter.send``, answering from a list of canned responses."""
+
+    def __init__(self, *responses: tuple[int, dict[str, str], bytes]) -> None:
+        """Initialize the transport with the (status, headers, body) to return in order."""
+        self.responses = list(responses)
+        self.requests: list[requests.PreparedRequest] = []
+
+    def send(self, request: requests.PreparedRequest, **_: object) -> requests.Response:
+        """Record the request and return the next canned response."""
+        self.requests.append(request.copy())
+        status_code, headers, body = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers)
+        response.raw = io.BytesIO(body)
+        return response
+
+
+def _session(cache: ResponseCache) -> requests.Session:
+    session = requests.Session()
+    session.mount(SERVER, ScheduledHTTPAdapter(RequestScheduler(), cache=cache))
+    return session
+
+
+def test_fresh_entries_are_served_without_a_request(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a cached response is reused across cache instances and query orderings."""
+    transport = RecordingTransport((200, {}, b'[{"key": "ATP"}]'))
+    monkeypatch.setattr(HTTPAdapter, "send", transport.send)
+    path = tmp_path / "http_cache.sqlite3"
+
+    first = _session(ResponseCache(path)).get(f"{SERVER}/rest/api/2/project?a=1&b=2")
+    cache = ResponseCache(path)
+    second = _session(cache).get(f"{SERVER}/rest/api/2/project?b=2&a=1")
+
+    assert first.json() == second.json() == [{"key": "ATP"}]
+    assert len(transport.requests) == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 0)
+
+
+def test_expired_entries_are_revalidated(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test an expired entry is revalidated with its ETag and reused on a 304."""
+    transport = RecordingTransport(
+        (200, {"ETag": '"v1"'}, b'{"key": "ATP-1"}'), (304, {"ETag": '"v1"'}, b"")
+    )
+    monkeypatch.setattr(HTTPAdapter, "send", transport.send)
+    cache = ResponseCache(tmp_path / "http_cache.sqlite3", ttls=((r".*/issue/[^/]+", 0),))
+    session = _session(cache)
+
+    session.get(f"{SERVER}/rest/api/2/issue/ATP-1")
+    response = session.get(f"{SERVER}/rest/api/2/issue/ATP-1")
+
+    assert response.json() == {"key": "ATP-1"}
+    assert transport.requests[1].headers["If-None-Match"] == '"v1"'
+    assert (cache.stats.misses, cache.stats.revalidated) == (1, 1)
+
+
+def test_issues_are_revalidated_on_every_use(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test edited issues are never served stale and deleted ones drop their entry."""
+    transport = RecordingTransport(
+        (200, {"ETag": '"v1"'}, b'{"summary": "Old"}'),
+        (200, {"ETag": '"v2"'}, b'{"summary": "New"}'),
+        (204, {}, b""),
+        (404, {}, b"{}"),
+    )
+    monkeypatch.setattr(HTTPAdapter, "send", transport.send)
+    cache = ResponseCache(tmp_path / "http_cache.sqlite3")
+    session = _session(cache)
+
+    session.get(f"{SERVER}/rest/api/2/issue/ATP-1")
+    edited = session.get(f"{SERVER}/rest/api/2/issue/ATP-1")
+    session.delete(f"{SERVER}/rest/api/2/issue/ATP-1")
+    deleted = session.get(f"{SERVER}/rest/api/2/issue/ATP-1")
+
+    assert edited.json() == {"summary": "New"}
+    assert transport.requests[1].headers["If-None-Match"] == '"v1"'
+    assert "If-None-Match" not in transport.requests[3].headers
+    assert deleted.status_code == 404
+    assert cache.stats.hits == 0
+
+
+def test_uncacheable_and_disabled_requests_pass_through(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test searches, disabled caches and modified resources are never served from cache."""
+    transport = RecordingTransport(*[(200, {}, b"{}")] * 5)
+    monkeypatch.setattr(HTTPAdapter, "send", transport.send)
+    cache = ResponseCache(tmp_path / "http_cache.sqlite3")
+    session = _session(cache)
+
+    session.get(f"{SERVER}/rest/api/2/search?jql=project%3DATP")
+    session.get(f"{SERVER}/rest/api/2/issue/ATP-1")
+    session.delete(f"{SERVER}/rest/api/2/issue/ATP-1")
+    session.get(f"{SERVER}/rest/api/2/issue/ATP-1")
+    cache.enabled = False
+    session.get(f"{SERVER}/rest/api/2/issue/ATP-1")
+
+    assert len(transport.requests) == 5
+    assert cache.stats.hits == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    """Test the cache stays within its size bound by dropping the oldest entries."""
+    cache = ResponseCache(tmp_path / "http_cache.sqlite3", max_bytes=25)
+    keys = [cache.cache_key("GET", f"{SERVER}/rest/api/2/issue/ATP-{n}", None) for n in (1, 2, 3)]
+
+    cache.put(keys[0], "GET", f"{SERVER}/rest/api/2/issue/ATP-1", 200, {}, b"x" * 10)
+    cache.put(keys[1], "GET", f"{SERVER}/rest/api/2/issue/ATP-2", 200, {}, b"x" * 10)
+    cache.get(keys[0])
+    cache.put(keys[2], "GET", f"{SERVER}/rest/api/2/issue/ATP-3", 200, {}, b"x" * 10)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.size() == (2, 20)
+    assert cache.stats.evictions == 1
+
+
+def test_normalize_url_sorts_query_parameters() -> None:
+    """Test the query string order does not affect the normalized URL."""
+    assert normalize_url("HTTPS://Example.atlassian.net/p?b=2&a=1") == (
+        "https://example.atlassian.net/p?a=1&b=2"
+    )
@@ -0,0 +1,56 @@
+"""Unit tests for splitting searches into shards."""
+
+from datetime import date
+
+import pytest
+
+from src.adapters.secondary.jira.sharding import SearchShard, iter_sharded_results, plan_shards
+
+
+def test_plan_shards_splits_until_counts_fit() -> None:
+    """Test busy projects are split by date window while small ones stay whole."""
+    issues_per_day = {"ATP": 10, "RATE": 1, "EMPTY": 0}
+
+    shards = plan_shards(
+        list(issues_per_day),
+        date(2025, 1, 1),
+        date(2025, 1, 9),
+        lambda shard: issues_per_day[shard.project_keys[0]] * (shard.end - shard.start).days,
+        max_shard_size=20,
+    )
+
+    assert sorted(shards, key=lambda shard: (shard.project_keys, shard.start)) == [
+        SearchShard(("ATP",), date(2025, 1, 1), date(2025, 1, 3)),
+        SearchShard(("ATP",), date(2025, 1, 3), date(2025, 1, 5)),
+        SearchShard(("ATP",), date(2025, 1, 5), date(2025, 1, 7)),
+        SearchShard(("ATP",), date(2025, 1, 7), date(2025, 1, 9)),
+        SearchShard(("RATE",), date(2025, 1, 1), date(2025, 1, 9)),
+    ]
+
+
+def test_single_day_shard_is_not_split() -> None:
+    """Test a shard of one project and day is kept however large it is."""
+    assert SearchShard(("ATP",), date(2025, 1, 1), date(2025, 1, 2)).split() is None
+
+
+def test_failed_shard_is_retried_alone() -> None:
+    """Test only the failing shard is fetched again, and gives up after its attempts."""
+    shards = [SearchShard((key,), date(2025, 1, 1), date(2025, 1, 9)) for key in "ABC"]
+    calls: list[str] = []
+
+    def fetch(shard: SearchShard) -> str:
+        calls.append(shard.project_keys[0])
+        if shard.project_keys[0] == "B" and calls.count("B") == 1:
+            raise ConnectionError
+        return shard.project_keys[0]
+
+    results = iter_sharded_results(shards, fetch, retry_on=(ConnectionError,), max_workers=2)
+
+    assert sorted(results) == ["A", "B", "C"]
+    assert sorted(calls) == ["A", "B", "B", "C"]
+
+    def always_fail(_shard: SearchShard) -> str:
+        raise ConnectionError
+
+    with pytest.raises(ConnectionError):
+        list(iter_sharded_results(shards[:1], always_fail, retry_on=(ConnectionError,)))
@@ -0,0 +1,55 @@
+"""Unit tests for the single-page analytics dashboard."""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import plotly.graph_objects as go
+import polars as pl
+
+from src.domain import dashboard
+from src.domain.analytics_session import AnalyticsSession
+
+
+def _session(weeks: int, projects: int = 2) -> AnalyticsSession:
+    """Build a session with one issue per project and category every week."""
+    rows = [
+        {
+            "project": f"Project {project}",
+            "issue_key": f"P{project}-{week}-{category}",
+            "category": category,
+            "resolved": datetime(2024, 1, 1, tzinfo=UTC) + timedelta(weeks=week),
+            "week": (datetime(2024, 1, 7, tzinfo=UTC) + timedelta(weeks=week)).strftime("%Y-%m-%d"),
+            "lead_time_hours": 24.0,
+            "cycle_time_hours": 12.0,
+            "reopen_count": 0,
+        }
+        for week in range(weeks)
+        for project in range(projects)
+        for category in ("Maintenance", "Product Dev")
+    ]
+    return AnalyticsSession(pl.LazyFrame(rows))
+
+
+def test_dashboard_loads_plotly_once_for_every_chart(tmp_path: Path) -> None:
+    """Test all charts share one page and one plotly.js script."""
+    output_path = tmp_path / "dashboard.html"
+
+    dashboard.write_dashboard(_session(weeks=3), output_path, include_plotlyjs="cdn")
+
+    page = output_path.read_text(encoding="utf-8")
+    assert page.count("cdn.plot.ly") == 1
+    assert page.count("Plotly.newPlot") == len(dashboard.dashboard_figures(_session(weeks=3)))
+
+
+def test_long_windows_page_facets_and_switch_to_webgl() -> None:
+    """Test bar charts page through periods and long line charts use WebGL traces."""
+    trends, composition, _, cycle_time, *_ = dashboard.dashboard_figures(
+        _session(weeks=260, projects=4)
+    )
+
+    assert [trace.name for trace in composition.data] == ["Maintenance", "Product Dev"]
+    assert len(composition.layout.sliders[0].steps) == 260
+    assert composition.layout.height == dashboard.CHART_HEIGHT
+    assert list(composition.data[0].x) == [f"Project {project}" for project in range(4)]
+    assert all(isinstance(trace, go.Scatter) for trace in trends.data)
+    assert all(isinstance(trace, go.Scattergl) for trace in cycle_time.data)
@@ -0,0 +1,62 @@
+"""Unit tests for the vectorized flow metrics."""
+
+from datetime import datetime
+
+import polars as pl
+import pytest
+
+from src.adapters.secondary.jira.mappers import calculate_lead_time
+from src.domain.flow_metrics import FlowMetric, flow_metrics, time_in_status, transitions_frame
+from src.domain.models import IssueAnalytics, StatusTransition
+
+REOPENED = [
+    ("In Progress", "2025-01-06T09:00:00.000-08:00"),
+    ("Done", "2025-01-07T09:00:00.000-08:00"),
+    ("In Progress", "2025-01-08T09:00:00.000-08:00"),
+    ("Done", "2025-01-09T09:00:00.000-08:00"),
+]
+NOT_STARTED = [("To Do", "2025-01-06T09:00:00.000+01:00")]
+
+
+def _analytics(key: str, transitions: list[tuple[str, str]]) -> IssueAnalytics:
+    history = [
+        StatusTransition(status, datetime.fromisoformat(timestamp))
+        for status, timestamp in transitions
+    ]
+    return IssueAnalytics(
+        project="Access Point",
+        issue_key=key,
+        category="Product Development (Product Dev)",
+        resolved=None,
+        type="Story",
+        url=f"https://example.atlassian.net/browse/{key}",
+        lead_time_hours=calculate_lead_time(history),
+        status_history=history,
+    )
+
+
+@pytest.fixture
+def transitions() -> pl.DataFrame:
+    """Status transitions of a reopened issue and of one never started."""
+    return transitions_frame([_analytics("ATP-1", REOPENED), _analytics("ATP-2", NOT_STARTED)])
+
+
+def test_flow_metrics_cover_every_issue_in_one_frame(transitions: pl.DataFrame) -> None:
+    """Test lead time matches the mapper and cycle time stops at the first Done."""
+    metrics = {row["issue_key"]: row for row in flow_metrics(transitions).to_dicts()}
+
+    assert metrics["ATP-1"] == {
+        "issue_key": "ATP-1",
+        FlowMetric.LEAD_TIME: _analytics("ATP-1", REOPENED).lead_time_hours,
+        FlowMetric.CYCLE_TIME: 24.0,
+        FlowMetric.REOPENS: 1,
+    }
+    assert metrics["ATP-2"][FlowMetric.LEAD_TIME] is None
+    assert metrics["ATP-2"][FlowMetric.REOPENS] == 0
+
+
+def test_time_in_status_leaves_out_the_current_status(transitions: pl.DataFrame) -> None:
+    """Test time is summed per status and the open-ended last status is skipped."""
+    rows = time_in_status(transitions).sort("status").rows()
+
+    assert rows == [("ATP-1", "Done", 24.0), ("ATP-1", "In Progress", 48.0)]
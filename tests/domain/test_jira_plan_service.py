@@ -0,0 +1,134 @@
+"""Unit tests for the Jira Plan hierarchy traversal."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytz
+
+from src.adapters.secondary.jira.models import JiraFilter, JiraPlanRequest, JiraPlanResponse
+from src.adapters.secondary.storage.issue_graph import IssueGraph
+from src.domain.jira_plan_service import JiraPlanService
+from tests.adapters.jira_fakes import make_issue
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from src.domain.models import Issue
+
+# INIT-1 <- EPIC-1 <- ATP-1, which links to ATP-2, which links to ATP-3
+ISSUES = {
+    issue.key: issue
+    for issue in [
+        make_issue("INIT-1", issue_type="Initiative"),
+        make_issue("EPIC-1", issue_type="Epic", parent="INIT-1"),
+        make_issue("ATP-1", parent="EPIC-1", links=[("outwardIssue", "ATP-2")]),
+        make_issue("ATP-2", links=[("inwardIssue", "ATP-1"), ("outwardIssue", "ATP-3")]),
+        make_issue("ATP-3", links=[("inwardIssue", "ATP-2")]),
+    ]
+}
+
+
+class GraphAdapter:
+    """Serves issues from ``ISSUES`` and records each batched lookup."""
+
+    def __init__(self) -> None:
+        """Initialize the adapter without any recorded lookups."""
+        self.batches: list[list[str]] = []
+
+    def get_issue(self, issue_id: str) -> Issue:
+        """Return a single issue."""
+        return ISSUES[issue_id]
+
+    def get_issues(self, issue_keys: list[str]) -> list[Issue]:
+        """Record the batch and return its issues."""
+        self.batches.append(list(issue_keys))
+        return [ISSUES[key] for key in issue_keys]
+
+
+class PlanAdapter(GraphAdapter):
+    """Also creates filters and plans, recording what they were created with."""
+
+    def __init__(self) -> None:
+        """Initialize the adapter without any created filters or plans."""
+        super().__init__()
+        self.filters: list[JiraFilter] = []
+        self.requests: list[JiraPlanRequest] = []
+
+    def get_account_id(self, _email: str | None) -> str:
+        """Return a fixed account ID."""
+        return "account-1"
+
+    def time_jql(self, jql: str) -> tuple[int, float]:
+        """Return the number of keys in the JQL and a fixed evaluation time."""
+        return jql.count("-"), 0.5
+
+    def create_filter(self, name: str, jql: str, owner_account_id: str) -> JiraFilter:
+        """Record and return a filter numbered after the ones created before."""
+        self.filters.append(JiraFilter(str(len(self.filters)), name, jql, owner_account_id))
+        return self.filters[-1]
+
+    def create_jira_plan(self, request: JiraPlanRequest) -> JiraPlanResponse:
+        """Record the request and return a plan."""
+        self.requests.append(request)
+        return JiraPlanResponse(id="1", name=request.name, url="https://jira/plans/1")
+
+
+def test_default_depth_follows_one_level_each_way() -> None:
+    """Test the default traversal returns the direct parent and directly linked issues."""
+    adapter = PlanAdapter()
+
+    plan, _ = JiraPlanService(adapter).create_plan(["ATP-1"], "Q3")
+
+    assert [issue.key for issue in plan.parent_issues] == ["EPIC-1"]
+    assert [issue.key for issue in plan.child_issues] == ["ATP-2"]
+    assert plan.jql == "key in (ATP-1,ATP-2,EPIC-1)"
+
+
+def test_deeper_traversal_fetches_each_level_once() -> None:
+    """Test every level is one batched lookup and visited issues are not fetched again."""
+    adapter = PlanAdapter()
+
+    plan, _ = JiraPlanService(adapter, max_depth=5).create_plan(["ATP-1", "ATP-2"], "Q3")
+
+    assert [issue.key for issue in plan.parent_issues] == ["EPIC-1", "INIT-1"]
+    assert [issue.key for issue in plan.child_issues] == ["ATP-3"]
+    assert adapter.batches == [["EPIC-1"], ["INIT-1"], ["ATP-3"]]
+
+
+def test_fresh_graph_nodes_replace_level_lookups(tmp_path: Path) -> None:
+    """Test indexed relations are walked without the API and stale ones are refetched."""
+    graph = IssueGraph(tmp_path / "issue_graph.sqlite3")
+    graph.update([ISSUES["EPIC-1"], ISSUES["ATP-2"]])
+    graph.update([ISSUES["INIT-1"]], datetime.now(pytz.utc) - timedelta(days=2))
+    adapter = PlanAdapter()
+
+    plan, _ = JiraPlanService(adapter, max_depth=5, issue_graph=graph).create_plan(["ATP-1"], "Q3")
+
+    assert [issue.key for issue in plan.parent_issues] == ["EPIC-1", "INIT-1"]
+    assert [issue.key for issue in plan.child_issues] == ["ATP-2", "ATP-3"]
+    # INIT-1 is stale and ATP-3 unknown, so only they are looked up level by level;
+    # the details of the issues resolved from the graph come in one final batch
+    assert adapter.batches == [["INIT-1"], ["ATP-3"], ["EPIC-1", "ATP-2"]]
+    assert graph.get_node("ATP-3") is not None
+
+
+def test_long_key_sets_are_split_over_several_filters() -> None:
+    """Test every filter is attached as an issue source and carries its timing."""
+    adapter = PlanAdapter()
+
+    _, response = JiraPlanService(adapter, max_filter_length=20).create_plan(["ATP-1"], "Q3")
+
+    assert [jira_filter.name for jira_filter in response.filters] == [
+        "Filter for plan: Q3 (1/2)",
+        "Filter for plan: Q3 (2/2)",
+    ]
+    assert [jira_filter.jql for jira_filter in response.filters] == [
+        "key in (ATP-1,ATP-2)",
+        "key in (EPIC-1)",
+    ]
+    assert all(jira_filter.evaluation_seconds == 0.5 for jira_filter in response.filters)
+    assert adapter.requests[0].issue_sources == [
+        {"type": "Filter", "value": jira_filter.id} for jira_filter in response.filters
+    ]
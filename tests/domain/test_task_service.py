@@ -0,0 +1,169 @@
+"""Unit tests for TaskService analytics syncing and bulk issue creation."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import pytz
+
+from src.adapters.secondary.storage.issue_graph import IssueGraph
+from src.adapters.secondary.storage.issue_import import ImportJournal, read_issue_rows
+from src.adapters.secondary.storage.issue_store import IssueStore
+from src.domain.models import IssueCreationResult
+from src.domain.task_service import TaskService
+from tests.adapters.jira_fakes import make_issue
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from src.domain.models import CreateIssueRequest, Issue
+
+
+class RecordingAdapter:
+    """Adapter stand-in returning canned issues and recording project searches."""
+
+    def __init__(self) -> None:
+        """Initialize with no canned issues."""
+        self.issues: list[Issue] = []
+        self.searches: list[tuple[str, datetime | None, datetime | None]] = []
+
+    def iter_project_issue_pages(
+        self,
+        project_key: str,
+        resolved_since: datetime | None = None,
+        updated_since: datetime | None = None,
+        **_: object,
+    ) -> list[list[Issue]]:
+        """Record the search and return the canned issues of the project as one page."""
+        self.searches.append((project_key, resolved_since, updated_since))
+        return [[issue for issue in self.issues if issue.project.key == project_key]]
+
+
+def test_engineering_taxonomy_delta_syncs_the_store(tmp_path: Path) -> None:
+    """Test the first run loads the window and later runs only fetch updated issues."""
+    adapter = RecordingAdapter()
+    service = TaskService(adapter, IssueStore(tmp_path / "issues.sqlite3"))
+    start, end = datetime(2025, 1, 6, tzinfo=pytz.utc), datetime(2025, 1, 13, tzinfo=pytz.utc)
+
+    adapter.issues = [make_issue("ATP-1"), make_issue("ATP-2")]
+    first = service.get_engineering_taxonomy(start, end, ["ATP"])
+
+    adapter.issues = [make_issue("ATP-2", category="Team Management (TM)")]
+    second = service.get_engineering_taxonomy(start, end, ["ATP"])
+
+    assert [a.issue_key for a in first] == ["ATP-1", "ATP-2"]
+    assert [a.category for a in second] == [
+        "Technical Investment (Tech Inv)",
+        "Team Management (TM)",
+    ]
+    (_, resolved_since, updated_since), (_, delta_resolved, delta_updated) = adapter.searches
+    assert (resolved_since, updated_since) == (start, None)
+    assert delta_resolved is None
+    assert delta_updated.date().isoformat() == "2025-01-07"
+
+
+def test_delta_sync_without_updates_keeps_the_store(tmp_path: Path) -> None:
+    """Test a delta sync returning no issues keeps the stored ones and high-water mark."""
+    adapter = RecordingAdapter()
+    store = IssueStore(tmp_path / "issues.sqlite3")
+    service = TaskService(adapter, store)
+    start, end = datetime(2025, 1, 6, tzinfo=pytz.utc), datetime(2025, 1, 13, tzinfo=pytz.utc)
+
+    adapter.issues = [make_issue("ATP-1")]
+    service.get_engineering_taxonomy(start, end, ["ATP"])
+    high_water_mark = store.get_sync_state("ATP").high_water_mark
+    adapter.issues = []
+    analytics = service.get_engineering_taxonomy(start, end, ["ATP"])
+
+    assert [a.issue_key for a in analytics] == ["ATP-1"]
+    assert store.get_sync_state("ATP").high_water_mark == high_water_mark
+
+
+def test_full_refresh_reloads_the_window(tmp_path: Path) -> None:
+    """Test a full refresh drops issues no longer returned by JIRA."""
+    adapter = RecordingAdapter()
+    service = TaskService(adapter, IssueStore(tmp_path / "issues.sqlite3"))
+    start, end = datetime(2025, 1, 6, tzinfo=pytz.utc), datetime(2025, 1, 13, tzinfo=pytz.utc)
+
+    adapter.issues = [make_issue("ATP-1"), make_issue("ATP-2")]
+    service.get_engineering_taxonomy(start, end, ["ATP"])
+    adapter.issues = [make_issue("ATP-2")]
+    analytics = service.get_engineering_taxonomy(start, end, ["ATP"], full_refresh=True)
+
+    assert [a.issue_key for a in analytics] == ["ATP-2"]
+    assert all(updated_since is None for _, _, updated_since in adapter.searches)
+
+
+def test_delta_sync_updates_the_issue_graph(tmp_path: Path) -> None:
+    """Test relations of synced issues are indexed, and re-synced issues replace them."""
+    adapter = RecordingAdapter()
+    graph = IssueGraph(tmp_path / "issue_graph.sqlite3")
+    service = TaskService(adapter, IssueStore(tmp_path / "issues.sqlite3"), graph)
+    start, end = datetime(2025, 1, 6, tzinfo=pytz.utc), datetime(2025, 1, 13, tzinfo=pytz.utc)
+
+    adapter.issues = [make_issue("ATP-1", parent="EPIC-1"), make_issue("ATP-2", parent="EPIC-1")]
+    service.get_engineering_taxonomy(start, end, ["ATP"])
+    adapter.issues = [make_issue("ATP-2", parent="EPIC-2")]
+    service.get_engineering_taxonomy(start, end, ["ATP"])
+
+    assert graph.children("EPIC-1") == {"ATP-1"}
+    assert graph.ancestors(["ATP-2"]) == ["EPIC-2"]
+
+
+class CreatingAdapter:
+    """Adapter stand-in creating issues in bulk, failing the summaries starting "fail"."""
+
+    def __init__(self) -> None:
+        """Initialize without any created issues."""
+        self.created: list[str] = []
+
+    def create_issues(self, requests: list[CreateIssueRequest]) -> list[IssueCreationResult]:
+        """Create the issues that do not fail, numbering their keys in creation order."""
+        results = []
+        for row, request in enumerate(requests, start=1):
+            if request.summary.startswith("fail"):
+                results.append(IssueCreationResult(row=row, error="summary: Rejected"))
+            else:
+                self.created.append(request.summary)
+                results.append(IssueCreationResult(row=row, key=f"BB-{len(self.created)}"))
+        return results
+
+
+def test_bulk_import_reports_every_row_and_resumes(tmp_path: Path) -> None:
+    """Test invalid and failed rows are reported and a rerun only creates what is missing."""
+    path = tmp_path / "issues.csv"
+    path.write_text(
+        "summary,description,issue_type\n"
+        "First,,Task\n"
+        "Second,Body,Unknown\n"
+        "fail third,Body,Bug\n"
+        "Fourth,Body,\n",
+        encoding="utf-8",
+    )
+    adapter = CreatingAdapter()
+    service = TaskService(adapter)
+
+    first = list(
+        service.create_issues(read_issue_rows(path), ImportJournal(tmp_path / "j"), chunk_size=2)
+    )
+
+    assert [result.row for result in first] == [1, 2, 3, 4]
+    assert [result.key for result in first] == [None, None, None, "BB-1"]
+    assert first[0].error == "description: Field required"
+    assert first[1].error.startswith("issue_type: Input should be")
+    assert first[2].error == "summary: Rejected"
+
+    path.write_text(
+        "summary,description\nFirst,Body\nSecond,Body\nThird,Body\nFourth,Body\n",
+        encoding="utf-8",
+    )
+    second = list(service.create_issues(read_issue_rows(path), ImportJournal(tmp_path / "j")))
+
+    assert adapter.created == ["Fourth", "First", "Second", "Third"]
+    assert [(result.key, result.resumed) for result in second] == [
+        ("BB-2", False),
+        ("BB-3", False),
+        ("BB-4", False),
+        ("BB-1", True),
+    ]
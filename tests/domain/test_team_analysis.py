@@ -0,0 +1,93 @@
+"""Unit tests for the team analysis DataFrame pipeline."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytz
+
+from src.domain.models import IssueAnalytics, StatusTransition
+from src.domain.team_analysis import TeamAnalysis
+
+
+def _analytics(key: str, resolved: str) -> IssueAnalytics:
+    return IssueAnalytics(
+        project="Access Point",
+        issue_key=key,
+        category="Product Development (Product Dev)",
+        resolved=datetime.fromisoformat(resolved).replace(tzinfo=pytz.utc),
+        type="Story",
+        url=f"https://example.atlassian.net/browse/{key}",
+        lead_time_hours=24.0,
+    )
+
+
+def test_build_dataframe_folds_pages_into_one_frame() -> None:
+    """Test pages are concatenated, de-duplicated and given a week column."""
+    pages = [
+        [_analytics("ATP-1", "2025-01-07T10:00:00"), _analytics("ATP-2", "2025-01-08T10:00:00")],
+        [],
+        [_analytics("ATP-2", "2025-01-08T10:00:00"), _analytics("ATP-3", "2025-01-15T10:00:00")],
+    ]
+
+    frame = TeamAnalysis().build_dataframe(iter(pages))
+
+    assert sorted(frame["issue_key"].to_list()) == ["ATP-1", "ATP-2", "ATP-3"]
+    weeks = dict(zip(frame["issue_key"], frame["week"], strict=True))
+    assert weeks == {"ATP-1": "2025-01-12", "ATP-2": "2025-01-12", "ATP-3": "2025-01-19"}
+
+
+def test_build_dataframe_without_results_is_empty() -> None:
+    """Test an empty search yields an empty frame."""
+    assert TeamAnalysis().build_dataframe(iter([])).is_empty()
+
+
+def test_build_session_joins_flow_metrics_and_keeps_transitions() -> None:
+    """Test each issue gets its cycle time and reopens, with duplicate pages ignored."""
+    issue = _analytics("ATP-1", "2025-01-07T10:00:00")
+    issue.status_history = [
+        StatusTransition("In Progress", datetime(2025, 1, 6, 10, tzinfo=pytz.utc)),
+        StatusTransition("Done", datetime(2025, 1, 7, 10, tzinfo=pytz.utc)),
+    ]
+
+    session = TeamAnalysis().build_session(
+        iter([[issue, _analytics("ATP-2", "2025-01-08T10:00:00")], [issue]])
+    )
+
+    metrics = {row["issue_key"]: row for row in session.issues.to_dicts()}
+    assert metrics["ATP-1"]["cycle_time_hours"] == 24.0
+    assert metrics["ATP-2"]["cycle_time_hours"] is None
+    assert metrics["ATP-2"]["reopen_count"] == 0
+    assert session.transitions.collect().height == 2
+
+
+def test_session_collects_every_chart_input_once() -> None:
+    """Test chart inputs are collected together and shares are taken per partition."""
+    page = [
+        _analytics("ATP-1", "2025-01-07T10:00:00"),
+        _analytics("ATP-2", "2025-01-08T10:00:00"),
+        _analytics("ATP-3", "2025-01-15T10:00:00"),
+    ]
+    page[1].category = "Technical Investment (Tech Inv)"
+    session = TeamAnalysis().build_session(iter([page]))
+
+    assert session.frames is session.frames
+    composition = session.frames["composition"]
+    assert composition.select("period", "percentage", "total_lead_time").rows() == [
+        ("2025-01-12", 50.0, 24.0),
+        ("2025-01-12", 50.0, 24.0),
+        ("2025-01-19", 100.0, 24.0),
+    ]
+    assert session.frames["project_periods"]["count_total"].to_list() == [2, 1]
+    assert session.frames["trends"]["percentage"].to_list() == [50.0, 50.0, 100.0]
+
+
+def test_csv_keeps_its_columns_and_iso_resolution_dates(tmp_path: Path) -> None:
+    """Test the CSV leaves the joined flow metrics out and writes dates as ISO 8601."""
+    output_path = tmp_path / "engineering_taxonomy.csv"
+
+    TeamAnalysis().write_to_csv([_analytics("ATP-1", "2025-01-07T10:00:00.5")], str(output_path))
+
+    header, row = output_path.read_text(encoding="utf-8").splitlines()
+    assert header == "project,issue_key,category,resolved,type,url,lead_time_hours,week"
+    assert ",2025-01-07T10:00:00.500000+00:00,Story," in row
+    assert row.endswith(",24.0,2025-01-12")
@@ -108,4 +108,4 @@ def test_create_and_delete_issue() -> None:
         catch_exceptions=False,
     )
     assert delete_result.exit_code == 0
-    assert f"Deleting issue: {issue_key}" in delete_result.stdout
+    assert f"Deleted issue: {issue_key}" in delete_result.stdout
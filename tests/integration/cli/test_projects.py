@@ -38,13 +38,11 @@ def test_projects_analyze(tmp_path: Path) -> None:
         # Check output
         assert "Analysis complete!" in result.stdout
 
+        # Every chart is in the dashboard, whose plot ids change on every run
+        assert (analysis_dir / "dashboard.html").exists(), "Missing output file: dashboard.html"
+
         # Compare output files with fixtures
-        for filename in [
-            "engineering_taxonomy.csv",
-            "lead_time.html",
-            "team_composition.html",
-            "weekly_trends.html",
-        ]:
+        for filename in ["engineering_taxonomy.csv"]:
             actual = analysis_dir / filename
             expected = Path("tests/fixtures/analysis_output") / filename
             assert actual.exists(), f"Missing output file: {filename}"